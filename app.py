@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 import plotly.express as px
 import plotly.graph_objects as go
 import hashlib
@@ -61,6 +62,16 @@ class AstronomicalEventDetector:
                 filtered_events.append(event)
         
         return filtered_events
+    
+    def get_events_for_locations(self, location_ids=None, window=timedelta(days=1)):
+        """Get sample events for many locations as one columnar DataFrame"""
+        if location_ids is None:
+            location_ids = list(GLOBAL_LOCATIONS)
+        # Sample events are the same everywhere, so build them once and cross-join
+        sample_events = self.get_all_events()
+        events = pd.DataFrame({'event': [e['event'] for e in sample_events], 'details': sample_events})
+        locations = pd.DataFrame({'location_id': location_ids})
+        return locations.merge(events, how='cross')
 
 class NotificationEngine:
     def send_alerts(self, event):
@@ -136,16 +147,16 @@ class MonitoringScheduler:
 # =============================================================================
 
 GLOBAL_LOCATIONS = {
-    'bangalore': {'name': 'Bangalore, India', 'lat': 12.9716, 'lon': 77.5946, 'country': 'India', 'continent': 'Asia'},
-    'delhi': {'name': 'Delhi, India', 'lat': 28.7041, 'lon': 77.1025, 'country': 'India', 'continent': 'Asia'},
-    'mumbai': {'name': 'Mumbai, India', 'lat': 19.0760, 'lon': 72.8777, 'country': 'India', 'continent': 'Asia'},
-    'new_york': {'name': 'New York, USA', 'lat': 40.7128, 'lon': -74.0060, 'country': 'USA', 'continent': 'North America'},
-    'london': {'name': 'London, UK', 'lat': 51.5074, 'lon': -0.1278, 'country': 'UK', 'continent': 'Europe'},
-    'tokyo': {'name': 'Tokyo, Japan', 'lat': 35.6762, 'lon': 139.6503, 'country': 'Japan', 'continent': 'Asia'},
-    'sydney': {'name': 'Sydney, Australia', 'lat': -33.8688, 'lon': 151.2093, 'country': 'Australia', 'continent': 'Oceania'},
-    'dubai': {'name': 'Dubai, UAE', 'lat': 25.2048, 'lon': 55.2708, 'country': 'UAE', 'continent': 'Asia'},
-    'paris': {'name': 'Paris, France', 'lat': 48.8566, 'lon': 2.3522, 'country': 'France', 'continent': 'Europe'},
-    'berlin': {'name': 'Berlin, Germany', 'lat': 52.5200, 'lon': 13.4050, 'country': 'Germany', 'continent': 'Europe'}
+    'bangalore': {'name': 'Bangalore, India', 'lat': 12.9716, 'lon': 77.5946, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
+    'delhi': {'name': 'Delhi, India', 'lat': 28.7041, 'lon': 77.1025, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
+    'mumbai': {'name': 'Mumbai, India', 'lat': 19.0760, 'lon': 72.8777, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
+    'new_york': {'name': 'New York, USA', 'lat': 40.7128, 'lon': -74.0060, 'country': 'USA', 'continent': 'North America', 'timezone': 'America/New_York'},
+    'london': {'name': 'London, UK', 'lat': 51.5074, 'lon': -0.1278, 'country': 'UK', 'continent': 'Europe', 'timezone': 'Europe/London'},
+    'tokyo': {'name': 'Tokyo, Japan', 'lat': 35.6762, 'lon': 139.6503, 'country': 'Japan', 'continent': 'Asia', 'timezone': 'Asia/Tokyo'},
+    'sydney': {'name': 'Sydney, Australia', 'lat': -33.8688, 'lon': 151.2093, 'country': 'Australia', 'continent': 'Oceania', 'timezone': 'Australia/Sydney'},
+    'dubai': {'name': 'Dubai, UAE', 'lat': 25.2048, 'lon': 55.2708, 'country': 'UAE', 'continent': 'Asia', 'timezone': 'Asia/Dubai'},
+    'paris': {'name': 'Paris, France', 'lat': 48.8566, 'lon': 2.3522, 'country': 'France', 'continent': 'Europe', 'timezone': 'Europe/Paris'},
+    'berlin': {'name': 'Berlin, Germany', 'lat': 52.5200, 'lon': 13.4050, 'country': 'Germany', 'continent': 'Europe', 'timezone': 'Europe/Berlin'}
 }
 
 def get_locations_by_continent():
@@ -341,7 +352,7 @@ class StellarWatchApp:
             st.markdown('</div>', unsafe_allow_html=True)
         with col3:
             st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Local Time", datetime.now().strftime("%H:%M"))
+            st.metric("Local Time", datetime.now(ZoneInfo(current_loc['timezone'])).strftime("%H:%M %Z"))
             st.markdown('</div>', unsafe_allow_html=True)
         with col4:
             if st.button("Sign Out", use_container_width=True):
@@ -395,16 +406,12 @@ class StellarWatchApp:
         st.markdown('<div class="glass-card">', unsafe_allow_html=True)
         st.subheader("Global Event Distribution")
         
-        map_data = []
-        for loc_id, loc_data in GLOBAL_LOCATIONS.items():
-            events = self.detector.get_all_events(loc_id)
-            map_data.append({
-                'lat': loc_data['lat'], 'lon': loc_data['lon'],
-                'city': loc_data['name'], 'country': loc_data['country'],
-                'events': len(events), 'size': min(len(events) * 5, 30)
-            })
-        
-        df = pd.DataFrame(map_data)
+        # One batched scan for every location, counted per city
+        events = self.detector.get_events_for_locations(list(GLOBAL_LOCATIONS))
+        counts = events.groupby('location_id').size()
+        df = pd.DataFrame.from_dict(GLOBAL_LOCATIONS, orient='index').rename(columns={'name': 'city'})
+        df['events'] = counts.reindex(df.index, fill_value=0)
+        df['size'] = (df['events'] * 5).clip(upper=30)
         if not df.empty:
             fig = px.scatter_geo(df, lat='lat', lon='lon', hover_name='city',
                                hover_data={'country': True, 'events': True}, size='size',
@@ -498,7 +505,8 @@ class StellarWatchApp:
             
             event_time = event.get('time') or event.get('peak', 'Unknown')
             if isinstance(event_time, datetime):
-                st.write(f"**When:** {event_time.strftime('%A, %B %d at %H:%M')}")
+                local_time = event.get('local_time') or event_time.astimezone(ZoneInfo(location['timezone']))
+                st.write(f"**When:** {local_time.strftime('%A, %B %d at %H:%M %Z')}")
                 time_until = event_time - datetime.now()
                 if time_until.days > 0:
                     st.write(f"**In:** {time_until.days} days, {time_until.seconds//3600} hours")
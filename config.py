@@ -8,17 +8,112 @@ ISS_POSITION_URL = "https://api.wheretheiss.at/v1/satellites/25544"
 METEOR_SHOWER_DATA = "https://data.imo.net/files/imo_calendar.json"
 AURORA_FORECAST_URL = "https://services.swpc.noaa.gov/products/ovation_aurora_latest.json"
 ROCKET_LAUNCH_API = "https://lldev.thespacedevs.com/2.2.0/launch/upcoming/"
+ISS_TLE_URL = "https://celestrak.org/NORAD/elements/gp.php?CATNR=25544&FORMAT=tle"
+ISS_PASS_API = "http://api.open-notify.org/iss-pass.json"
+ISS_NORAD_ID = 25544
+
+# TLE Catalog Settings
+TLE_CATALOG_PATH = os.getenv('TLE_CATALOG_PATH', 'data/tle_catalog.npy')  # parsed element sets
+TLE_CATALOG_FILE = os.getenv('TLE_CATALOG_FILE', 'data/catalog.tle')  # optional local TLE/OMM seed
+
+# Satellite Visibility Settings
+SATELLITE_TLE_URLS = os.getenv('SATELLITE_TLE_URLS', ','.join([
+    ISS_TLE_URL,
+    "https://celestrak.org/NORAD/elements/gp.php?CATNR=48274&FORMAT=tle",  # Tiangong
+    "https://celestrak.org/NORAD/elements/gp.php?GROUP=visual&FORMAT=tle",  # ~150 brightest objects
+])).split(',')
+SATELLITE_NAMES = {
+    25544: 'International Space Station',
+    48274: 'Tiangong Space Station',
+    20580: 'Hubble Space Telescope',
+}
+SATELLITE_MAGNITUDES = {25544: -1.3, 48274: -0.8, 20580: 2.2}  # standard magnitude at 1000 km
+SATELLITE_DEFAULT_MAGNITUDE = float(os.getenv('SATELLITE_DEFAULT_MAGNITUDE', 4.0))
+MAX_SATELLITE_MAGNITUDE = float(os.getenv('MAX_SATELLITE_MAGNITUDE', 4.5))  # naked-eye limit
+MAX_SATELLITE_EVENTS = int(os.getenv('MAX_SATELLITE_EVENTS', 10))  # brightest passes per location
+
+# Location Cell Settings
+GEOCELL_PRECISION = int(os.getenv('GEOCELL_PRECISION', 4))  # geohash characters, 4 is ~39 x 20 km
+GEOCELL_FINE_CORRECTION = os.getenv('GEOCELL_FINE_CORRECTION', 'True').lower() == 'true'  # refine per user
+
+# Database Settings
+DATABASE_PATH = os.getenv('DATABASE_PATH', 'data/astronomy.db')
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 4))  # pooled SQLite connections
+DB_BUSY_TIMEOUT = int(os.getenv('DB_BUSY_TIMEOUT', 5000))  # milliseconds
+DB_CACHE_SIZE_KB = int(os.getenv('DB_CACHE_SIZE_KB', 8192))  # page cache per connection
+DB_MMAP_SIZE = int(os.getenv('DB_MMAP_SIZE', 64 * 1024 * 1024))  # bytes
+DB_STATEMENT_CACHE = int(os.getenv('DB_STATEMENT_CACHE', 128))  # prepared statements per connection
+DB_BUFFER_SIZE = int(os.getenv('DB_BUFFER_SIZE', 500))  # most buffered records per write transaction
+DB_WRITE_QUEUE_SIZE = int(os.getenv('DB_WRITE_QUEUE_SIZE', 10000))  # buffered records before producers block
+EVENT_RETENTION_DAYS = int(os.getenv('EVENT_RETENTION_DAYS', 30))  # raw event rows, then daily rollups
+ALERT_RETENTION_DAYS = int(os.getenv('ALERT_RETENTION_DAYS', 90))
+ROLLUP_RETENTION_DAYS = int(os.getenv('ROLLUP_RETENTION_DAYS', 0))  # 0 keeps rollups forever
+DB_SIZE_BUDGET_MB = int(os.getenv('DB_SIZE_BUDGET_MB', 256))  # older raw events are rolled up early above this
+DB_VACUUM_PAGES = int(os.getenv('DB_VACUUM_PAGES', 2000))  # free pages returned to the OS per maintenance run
+DB_MAINTENANCE_HOURS = int(os.getenv('DB_MAINTENANCE_HOURS', 6))
+EVENT_CODEC = os.getenv('EVENT_CODEC', 'msgpack')  # 'json' writes payloads any host reads without msgpack
+EVENT_COMPRESS_BYTES = int(os.getenv('EVENT_COMPRESS_BYTES', 256))  # deflate larger JSON payloads
+
+# Timezone Settings
+TIMEZONE_INDEX_PATH = os.getenv('TIMEZONE_INDEX_PATH', 'data/timezone_index.json')  # zone per location cell
+
+# HTTP Client Settings
+HTTP_TIMEOUT = int(os.getenv('HTTP_TIMEOUT', 10))  # seconds
+HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', 'data/http_cache')
+HTTP_CACHE_MAX_MB = int(os.getenv('HTTP_CACHE_MAX_MB', 50))
+HTTP_MODE = os.getenv('HTTP_MODE', 'live')  # 'live', 'record' or 'replay'
+HTTP_ARCHIVE = os.getenv('HTTP_ARCHIVE', 'data/http_archive.jsonl.gz')
+HTTP_REPLAY_SPEED = float(os.getenv('HTTP_REPLAY_SPEED', 1.0))  # 0 serves without delay
+
+# Ephemeris Settings
+EPHEMERIS_DIR = os.getenv('EPHEMERIS_DIR', '.')
+EPHEMERIS_FILE = os.getenv('EPHEMERIS_FILE', 'de421.bsp')
+
+# Pass Prediction Settings
+MIN_ISS_ALTITUDE = int(os.getenv('MIN_ISS_ALTITUDE', 20))  # degrees at culmination
+PASS_HORIZON = int(os.getenv('PASS_HORIZON', 10))  # degrees for rise/set
+PASS_GRID_STEP = int(os.getenv('PASS_GRID_STEP', 20))  # seconds
+PASS_TABLE_DAYS = int(os.getenv('PASS_TABLE_DAYS', 3))  # days of precomputed passes kept ahead
+TLE_REFRESH_HOURS = int(os.getenv('TLE_REFRESH_HOURS', 12))
 
 # Notification Settings
 CHECK_INTERVAL = int(os.getenv('CHECK_INTERVAL', 300))  # 5 minutes
 ALERT_WINDOW = int(os.getenv('ALERT_WINDOW', 60))  # minutes
 
+# Event Thresholds
+METEOR_SHOWER_ZHR = int(os.getenv('METEOR_SHOWER_ZHR', 10))
+METEOR_ALMANAC_YEARS = int(os.getenv('METEOR_ALMANAC_YEARS', 10))  # years ahead
+
+# Observability Settings
+OBSERVABILITY_DAYS = int(os.getenv('OBSERVABILITY_DAYS', 3))
+OBSERVABILITY_MODE = os.getenv('OBSERVABILITY_MODE', 'annotate')  # 'annotate' or 'drop'
+OBSERVABILITY_CACHE_SIZE = int(os.getenv('OBSERVABILITY_CACHE_SIZE', 2048))  # (cell, date) windows kept
+
+# Source fan-out settings
+CONCURRENT_SOURCES = os.getenv('CONCURRENT_SOURCES', 'True').lower() == 'true'
+SOURCE_DEADLINE = float(os.getenv('SOURCE_DEADLINE', 12))  # seconds for a whole scan
+
+# Location-independent source cache TTLs (seconds)
+SOURCE_TTLS = {
+    'aurora': CHECK_INTERVAL,  # SWPC updates OVATION every ~5 minutes
+    'launches': int(os.getenv('LAUNCH_CACHE_TTL', 900)),
+    'meteors': int(os.getenv('METEOR_CACHE_TTL', 3600)),
+    'tle': TLE_REFRESH_HOURS * 3600,
+}
+REFRESH_AHEAD = float(os.getenv('REFRESH_AHEAD', 0.8))  # refresh at this fraction of the TTL
+REFRESH_RETRY = int(os.getenv('REFRESH_RETRY', 30))  # seconds between failed background refreshes
+
+# Circuit breaker settings for upstream sources
+BREAKER_FAILURE_THRESHOLD = int(os.getenv('BREAKER_FAILURE_THRESHOLD', 3))  # consecutive failures
+BREAKER_BACKOFF = int(os.getenv('BREAKER_BACKOFF', 30))  # seconds before the first probe
+BREAKER_MAX_BACKOFF = int(os.getenv('BREAKER_MAX_BACKOFF', 1800))
+
 # Import global locations
+DEFAULT_LOCATIONS = {
+    'bangalore': {'lat': 12.9716, 'lon': 77.5946, 'name': 'Bangalore, India'},
+    'delhi': {'lat': 28.7041, 'lon': 77.1025, 'name': 'Delhi, India'}
+}
 try:
-    from src.global_locations import GLOBAL_LOCATIONS, DEFAULT_LOCATIONS
+    from src.global_locations import GLOBAL_LOCATIONS
 except ImportError:
-    DEFAULT_LOCATIONS = {
-        'bangalore': {'lat': 12.9716, 'lon': 77.5946, 'name': 'Bangalore, India'},
-        'delhi': {'lat': 28.7041, 'lon': 77.1025, 'name': 'Delhi, India'}
-    }
     GLOBAL_LOCATIONS = DEFAULT_LOCATIONS
\ No newline at end of file
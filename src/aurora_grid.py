@@ -0,0 +1,86 @@
+import threading
+from datetime import datetime
+
+import numpy as np
+
+# OVATION grid is 1 degree in longitude (0..359) and latitude (-90..90)
+GRID_SHAPE = (360, 181)
+
+# Aurora overhead this many degrees poleward is still visible near the horizon
+VIEW_REACH_DEGREES = 8
+
+_parse_lock = threading.Lock()
+_parsed_grid = None
+
+
+def parse_timestamp(value):
+    """Parse an OVATION ISO timestamp into epoch seconds"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+
+class AuroraGrid:
+    """Dense longitude x latitude OVATION aurora probability grid"""
+
+    def __init__(self, probabilities, forecast_time=None, observation_time=None):
+        self.probabilities = probabilities
+        self.forecast_time = forecast_time
+        self.observation_time = observation_time
+
+    @classmethod
+    def from_ovation(cls, data):
+        """Build a grid from the SWPC ``ovation_aurora_latest.json`` payload
+
+        Parsing is skipped when the forecast epoch matches the last parsed grid.
+        """
+        global _parsed_grid
+        forecast_time = parse_timestamp(data.get('Forecast Time'))
+        with _parse_lock:
+            if _parsed_grid is not None and forecast_time is not None \
+                    and _parsed_grid.forecast_time == forecast_time:
+                return _parsed_grid
+
+            coordinates = np.asarray(data['coordinates'], dtype=float)
+            lon_idx = np.rint(coordinates[:, 0]).astype(int) % GRID_SHAPE[0]
+            lat_idx = np.clip(np.rint(coordinates[:, 1]).astype(int) + 90, 0, GRID_SHAPE[1] - 1)
+            probabilities = np.zeros(GRID_SHAPE, dtype=np.float32)
+            probabilities[lon_idx, lat_idx] = coordinates[:, 2]
+
+            _parsed_grid = cls(probabilities, forecast_time,
+                               parse_timestamp(data.get('Observation Time')))
+            return _parsed_grid
+
+    def probability_at(self, lats, lons):
+        """Bilinearly interpolated overhead aurora probability (%) at coordinates"""
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+
+        x = np.mod(lons, 360.0)
+        y = np.clip(lats + 90.0, 0.0, GRID_SHAPE[1] - 1.0)
+        x0 = np.floor(x).astype(int) % GRID_SHAPE[0]
+        x1 = (x0 + 1) % GRID_SHAPE[0]
+        y0 = np.minimum(np.floor(y).astype(int), GRID_SHAPE[1] - 2)
+        y1 = y0 + 1
+        fx = x - np.floor(x)
+        fy = y - y0
+
+        grid = self.probabilities
+        return ((1 - fx) * (1 - fy) * grid[x0, y0] + fx * (1 - fy) * grid[x1, y0]
+                + (1 - fx) * fy * grid[x0, y1] + fx * fy * grid[x1, y1])
+
+    def visible_probability_at(self, lats, lons, reach=VIEW_REACH_DEGREES):
+        """Highest probability overhead or up to ``reach`` degrees poleward"""
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        poleward = np.where(lats >= 0, 1.0, -1.0)
+        offsets = np.arange(reach + 1, dtype=float).reshape(-1, *([1] * lats.ndim))
+        samples = self.probability_at(lats + poleward * offsets, np.broadcast_to(lons, lats.shape))
+        return samples.max(axis=0)
+
+    def probabilities_for(self, locations):
+        """Visible aurora probability for every location in a mapping of id -> lat/lon"""
+        ids = list(locations)
+        lats = np.array([locations[i]['lat'] for i in ids], dtype=float)
+        lons = np.array([locations[i]['lon'] for i in ids], dtype=float)
+        return dict(zip(ids, self.visible_probability_at(lats, lons).tolist()))
@@ -0,0 +1,420 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import atexit
+import contextlib
+import io
+import json
+import random
+import shutil
+import sqlite3
+import struct
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+# The global DatabaseManager is created on import, so point it at a scratch directory first
+WORKDIR = tempfile.mkdtemp(prefix='stellarwatch-bench-')
+atexit.register(shutil.rmtree, WORKDIR, True)
+os.environ['DATABASE_PATH'] = os.path.join(WORKDIR, 'astronomy.db')
+
+from jplephem.daf import DAF, FTPSTR
+
+from src.aurora_grid import AuroraGrid
+from src.database import DatabaseManager, event_columns
+from src.ephemeris import ephemeris_provider
+from src.event_codec import encode
+from src.event_detector import AstronomicalEventDetector
+from src.global_locations import GLOBAL_LOCATIONS
+from src.meteor_almanac import J2000_JD, solar_longitude
+from src.notification_engine import NotificationEngine
+from src.tle_catalog import TLECatalog
+
+BASELINE_PATH = 'data/benchmark_baseline.json'  # machine specific, made locally with --save-baseline
+
+# ISS elements so pass prediction does real work without the network; the epoch is set by stub_tle()
+STUB_TLE_LINES = (
+    "1 25544U 98067A   {epoch}  .00016717  00000-0  10270-3 0  900",
+    "2 25544  51.6400 208.9163 0006317  69.9862  25.2906 15.50000000 1234",
+)
+
+# Stub SPK kernel: circular orbits fitted with Chebyshev polynomials, enough for the real
+# skyfield code paths without downloading de421. (target, center, days per record, coefficients)
+STUB_KERNEL = 'stub_ephemeris.bsp'
+STUB_KERNEL_YEARS = 15  # from the start of last year, past the meteor almanac's years ahead
+STUB_KERNEL_SEGMENTS = [(10, 0, 32, 2), (3, 0, 16, 10), (301, 3, 4, 12), (399, 3, 4, 12), (5, 0, 32, 8),
+                        (6, 0, 32, 8)]
+AU_KM = 149597870.7
+EARTH_MOON_MASS_RATIO = 81.3
+OBLIQUITY = np.radians(23.439)
+
+DB_SIZES = [1000, 10000, 100000, 1000000]
+LOG_BATCH = 100  # events per log_events call, about one global scan
+
+# Output that means a benchmark measured an error, fallback or breaker path instead of the real one
+ERROR_MARKERS = ('error', 'unavailable', 'fail', 'last good', 'missed the', 'queue full')
+
+
+def stub_aurora_grid():
+    """Synthetic OVATION payload with an auroral oval around 68 degrees"""
+    coordinates = [[lon, lat, max(0, 100 - abs(abs(lat) - 68) * 10)]
+                   for lon in range(360) for lat in range(-90, 91)]
+    return AuroraGrid.from_ovation({'Forecast Time': '2026-01-01T00:00:00Z',
+                                    'Observation Time': '2026-01-01T00:00:00Z',
+                                    'coordinates': coordinates})
+
+
+def stub_launches():
+    now = datetime.now()
+    return [{
+        'event': f"Falcon 9 Block 5 | Starlink Group {i}",
+        'time': now + timedelta(hours=6 * (i + 1)),
+        'mission': {'name': f"Starlink Group {i}", 'type': 'Communications'},
+        'location': 'Cape Canaveral SFS, FL, USA',
+        'visibility': 'Check local visibility',
+        'source': 'The Space Devs API'
+    } for i in range(5)]
+
+
+def tle_checksum(line):
+    """Modulo 10 checksum of a TLE line: digits count their value, minus signs count 1"""
+    return sum(int(char) if char.isdigit() else char == '-' for char in line) % 10
+
+
+def stub_tle(now=None):
+    """Stub ISS element set with its epoch at the start of the current UTC day
+
+    Propagating from the wall clock then always spans less than a day, so
+    the amount of work does not grow with the date the benchmark runs on.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
+    epoch = f"{now:%y}{now.timetuple().tm_yday:03d}.00000000"
+    lines = [line.format(epoch=epoch) for line in STUB_TLE_LINES]
+    return "ISS (ZARYA)\n" + ''.join(f"{line}{tle_checksum(line)}\n" for line in lines)
+
+
+def stub_body_positions(target, jd):
+    """Low-precision ICRF position (km) of a stub kernel body relative to its center, shape (3, ...)"""
+    days = jd - J2000_JD
+    if target == 10:  # the Sun stays at the solar system barycenter
+        return np.zeros((3,) + days.shape)
+    if target == 3:  # Earth-Moon barycenter, opposite the Sun's ecliptic longitude
+        radius, longitude = AU_KM, solar_longitude(jd) + 180.0
+    elif target in (301, 399):  # Moon and Earth about their barycenter, from the Moon's mean longitude
+        radius, longitude = 384400.0 / (EARTH_MOON_MASS_RATIO + 1), 218.316 + 13.176396 * days
+        radius *= EARTH_MOON_MASS_RATIO if target == 301 else -1
+    elif target == 5:
+        radius, longitude = 5.2026 * AU_KM, 34.40 + 0.0830853 * days
+    else:
+        radius, longitude = 9.5549 * AU_KM, 49.94 + 0.0334443 * days
+    longitude = np.radians(longitude)
+    x, y = radius * np.cos(longitude), radius * np.sin(longitude)
+    return np.stack([x, y * np.cos(OBLIQUITY), y * np.sin(OBLIQUITY)])
+
+
+def write_stub_kernel(path, start=None, years=STUB_KERNEL_YEARS):
+    """Write a small type 2 SPK kernel of the bodies skyfield needs for sun and moon positions"""
+    if start is None:
+        start = datetime(datetime.now().year - 1, 1, 1)
+    start_seconds = (start.timestamp() / 86400.0 + 2440587.5 - J2000_JD) * 86400.0
+    with open(path, 'w+b') as f:
+        # File record, then an empty summary record and an empty name record
+        f.write(struct.pack('<8sII60sIII8s603s28s297s', b'DAF/SPK ', 2, 6, b'StellarWatch benchmark stub'.ljust(60),
+                            2, 2, 3 * 128 + 1, b'LTL-IEEE', b'\0' * 603, FTPSTR, b'\0' * 297))
+        f.write(b'\0' * 1024 + b' ' * 1024)
+        daf = DAF(f)
+        for target, center, step_days, degree in STUB_KERNEL_SEGMENTS:
+            step = step_days * 86400.0
+            count = int(np.ceil(years * 365.25 / step_days))
+            mids = start_seconds + step * (np.arange(count) + 0.5)
+            # Chebyshev interpolation at the nodes of every record at once
+            angles = np.pi * (np.arange(degree) + 0.5) / degree
+            seconds = mids[:, None] + step / 2 * np.cos(angles)
+            positions = stub_body_positions(target, J2000_JD + seconds / 86400.0)
+            coefficients = positions @ np.cos(np.outer(np.arange(degree), angles)).T * (2.0 / degree)
+            coefficients[..., 0] /= 2
+            records = np.concatenate([mids[:, None], np.full((count, 1), step / 2)] + list(coefficients), axis=1)
+            array = np.concatenate([records.ravel(), [start_seconds, step, records.shape[1], count]])
+            daf.add_array(f"stub {target} from {center}".encode(),
+                          (start_seconds, start_seconds + count * step, target, center, 1, 2), array)
+
+
+def stub_ephemeris(workdir):
+    """Point the shared ephemeris at a generated stub kernel instead of downloading de421"""
+    write_stub_kernel(os.path.join(workdir, STUB_KERNEL))
+    ephemeris_provider.directory, ephemeris_provider.filename = workdir, STUB_KERNEL
+
+
+def stub_detector(workdir):
+    """Event detector whose upstream fetches and stores are replaced by local ones"""
+    detector = AstronomicalEventDetector()
+    grid = stub_aurora_grid()
+    launches = stub_launches()
+    tle = stub_tle()
+    detector.visibility_engine.fetch_elements = lambda: [tle]
+    detector.visibility_engine.catalog = TLECatalog(os.path.join(workdir, 'tle_catalog.npy'), None)
+    detector.pass_table.db = DatabaseManager(os.path.join(workdir, 'passes.db'))
+    detector.fetch_aurora_data = lambda: grid
+    detector.fetch_rocket_launches = lambda: launches
+    return detector
+
+
+def sample_events(count):
+    """A mix of every event kind, all inside the alert window"""
+    now = datetime.now()
+    templates = [
+        lambda i: {'event': 'International Space Station Transit', 'time': now + timedelta(seconds=i),
+                   'duration': '6 minutes', 'max_altitude': 54.2, 'direction': 'NW',
+                   'brightness': 'Magnitude -3.1 (Very Bright)', 'source': 'Local SGP4 Prediction'},
+        lambda i: {'event': f"Perseid Meteor Shower {i}", 'peak': now + timedelta(seconds=i), 'zhr': 100,
+                   'moon_phase': 'Waxing Crescent', 'visibility': 'Excellent'},
+        lambda i: {'event': f"Aurora Borealis Forecast {i}", 'probability': '45%', 'kp_index': 3.0,
+                   'best_time': '22:00-02:00 Local', 'visibility': 'Good'},
+        lambda i: {'event': f"Falcon 9 Launch {i}", 'time': now + timedelta(seconds=i),
+                   'mission': 'Starlink', 'location': 'Cape Canaveral'},
+    ]
+    return [templates[i % len(templates)](i) for i in range(count)]
+
+
+class Benchmark:
+    """A named workload: ``run`` is timed once per iteration, ``setup`` is not"""
+
+    def __init__(self, name, run, iterations, ops=1, setup=None):
+        self.name = name
+        self.run = run
+        self.iterations = iterations
+        self.ops = ops
+        self.setup = setup
+
+    def measure(self):
+        """Throughput, latency percentiles and peak traced memory"""
+        latencies = []
+        for _ in range(self.iterations):
+            if self.setup:
+                self.setup()
+            started = time.perf_counter()
+            self.run()
+            latencies.append(time.perf_counter() - started)
+
+        # Tracing slows everything down, so memory gets its own run
+        if self.setup:
+            self.setup()
+        tracemalloc.start()
+        self.run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        latencies = np.array(latencies) * 1000.0
+        return {
+            'throughput': round(float(self.ops * len(latencies) / (latencies.sum() / 1000.0)), 2),
+            'p50_ms': round(float(np.percentile(latencies, 50)), 3),
+            'p99_ms': round(float(np.percentile(latencies, 99)), 3),
+            'peak_mb': round(peak / 1024 / 1024, 3),
+        }
+
+
+def seed_events(db_path, rows):
+    """Fill the events table with ``rows`` entries in one transaction"""
+    now = datetime.now()
+    locations = list(GLOBAL_LOCATIONS)
+    events = sample_events(4)
+    conn = sqlite3.connect(db_path)
+    conn.executemany('''
+        INSERT INTO events (event_type, event_data, location, event_time,
+                            kind, epoch, altitude, zhr, kp, probability)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', ((events[i % 4]['event'], encode(events[i % 4]), locations[i % len(locations)], now - timedelta(seconds=i),
+           *event_columns(events[i % 4]['event'], events[i % 4], now - timedelta(seconds=i)))
+          for i in range(rows)))
+    conn.commit()
+    conn.close()
+
+
+def detector_benchmarks(iterations, workdir):
+    detector = stub_detector(workdir)
+    # Warm the shared caches so every iteration measures the steady state
+    detector.get_all_events('bangalore')
+    locations = list(GLOBAL_LOCATIONS)
+
+    return [
+        Benchmark('get_all_events', lambda: detector.get_all_events('bangalore'), iterations),
+        # Coordinates inside Bangalore's cell share its precomputed passes
+        Benchmark('get_all_events_coordinates', lambda: detector.get_all_events('12.99,77.61'), iterations),
+        Benchmark('get_all_events_all_locations',
+                  lambda: [detector.get_all_events(loc) for loc in locations],
+                  max(1, iterations // 10), ops=len(locations)),
+        Benchmark('get_events_for_locations',
+                  lambda: detector.get_events_for_locations(locations),
+                  max(1, iterations // 10), ops=len(locations)),
+    ]
+
+
+def alert_benchmarks(iterations, workdir, event_count=1000):
+    engine = NotificationEngine()
+    engine.db = DatabaseManager(os.path.join(workdir, 'alerts.db'))
+    events = sample_events(event_count)
+    engine.detector = type('StubDetector', (), {'get_all_events': lambda self, location: events})()
+
+    return [
+        Benchmark('check_and_alert', lambda: engine.check_and_alert('bangalore'),
+                  max(1, iterations // 10), ops=event_count, setup=engine.sent_alerts.clear),
+        Benchmark('format_alert_message',
+                  lambda: [engine.format_alert_message(event) for event in events],
+                  iterations, ops=event_count),
+    ]
+
+
+def database_benchmarks(iterations, sizes, workdir):
+    benchmarks = []
+    events = sample_events(4)
+    locations = list(GLOBAL_LOCATIONS)
+    for rows in sizes:
+        db = DatabaseManager(os.path.join(workdir, f"events_{rows}.db"))
+        seed_events(db.db_path, rows)
+
+        def log_one(db=db):
+            event = random.choice(events)
+            db.log_event(event['event'], event, random.choice(locations))
+
+        def log_queued(db=db):
+            event = random.choice(events)
+            db.log_event(event['event'], event, random.choice(locations), buffered=True)
+
+        def log_batch(db=db):
+            db.log_events((event['event'], event, random.choice(locations))
+                          for event in random.choices(events, k=LOG_BATCH))
+
+        benchmarks.append(Benchmark(f"log_event[{rows}]", log_one, iterations))
+        # Producer side only: the writer thread commits the rows in the background
+        benchmarks.append(Benchmark(f"log_event_queued[{rows}]", log_queued, iterations))
+        benchmarks.append(Benchmark(f"log_events[{rows}]", log_batch, iterations, ops=LOG_BATCH))
+        benchmarks.append(Benchmark(f"get_recent_events[{rows}]",
+                                    lambda db=db: db.get_recent_events(50), iterations))
+        benchmarks.append(Benchmark(f"query_events[{rows}]",
+                                    lambda db=db: db.query_events(location='london', event_type=events[1]['event']),
+                                    iterations))
+        # Typed columns only: filtered in SQL, no payload decoding
+        benchmarks.append(Benchmark(f"query_events_typed[{rows}]",
+                                    lambda db=db: db.query_events(kind='meteor', at_least={'zhr': 50},
+                                                                  limit=1000, payload=False),
+                                    iterations))
+    return benchmarks
+
+
+def error_lines(output):
+    """Distinct lines of captured output that report an error or a fallback"""
+    lines = {line.strip() for line in output.splitlines()}
+    return sorted(line for line in lines if any(marker in line.lower() for marker in ERROR_MARKERS))
+
+
+def run_benchmarks(iterations=50, sizes=DB_SIZES, only=None):
+    """Run every benchmark and return ({name: metrics}, {name: error lines})
+
+    Alert and log output is captured rather than printed; any line of it
+    that reports an error or fallback is returned, so a benchmark that
+    quietly measured a failure path cannot pass for a speedup. Every
+    upstream source, the ephemeris included, is stubbed, so this runs the
+    same offline.
+    """
+    workdir = tempfile.mkdtemp(dir=WORKDIR)
+    results, errors = {}, {}
+    try:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            stub_ephemeris(workdir)
+            benchmarks = (detector_benchmarks(iterations, workdir) + alert_benchmarks(iterations, workdir)
+                          + database_benchmarks(iterations, sizes, workdir))
+        if error_lines(output.getvalue()):
+            errors['setup'] = error_lines(output.getvalue())
+        for benchmark in benchmarks:
+            if only and not any(name in benchmark.name for name in only):
+                continue
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                results[benchmark.name] = benchmark.measure()
+            print(f"{benchmark.name:40s} {results[benchmark.name]}")
+            if error_lines(output.getvalue()):
+                errors[benchmark.name] = error_lines(output.getvalue())
+                for line in errors[benchmark.name]:
+                    print(f"   ⚠️ {line}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results, errors
+
+
+def compare(results, baseline, tolerance):
+    """Regressions against a baseline: slower latency, lower throughput or more memory"""
+    regressions = []
+    for name, metrics in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for key in ('p50_ms', 'p99_ms', 'peak_mb'):
+            if metrics[key] > expected[key] * (1 + tolerance):
+                regressions.append(f"{name}: {key} {metrics[key]} > {expected[key]}")
+        if metrics['throughput'] < expected['throughput'] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {metrics['throughput']} < {expected['throughput']}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='StellarWatch hot path benchmarks')
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DB_SIZES),
+                        help='comma separated events table sizes')
+    parser.add_argument('--only', nargs='*', help='run benchmarks whose name contains any of these')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative slowdown before a metric counts as a regression')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='write the results as the new baseline instead of comparing; '
+                             'with --only, update just those entries')
+    parser.add_argument('--allow-fallbacks', action='store_true',
+                        help='only warn when benchmarks log errors or fallbacks')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    results, errors = run_benchmarks(args.iterations, sizes, args.only)
+
+    if errors:
+        print(f"{'⚠️' if args.allow_fallbacks else '❌'} Benchmarks hit error or fallback paths, "
+              "so their numbers are not comparable:")
+        for name, lines in errors.items():
+            print(f"   {name}: {lines[0]}" + (f" (+{len(lines) - 1} more)" if len(lines) > 1 else ''))
+        if not args.allow_fallbacks:
+            return 1
+
+    if args.save_baseline:
+        if args.only and os.path.exists(args.baseline):
+            with open(args.baseline, 'r') as f:
+                results = dict(json.load(f), **results)
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"💾 Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"⚠️ No baseline at {args.baseline}, run with --save-baseline first on this machine")
+        return 0
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("❌ Performance regressions:")
+        for regression in regressions:
+            print(f"   {regression}")
+        return 1
+    print("✅ No performance regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import time
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    BREAKER_FAILURE_THRESHOLD = 3
+    BREAKER_BACKOFF = 30
+    BREAKER_MAX_BACKOFF = 1800
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitOpenError(Exception):
+    """Raised when a source is short-circuited and has no last good result"""
+
+
+class CircuitBreaker:
+    """Per-source breaker that stops calling an upstream after repeated failures
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    calls are answered with the last good result without touching the
+    upstream. Once the backoff has passed, a single half-open probe is let
+    through: success closes the breaker, failure reopens it with the backoff
+    doubled up to ``max_backoff``.
+    """
+
+    def __init__(self, name, failure_threshold=BREAKER_FAILURE_THRESHOLD, backoff=BREAKER_BACKOFF,
+                 max_backoff=BREAKER_MAX_BACKOFF):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_backoff = backoff
+        self.max_backoff = max_backoff
+        self.state = CLOSED
+        self.failures = 0
+        self.backoff = backoff
+        self.opened_at = None
+        self.last_success = None
+        self.last_error = None
+        self._last_good = None
+        self._has_last_good = False
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Whether a call may reach the upstream now"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.time() - self.opened_at >= self.backoff:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._probing:
+                # Only one probe at a time; everyone else keeps short-circuiting
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self, value):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.backoff = self.base_backoff
+            self.opened_at = None
+            self.last_success = time.time()
+            self.last_error = None
+            self._last_good = value
+            self._has_last_good = True
+            self._probing = False
+
+    def record_failure(self, error):
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error)
+            if self.state == HALF_OPEN:
+                self.backoff = min(self.backoff * 2, self.max_backoff)
+                self.state = OPEN
+                self.opened_at = time.time()
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = time.time()
+            self._probing = False
+
+    def last_good(self):
+        """The last successful result, raising CircuitOpenError if there is none"""
+        if not self._has_last_good:
+            raise CircuitOpenError(f"{self.name} circuit is {self.state} and has no cached result")
+        return self._last_good
+
+    def call(self, loader, serve_last_good=True):
+        """Call ``loader`` through the breaker
+
+        Failures and short-circuited calls return the last good result when
+        there is one and ``serve_last_good`` is set; otherwise the error
+        propagates so the caller can fall back.
+        """
+        if not self.allow():
+            if not serve_last_good:
+                raise CircuitOpenError(f"{self.name} circuit is {self.state}")
+            return self.last_good()
+        try:
+            value = loader()
+        except Exception as e:
+            self.record_failure(e)
+            if serve_last_good and self._has_last_good:
+                print(f"Source {self.name} failed, serving last good result: {e}")
+                return self._last_good
+            raise
+        self.record_success(value)
+        return value
+
+    def status(self):
+        """State snapshot for callers and dashboards"""
+        now = time.time()
+        retry_in = None
+        if self.state == OPEN:
+            retry_in = max(0.0, self.opened_at + self.backoff - now)
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'since_success': None if self.last_success is None else now - self.last_success,
+            'retry_in': retry_in,
+            'last_error': self.last_error,
+        }
+
+
+class CircuitBreakerRegistry:
+    """Named breakers shared by every detector in the process"""
+
+    def __init__(self):
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name)
+            return self._breakers[name]
+
+    def status(self):
+        """Status of every breaker by source name"""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.status() for name, breaker in breakers.items()}
+
+
+# Global circuit breaker registry
+circuit_breakers = CircuitBreakerRegistry()
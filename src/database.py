@@ -1,122 +1,876 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import atexit
 import sqlite3
 import json
-from datetime import datetime
-import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+try:
+    from src.event_codec import decode as decode_payload, encode as encode_payload
+except ImportError:
+    from event_codec import decode as decode_payload, encode as encode_payload
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    DATABASE_PATH = 'data/astronomy.db'
+    DB_POOL_SIZE = 4
+    DB_BUSY_TIMEOUT = 5000
+    DB_CACHE_SIZE_KB = 8192
+    DB_MMAP_SIZE = 64 * 1024 * 1024
+    DB_STATEMENT_CACHE = 128
+    DB_BUFFER_SIZE = 500
+    DB_WRITE_QUEUE_SIZE = 10000
+    EVENT_RETENTION_DAYS = 30
+    ALERT_RETENTION_DAYS = 90
+    ROLLUP_RETENTION_DAYS = 0
+    DB_SIZE_BUDGET_MB = 256
+    DB_VACUUM_PAGES = 2000
+
+# Rounding of event times in the natural event key (seconds)
+SATELLITE_KEY_ROUNDING = 600  # a new element set moves a pass by seconds, not minutes
+EVENT_KEY_ROUNDING = 3600
+SATELLITE_KEY_KIND = '|satellite|'
+
+WRITE_RETRIES = 3  # attempts at a queued batch while the database is locked or busy
+
+# Typed event columns, filled from the hot fields of the event dict
+TYPED_COLUMNS = {
+    'kind': 'TEXT',
+    'epoch': 'REAL',
+    'altitude': 'REAL',
+    'zhr': 'REAL',
+    'kp': 'REAL',
+    'probability': 'REAL',
+}
+
+
+def event_kind(event_type, event_data):
+    """Kind of a logged event: satellite, meteor, aurora, launch or event"""
+    if 'launch_id' in event_data or 'mission' in event_data:
+        return 'launch'
+    if 'norad_id' in event_data:
+        return 'satellite'
+    if 'Meteor' in event_type:
+        return 'meteor'
+    if 'Aurora' in event_type:
+        return 'aurora'
+    return 'event'
+
+
+def _number(value):
+    """Float of a numeric field, including strings like "25%", or None for "Unknown" and the like"""
+    if value is None or isinstance(value, float):
+        return value
+    if isinstance(value, str):
+        value = value.strip().rstrip('%')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def event_columns(event_type, event_data, event_time):
+    """Values of the typed columns, in TYPED_COLUMNS order"""
+    epoch = event_time.timestamp() if isinstance(event_time, datetime) else None
+    if not isinstance(event_data, dict):
+        return (None, epoch, None, None, None, None)
+    get = event_data.get
+    return (event_kind(event_type, event_data), epoch, _number(get('max_altitude')), _number(get('zhr')),
+            _number(get('kp_index')), _number(get('probability')))
+
+
+def event_key(event_type, event_data, location, event_time):
+    """Natural identity of an event: source, kind, object, rounded time and location
+
+    Launches are keyed by launch id alone, so a slipping NET updates the same
+    row. Meteor peaks and aurora forecasts are keyed by UTC date, so each
+    rescan refreshes that day's row. Satellite passes are keyed by location
+    and their rise time floored to SATELLITE_KEY_ROUNDING, last, so
+    nearby_event_keys can find a pass that moved into the next bucket.
+    """
+    if not isinstance(event_data, dict):
+        return None
+    epoch = event_time.timestamp() if isinstance(event_time, datetime) else datetime.now().timestamp()
+    kind = event_kind(event_type, event_data)
+    if kind == 'launch':
+        obj, when = event_data.get('launch_id') or event_type, ''
+    elif kind == 'satellite':
+        rise = event_data.get('time')
+        if isinstance(rise, datetime):
+            epoch = rise.timestamp()
+        return (f"{event_data.get('source', '')}|{kind}|{event_data['norad_id']}|{location}|"
+                f"{int(epoch // SATELLITE_KEY_ROUNDING)}")
+    elif kind in ('meteor', 'aurora'):
+        obj, when = event_type, datetime.fromtimestamp(epoch, tz=timezone.utc).date().isoformat()
+    else:
+        obj, when = event_type, round(epoch / EVENT_KEY_ROUNDING)
+    return f"{event_data.get('source', '')}|{kind}|{obj}|{when}|{location}"
+
+
+def nearby_event_keys(key):
+    """Keys of the same satellite pass in the neighbouring time buckets, or () for other events"""
+    if not key or SATELLITE_KEY_KIND not in key:
+        return ()
+    prefix, _, bucket = key.rpartition('|')
+    return (f"{prefix}|{int(bucket) - 1}", f"{prefix}|{int(bucket) + 1}")
+
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived SQLite connections in WAL mode
+
+    Connections are opened lazily up to ``size`` and handed to one thread
+    at a time. Each keeps its own prepared statement cache, so repeated
+    queries skip parsing. WAL lets readers run while a write is in
+    progress; writers are serialized here instead of spinning on
+    SQLITE_BUSY.
+    """
+
+    def __init__(self, db_path, size=DB_POOL_SIZE, timeout=DB_BUSY_TIMEOUT / 1000.0):
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False,
+                               cached_statements=DB_STATEMENT_CACHE)
+        conn.execute('PRAGMA journal_mode=WAL')
+        # NORMAL is durable in WAL mode except for the last commits on power loss
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA cache_size=-{int(DB_CACHE_SIZE_KB)}')
+        conn.execute(f'PRAGMA mmap_size={int(DB_MMAP_SIZE)}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute(f'PRAGMA busy_timeout={int(self.timeout * 1000)}')
+        return conn
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                try:
+                    return self._connect()
+                except Exception:
+                    self._opened -= 1
+                    raise
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError(f"No free database connection after {self.timeout}s")
+
+    @contextmanager
+    def connection(self, write=False):
+        """Borrow a connection, committing on success and rolling back on error"""
+        if write:
+            self._write_lock.acquire()
+        try:
+            conn = self._acquire()
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._idle.put(conn)
+        finally:
+            if write:
+                self._write_lock.release()
+
+    def close(self):
+        """Close every idle connection, e.g. at shutdown"""
+        with self._lock:
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+                self._opened -= 1
+
+
+class DatabaseWriter:
+    """Dedicated thread writing queued records in batched transactions
+
+    Producers only pay for a queue put. The thread takes whatever has
+    queued up, at most ``batch_size`` records, and hands it to ``write`` as
+    one batch, so transactions grow with load rather than with a timer. The
+    queue holds at most ``max_size`` records; beyond that producers block
+    until the writer catches up instead of growing memory without bound.
+    A batch failing for any reason but a locked database is retried one
+    record at a time, so only the records that fail are dropped.
+    """
+
+    def __init__(self, write, max_size=DB_WRITE_QUEUE_SIZE, batch_size=DB_BUFFER_SIZE, describe=repr):
+        self.write = write
+        self.describe = describe
+        self.batch_size = batch_size
+        self._queue = queue.Queue(max_size)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._blocked = False  # producers are waiting on a full queue
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='stellarwatch-db-writer')
+                self._thread.daemon = True
+                self._thread.start()
+
+    def put(self, record):
+        """Queue a record, blocking while the queue is full"""
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(record)
+            self._blocked = False
+        except queue.Full:
+            if not self._blocked:
+                self._blocked = True
+                print(f"Database write queue full ({self._queue.maxsize} records), waiting for the writer")
+            self._queue.put(record)
+
+    def pending(self):
+        """Records queued or being written"""
+        return self._queue.unfinished_tasks
+
+    def flush(self):
+        """Block until every record queued so far has been written"""
+        if self.pending():
+            self._ensure_thread()
+            self._queue.join()
+
+    def _run(self):
+        while True:
+            records = [self._queue.get()]
+            while len(records) < self.batch_size:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(records)
+            finally:
+                for _ in records:
+                    self._queue.task_done()
+
+    def _write_batch(self, records):
+        for attempt in range(1, WRITE_RETRIES + 1):
+            try:
+                self.write(records)
+                return
+            except sqlite3.OperationalError as e:
+                # Locked or busy past the busy timeout: back off and try the whole batch again
+                if attempt == WRITE_RETRIES:
+                    print(f"Error writing {len(records)} queued records, dropping them: {e}")
+                    return
+                time.sleep(0.5 * attempt)
+            except Exception as e:
+                print(f"Error writing {len(records)} queued records, retrying them one by one: {e}")
+                self._write_each(records)
+                return
+
+    def _write_each(self, records):
+        """Write records in separate transactions so one bad record only loses itself"""
+        for record in records:
+            try:
+                self.write([record])
+            except Exception as e:
+                print(f"Error writing queued record {self.describe(record)}, dropping it: {e}")
+
 
 class DatabaseManager:
-    def __init__(self):
-        self.db_path = "data/astronomy.db"
+    def __init__(self, db_path=DATABASE_PATH, pool_size=DB_POOL_SIZE,
+                 queue_size=DB_WRITE_QUEUE_SIZE, batch_size=DB_BUFFER_SIZE):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self.pool = ConnectionPool(db_path, pool_size)
         self._init_database()
+        
+        # Buffered events and alerts go through one writer thread, which is drained at exit
+        self.writer = DatabaseWriter(self._write_records, queue_size, batch_size, self._describe_record)
+        atexit.register(self.close)
     
     def _init_database(self):
         """Initialize database with required tables"""
-        os.makedirs("data", exist_ok=True)
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Users table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT NOT NULL,
-                password_hash TEXT NOT NULL,
-                preferences TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Events table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                event_type TEXT NOT NULL,
-                event_data TEXT NOT NULL,
-                location TEXT NOT NULL,
-                event_time TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Alerts table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS alerts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER,
-                event_id INTEGER,
-                alert_sent BOOLEAN DEFAULT FALSE,
-                sent_at TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (id),
-                FOREIGN KEY (event_id) REFERENCES events (id)
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        with self.pool.connection(write=True) as conn:
+            cursor = conn.cursor()
+            
+            # Lets maintenance return freed pages to the OS a few at a time. Switching it on
+            # takes a VACUUM, instant on a new file and slow on a big old one, so it runs
+            # once here at startup, before the writer thread, rather than in maintain()
+            if cursor.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+                if cursor.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()[0]:
+                    print("Converting database to incremental auto-vacuum")
+                cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+                cursor.execute('VACUUM')
+            
+            # Users table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username TEXT UNIQUE NOT NULL,
+                    email TEXT NOT NULL,
+                    password_hash TEXT NOT NULL,
+                    preferences TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Events table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event_type TEXT NOT NULL,
+                    event_data BLOB NOT NULL,
+                    location TEXT NOT NULL,
+                    event_time TIMESTAMP,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    event_key TEXT,
+                    kind TEXT,
+                    epoch REAL,
+                    altitude REAL,
+                    zhr REAL,
+                    kp REAL,
+                    probability REAL
+                )
+            ''')
+            
+            # Older databases get the newer columns; their old rows keep NULLs and JSON text data
+            columns = {row[1] for row in cursor.execute('PRAGMA table_info(events)')}
+            for column, column_type in {'event_key': 'TEXT', **TYPED_COLUMNS}.items():
+                if column not in columns:
+                    cursor.execute(f'ALTER TABLE events ADD COLUMN {column} {column_type}')
+            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_events_key ON events (event_key)')
+            
+            # Alerts table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS alerts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER,
+                    event_id INTEGER,
+                    alert_sent BOOLEAN DEFAULT FALSE,
+                    sent_at TIMESTAMP,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users (id),
+                    FOREIGN KEY (event_id) REFERENCES events (id)
+                )
+            ''')
+            
+            # History lookups by time, by location and type, and pending alerts per user
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_time ON events (event_time)')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_events_location_type_time
+                ON events (location, event_type, event_time)
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_events_kind_time ON events (kind, event_time)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_alerts_user_sent ON alerts (user_id, alert_sent)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_alerts_event ON alerts (event_id)')
+            
+            # Daily aggregates of raw events past their retention, kept for long-range trends
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS event_rollups (
+                    day TEXT NOT NULL,
+                    location TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    events INTEGER NOT NULL,
+                    max_altitude REAL,
+                    max_zhr REAL,
+                    max_kp REAL,
+                    max_probability REAL,
+                    PRIMARY KEY (day, location, kind)
+                )
+            ''')
+            
+            # Precomputed satellite passes, one row per pass over a location
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS satellite_passes (
+                    satellite INTEGER NOT NULL,
+                    location TEXT NOT NULL,
+                    rise_time REAL NOT NULL,
+                    culmination REAL NOT NULL,
+                    set_time REAL NOT NULL,
+                    max_altitude REAL NOT NULL,
+                    min_range REAL NOT NULL,
+                    rise_azimuth REAL NOT NULL,
+                    set_azimuth REAL NOT NULL,
+                    tle_epoch REAL NOT NULL,
+                    PRIMARY KEY (satellite, location, rise_time)
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_satellite_passes_rise ON satellite_passes (rise_time)')
+            
+            # How far ahead, and from which element set, each location's passes were computed
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS satellite_pass_coverage (
+                    satellite INTEGER NOT NULL,
+                    location TEXT NOT NULL,
+                    tle_epoch REAL NOT NULL,
+                    computed_until REAL NOT NULL,
+                    PRIMARY KEY (satellite, location)
+                )
+            ''')
     
     def save_user_preferences(self, username, preferences):
         """Save user preferences to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE users SET preferences = ? WHERE username = ?
-        ''', (json.dumps(preferences), username))
-        
-        conn.commit()
-        conn.close()
+        with self.pool.connection(write=True) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                UPDATE users SET preferences = ? WHERE username = ?
+            ''', (json.dumps(preferences), username))
     
     def get_user_preferences(self, username):
         """Get user preferences from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT preferences FROM users WHERE username = ?', (username,))
-        result = cursor.fetchone()
-        conn.close()
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('SELECT preferences FROM users WHERE username = ?', (username,))
+            result = cursor.fetchone()
         
         if result and result[0]:
             return json.loads(result[0])
         return {}
     
-    def log_event(self, event_type, event_data, location, event_time=None):
-        """Log an astronomical event to the database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def _event_row(self, event_type, event_data, location, event_time=None):
+        event_time = event_time or datetime.now()
+        return (event_key(event_type, event_data, location, event_time), event_type,
+                encode_payload(event_data), location, event_time,
+                *event_columns(event_type, event_data, event_time))
+    
+    def _alert_row(self, event_type, event_data, location, event_time=None, user_id=None):
+        event_time = event_time or datetime.now()
+        return (user_id, event_key(event_type, event_data, location, event_time), datetime.now())
+    
+    def _moved_keys(self, conn, keys):
+        """Map keys of satellite passes stored under a neighbouring bucket to the stored key
         
-        cursor.execute('''
-            INSERT INTO events (event_type, event_data, location, event_time)
-            VALUES (?, ?, ?, ?)
-        ''', (event_type, json.dumps(event_data), location, event_time or datetime.now()))
+        A new element set can move a pass by a few seconds across a bucket
+        edge; writing it under the stored key keeps the upsert from storing
+        the same pass twice.
+        """
+        nearby = {}
+        for key in keys:
+            for other in nearby_event_keys(key):
+                nearby.setdefault(other, key)
+        if not nearby:
+            return {}
+        candidates = list(nearby) + list(set(nearby.values()))
+        stored = {row[0] for row in conn.execute(f'''
+            SELECT event_key FROM events WHERE event_key IN ({','.join('?' * len(candidates))})
+        ''', candidates)}
+        moved = {}
+        for other in sorted(stored):
+            key = nearby.get(other)
+            if key is not None and key not in stored:
+                moved.setdefault(key, other)
+        return moved
+    
+    def _insert_events(self, rows, alert_rows=()):
+        """Upsert rows by event key; a rescan only rewrites rows whose data or time changed
         
-        conn.commit()
-        conn.close()
+        Satellite passes that moved into a neighbouring key bucket update
+        their stored row. Alert rows are written in the same transaction,
+        after the events, so they find the id of an event logged in the same
+        batch.
+        """
+        with self.pool.connection(write=True) as conn:
+            moved = self._moved_keys(conn, [row[0] for row in rows] + [row[1] for row in alert_rows])
+            if moved:
+                rows = [(moved.get(row[0], row[0]),) + row[1:] for row in rows]
+                alert_rows = [row[:1] + (moved.get(row[1], row[1]),) + row[2:] for row in alert_rows]
+            conn.executemany('''
+                INSERT INTO events (event_key, event_type, event_data, location, event_time,
+                                    kind, epoch, altitude, zhr, kp, probability)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (event_key) DO UPDATE SET
+                    event_type = excluded.event_type,
+                    event_data = excluded.event_data,
+                    event_time = excluded.event_time,
+                    kind = excluded.kind,
+                    epoch = excluded.epoch,
+                    altitude = excluded.altitude,
+                    zhr = excluded.zhr,
+                    kp = excluded.kp,
+                    probability = excluded.probability
+                WHERE event_data != excluded.event_data OR event_time IS NOT excluded.event_time
+            ''', rows)
+            conn.executemany('''
+                INSERT INTO alerts (user_id, event_id, alert_sent, sent_at)
+                VALUES (?, (SELECT id FROM events WHERE event_key = ?), TRUE, ?)
+            ''', alert_rows)
+    
+    def _describe_record(self, record):
+        """Short description of a queued record for error messages"""
+        kind, row = record
+        return f"event {row[0] or row[1]!r}" if kind == 'event' else f"alert for {row[1]!r}"
+    
+    def _write_records(self, records):
+        """Write a batch of queued ('event' | 'alert', row) records in one transaction"""
+        self._insert_events([row for kind, row in records if kind == 'event'],
+                            [row for kind, row in records if kind == 'alert'])
+    
+    def log_event(self, event_type, event_data, location, event_time=None, buffered=False):
+        """Log an astronomical event to the database
+        
+        With ``buffered`` the row is handed to the writer thread and written
+        with its next batch instead of in its own transaction.
+        """
+        row = self._event_row(event_type, event_data, location, event_time)
+        if buffered:
+            self.writer.put(('event', row))
+        else:
+            self._insert_events([row])
+    
+    def log_events(self, events, buffered=False):
+        """Log many events in a single transaction
+        
+        ``events`` yields (event_type, event_data, location) tuples, optionally
+        with an event_time. Events already logged under the same event key are
+        updated rather than duplicated. With ``buffered`` the rows are handed
+        to the writer thread. Returns the number of events logged.
+        """
+        rows = [self._event_row(*event) for event in events]
+        if buffered:
+            for row in rows:
+                self.writer.put(('event', row))
+        elif rows:
+            self._insert_events(rows)
+        return len(rows)
+    
+    def log_alert(self, event_type, event_data, location, event_time=None, user_id=None, buffered=False):
+        """Record that an alert was sent for an event logged with the same arguments
+        
+        The alert is linked to the event through its event key, so a buffered
+        alert queued right after its event still finds it.
+        """
+        row = self._alert_row(event_type, event_data, location, event_time, user_id)
+        if buffered:
+            self.writer.put(('alert', row))
+        else:
+            self._insert_events([], [row])
+    
+    def flush(self):
+        """Wait until every buffered event and alert is written, returning how many were pending"""
+        pending = self.writer.pending()
+        self.writer.flush()
+        return pending
+    
+    def close(self):
+        """Flush buffered writes, checkpoint the WAL into the database file and close connections"""
+        self.flush()
+        try:
+            with self.pool.connection(write=True) as conn:
+                conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchall()
+        except sqlite3.Error as e:
+            print(f"Error checkpointing database: {e}")
+        self.pool.close()
     
     def get_recent_events(self, limit=50):
         """Get recent events from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return self.query_events(limit=limit)[0]
+    
+    def query_events(self, start=None, end=None, location=None, event_type=None, limit=50, after=None,
+                     kind=None, at_least=None, payload=True):
+        """Get events newest first, filtered by time range, location and type
         
-        cursor.execute('''
-            SELECT event_type, event_data, location, event_time 
-            FROM events 
-            ORDER BY event_time DESC 
-            LIMIT ?
-        ''', (limit,))
+        ``location``, ``event_type`` and ``kind`` take a single value or a
+        list. ``at_least`` maps typed columns such as 'zhr' or 'altitude' to
+        minimum values, which are filtered in SQL. Without ``payload`` the
+        stored event dicts are not decoded and 'data' holds only the typed
+        columns. Pages are keyset paginated: pass the returned cursor as
+        ``after`` to get the next page, so every page is an index range scan
+        however deep it is. Returns (events, cursor); the cursor is None on
+        the last page.
+        """
+        conditions, params = [], []
+        for column, value in (('location', location), ('event_type', event_type), ('kind', kind)):
+            if value is None:
+                continue
+            values = [value] if isinstance(value, str) else list(value)
+            conditions.append(f"{column} IN ({','.join('?' * len(values))})")
+            params.extend(values)
+        for column, minimum in (at_least or {}).items():
+            if column not in TYPED_COLUMNS or column == 'kind':
+                raise ValueError(f"Unknown numeric event column: {column!r}")
+            conditions.append(f"{column} >= ?")
+            params.append(minimum)
+        if start is not None:
+            conditions.append('event_time >= ?')
+            params.append(start)
+        if end is not None:
+            conditions.append('event_time < ?')
+            params.append(end)
+        if after is not None:
+            conditions.append('(event_time, id) < (?, ?)')
+            params.extend(after)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(f'''
+                SELECT id, event_type, location, event_time, {'event_data' if payload else 'NULL'},
+                       kind, epoch, altitude, zhr, kp, probability
+                FROM events
+                {where}
+                ORDER BY event_time DESC, id DESC
+                LIMIT ?
+            ''', params + [limit + 1])
+            rows = cursor.fetchall()
         
         events = []
-        for row in cursor.fetchall():
+        for row in rows[:limit]:
             events.append({
-                'type': row[0],
-                'data': json.loads(row[1]),
+                'id': row[0],
+                'type': row[1],
+                'data': decode_payload(row[4]) if payload else dict(zip(TYPED_COLUMNS, row[5:])),
                 'location': row[2],
                 'time': row[3]
             })
+        next_cursor = (rows[limit - 1][3], rows[limit - 1][0]) if 0 < limit < len(rows) else None
+        return events, next_cursor
+    
+    def get_pass_coverage(self):
+        """Get {(satellite, location): (tle_epoch, computed_until)} for the pass table"""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT satellite, location, tle_epoch, computed_until
+                FROM satellite_pass_coverage
+            ''')
+            coverage = {(row[0], row[1]): (row[2], row[3]) for row in cursor.fetchall()}
+        return coverage
+    
+    def save_passes(self, passes, tle_epochs, start, computed_until):
+        """Store passes computed from ``start`` up to ``computed_until``
+        
+        ``passes`` maps satellites to {location: [raw pass dicts]} and
+        ``tle_epochs`` maps satellites to the element epoch they came from.
+        Rows of those satellites and locations stored from ``start`` on are
+        replaced.
+        """
+        with self.pool.connection(write=True) as conn:
+            cursor = conn.cursor()
+            
+            pairs = [(satellite, location) for satellite in passes for location in passes[satellite]]
+            cursor.executemany('''
+                DELETE FROM satellite_passes
+                WHERE satellite = ? AND location = ? AND rise_time > ?
+            ''', [(satellite, location, start) for satellite, location in pairs])
+            cursor.executemany('''
+                INSERT OR REPLACE INTO satellite_passes
+                (satellite, location, rise_time, culmination, set_time, max_altitude,
+                 min_range, rise_azimuth, set_azimuth, tle_epoch)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(satellite, location, p['rise'], p['culmination'], p['set'], p['max_altitude'],
+                   p['min_range'], p['rise_azimuth'], p['set_azimuth'], tle_epochs[satellite])
+                  for satellite, location in pairs for p in passes[satellite][location]])
+            cursor.executemany('''
+                INSERT OR REPLACE INTO satellite_pass_coverage (satellite, location, tle_epoch, computed_until)
+                VALUES (?, ?, ?, ?)
+            ''', [(satellite, location, tle_epochs[satellite], computed_until) for satellite, location in pairs])
+    
+    def get_passes(self, start, end, locations=None, satellite=None):
+        """Get passes rising between two epochs, ordered by rise time"""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            
+            query = '''
+                SELECT satellite, location, rise_time, culmination, set_time, max_altitude,
+                       min_range, rise_azimuth, set_azimuth
+                FROM satellite_passes
+                WHERE rise_time > ? AND rise_time <= ?
+            '''
+            params = [start, end]
+            if satellite is not None:
+                query += ' AND satellite = ?'
+                params.append(satellite)
+            if locations is not None:
+                locations = list(locations)
+                query += f" AND location IN ({','.join('?' * len(locations))})"
+                params.extend(locations)
+            cursor.execute(query + ' ORDER BY rise_time', params)
+            
+            passes = []
+            for row in cursor.fetchall():
+                passes.append({
+                    'satellite': row[0],
+                    'location': row[1],
+                    'rise': row[2],
+                    'culmination': row[3],
+                    'set': row[4],
+                    'max_altitude': row[5],
+                    'min_range': row[6],
+                    'rise_azimuth': row[7],
+                    'set_azimuth': row[8]
+                })
+        return passes
+    
+    def prune_passes(self, before):
+        """Delete passes that rose before an epoch"""
+        with self.pool.connection(write=True) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('DELETE FROM satellite_passes WHERE rise_time < ?', (before,))
+    
+    def query_rollups(self, start=None, end=None, location=None, kind=None):
+        """Get daily event aggregates oldest first, for trends beyond the raw event retention
+        
+        ``start`` and ``end`` are dates, datetimes or "YYYY-MM-DD" strings,
+        ``end`` exclusive. ``location`` and ``kind`` take a single value or a
+        list. Each rollup is a dict of the event_rollups columns.
+        """
+        conditions, params = [], []
+        for column, value in (('location', location), ('kind', kind)):
+            if value is None:
+                continue
+            values = [value] if isinstance(value, str) else list(value)
+            conditions.append(f"{column} IN ({','.join('?' * len(values))})")
+            params.extend(values)
+        for condition, day in (('day >= ?', start), ('day < ?', end)):
+            if day is not None:
+                conditions.append(condition)
+                params.append(day if isinstance(day, str) else day.strftime('%Y-%m-%d'))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute(f'''
+                SELECT day, location, kind, events, max_altitude, max_zhr, max_kp, max_probability
+                FROM event_rollups
+                {where}
+                ORDER BY day, location, kind
+            ''', params)
+            columns = [column[0] for column in cursor.description]
+            rollups = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        return rollups
+    
+    def _roll_up_before(self, before):
+        """Fold raw events older than ``before`` into event_rollups and delete them
+        
+        Aggregating and deleting happen in one transaction, so a row is
+        counted exactly once even if maintenance is interrupted. Alerts of
+        the deleted events keep their row with a NULL event_id. Rows whose
+        event_time SQLite cannot read as a date are left alone. Returns the
+        number of events removed.
+        """
+        with self.pool.connection(write=True) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO event_rollups
+                (day, location, kind, events, max_altitude, max_zhr, max_kp, max_probability)
+                SELECT date(event_time), location, COALESCE(kind, 'event'), COUNT(*),
+                       MAX(altitude), MAX(zhr), MAX(kp), MAX(probability)
+                FROM events
+                WHERE event_time < ? AND date(event_time) IS NOT NULL
+                GROUP BY 1, 2, 3
+                ON CONFLICT (day, location, kind) DO UPDATE SET
+                    events = events + excluded.events,
+                    max_altitude = MAX(COALESCE(max_altitude, excluded.max_altitude),
+                                       COALESCE(excluded.max_altitude, max_altitude)),
+                    max_zhr = MAX(COALESCE(max_zhr, excluded.max_zhr), COALESCE(excluded.max_zhr, max_zhr)),
+                    max_kp = MAX(COALESCE(max_kp, excluded.max_kp), COALESCE(excluded.max_kp, max_kp)),
+                    max_probability = MAX(COALESCE(max_probability, excluded.max_probability),
+                                          COALESCE(excluded.max_probability, max_probability))
+            ''', (before,))
+            cursor.execute('''
+                UPDATE alerts SET event_id = NULL
+                WHERE event_id IN (SELECT id FROM events WHERE event_time < ? AND date(event_time) IS NOT NULL)
+            ''', (before,))
+            cursor.execute('DELETE FROM events WHERE event_time < ? AND date(event_time) IS NOT NULL', (before,))
+            return cursor.rowcount
+    
+    def _oldest_event_day(self):
+        """Midnight of the day of the oldest raw event, or None when there are none"""
+        with self.pool.connection() as conn:
+            # SQLite parses the date, skipping times it cannot read instead of failing on them
+            oldest = conn.execute('''
+                SELECT date(event_time) FROM events
+                WHERE date(event_time) IS NOT NULL
+                ORDER BY event_time
+                LIMIT 1
+            ''').fetchone()
+        if oldest is None:
+            return None
+        return datetime.strptime(oldest[0], '%Y-%m-%d')
+    
+    def size_bytes(self):
+        """Bytes of the database file in use, not counting free pages"""
+        with self.pool.connection() as conn:
+            page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+            page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+            free_pages = conn.execute('PRAGMA freelist_count').fetchone()[0]
+        return (page_count - free_pages) * page_size
+    
+    def maintain(self, now=None, event_days=EVENT_RETENTION_DAYS, alert_days=ALERT_RETENTION_DAYS,
+                 rollup_days=ROLLUP_RETENTION_DAYS, budget_mb=DB_SIZE_BUDGET_MB, vacuum_pages=DB_VACUUM_PAGES):
+        """Apply retention, keep the database within its size budget and reclaim free pages
+        
+        Raw events older than ``event_days`` are rolled up into daily
+        per-location, per-kind aggregates, which query_rollups reads back.
+        This goes one day at a time, each day in its own short write
+        transaction so scans keep logging in between. While
+        the database is above ``budget_mb`` the oldest remaining days before
+        today are rolled up early. Today's and later rows are never rolled up,
+        since scans still re-log and upsert them and they would be counted
+        twice. Alerts older than ``alert_days`` and, unless it is 0,
+        rollups older than ``rollup_days`` are deleted. At most
+        ``vacuum_pages`` free pages are then returned to the OS. Slow on big
+        histories, so run it from a background thread. Returns a summary.
+        """
+        if now is None:
+            now = datetime.now()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        cutoff = today - timedelta(days=event_days)
+        budget = budget_mb * 1024 * 1024
+        summary = {'rolled_up_days': 0, 'events_removed': 0, 'alerts_removed': 0, 'rollups_removed': 0}
+        
+        over_budget = False
+        day = self._oldest_event_day()
+        while day is not None and day < today:
+            if day >= cutoff:
+                if self.size_bytes() <= budget:
+                    break
+                if not over_budget:
+                    over_budget = True
+                    print(f"Database above its {budget_mb} MB budget, rolling up events from {day:%Y-%m-%d} early")
+            summary['events_removed'] += self._roll_up_before(day + timedelta(days=1))
+            summary['rolled_up_days'] += 1
+            day = self._oldest_event_day()
+        
+        with self.pool.connection(write=True) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('DELETE FROM alerts WHERE created_at < ?',
+                           ((now - timedelta(days=alert_days)).astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),))
+            summary['alerts_removed'] = cursor.rowcount
+            if rollup_days:
+                cursor.execute('DELETE FROM event_rollups WHERE day < ?',
+                               ((today - timedelta(days=rollup_days)).strftime('%Y-%m-%d'),))
+                summary['rollups_removed'] = cursor.rowcount
+        
+        with self.pool.connection(write=True) as conn:
+            conn.execute(f'PRAGMA incremental_vacuum({int(vacuum_pages)})').fetchall()
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchall()
         
-        conn.close()
-        return events
+        summary['size_bytes'] = self.size_bytes()
+        return summary
 
 # Global database instance
 db_manager = DatabaseManager()
\ No newline at end of file
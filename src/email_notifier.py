@@ -30,6 +30,7 @@ class EmailNotifier:
             msg['Subject'] = subject
             
             # Create HTML email
+            html_message = message.replace('\n', '<br>')
             html_content = f"""
             <html>
                 <body style="font-family: Arial, sans-serif; background: linear-gradient(135deg, #0c0c2e 0%, #1a1a3e 100%); color: white; padding: 20px;">
@@ -38,7 +39,7 @@ class EmailNotifier:
                             🔭 StellarWatch Alert
                         </h1>
                         <div style="background: rgba(255,255,255,0.1); padding: 20px; border-radius: 10px; margin: 20px 0;">
-                            {message.replace('\n', '<br>')}
+                            {html_message}
                         </div>
                         <p style="text-align: center; color: #a0a0c0; font-size: 12px;">
                             Sent from StellarWatch Astronomical Monitoring System
@@ -0,0 +1,102 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+
+import numpy as np
+
+try:
+    from skyfield.api import Loader
+    from skyfield.jpllib import SpiceKernel
+    SKYFIELD_AVAILABLE = True
+except ImportError:
+    SKYFIELD_AVAILABLE = False
+
+try:
+    from src.circuit_breaker import circuit_breakers
+except ImportError:
+    from circuit_breaker import circuit_breakers
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    EPHEMERIS_DIR = '.'
+    EPHEMERIS_FILE = 'de421.bsp'
+
+
+class EphemerisProvider:
+    """Process-wide timescale and planetary ephemeris, loaded on first use
+
+    The SPK kernel is opened through jplephem, which memory-maps the file
+    read-only instead of reading it into the heap. Every detector shares the
+    same mapping, and worker processes mapping the same file share its pages
+    through the OS page cache.
+    """
+
+    def __init__(self, directory=EPHEMERIS_DIR, filename=EPHEMERIS_FILE):
+        self.directory = directory
+        self.filename = filename
+        self._timescale = None
+        self._ephemeris = None
+        self._warned = set()  # fallbacks already reported as in use
+        self._lock = threading.Lock()
+
+    @property
+    def available(self):
+        return SKYFIELD_AVAILABLE
+
+    def _loader(self):
+        return Loader(self.directory, verbose=False)
+
+    @property
+    def timescale(self):
+        """Shared skyfield timescale using the builtin leap second tables"""
+        if self._timescale is None:
+            with self._lock:
+                if self._timescale is None:
+                    self._timescale = self._loader().timescale()
+        return self._timescale
+
+    @property
+    def ephemeris(self):
+        """Shared memory-mapped ephemeris, downloaded on first use if missing"""
+        if self._ephemeris is None:
+            with self._lock:
+                if self._ephemeris is None:
+                    loader = self._loader()
+                    path = loader.path_to(self.filename)
+                    if not os.path.exists(path):
+                        # Offline hosts would otherwise retry the download on every call
+                        circuit_breakers.get('ephemeris').call(
+                            lambda: loader.download(self.filename), serve_last_good=False)
+                    self._ephemeris = SpiceKernel(path)
+        return self._ephemeris
+
+    def time_from_epochs(self, epochs):
+        """Skyfield Time array for Unix epoch seconds
+
+        Whole days are split off first so leap seconds are not counted as
+        Unix seconds.
+        """
+        epochs = np.asarray(epochs, dtype=float)
+        days = np.floor(epochs / 86400)
+        return self.timescale.utc(1970, 1, 1 + days, 0, 0, epochs - days * 86400)
+
+    def warn_unavailable(self, fallback, error):
+        """Report once per fallback that the ephemeris failed, so offline scans stay quiet"""
+        with self._lock:
+            if fallback in self._warned:
+                return
+            self._warned.add(fallback)
+        print(f"Ephemeris unavailable for {fallback}: {error}")
+
+    @property
+    def loaded(self):
+        """Whether the ephemeris has been opened in this process"""
+        return self._ephemeris is not None
+
+
+# Global ephemeris provider instance
+ephemeris_provider = EphemerisProvider()
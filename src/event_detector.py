@@ -2,12 +2,13 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import requests
-import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 
 try:
-    from skyfield.api import load, wgs84
+    import skyfield
     SKYFIELD_AVAILABLE = True
 except ImportError:
     SKYFIELD_AVAILABLE = False
@@ -15,6 +16,33 @@ except ImportError:
 
 import pandas as pd
 
+try:
+    from src.aurora_grid import AuroraGrid
+    from src.circuit_breaker import circuit_breakers
+    from src.ephemeris import ephemeris_provider
+    from src.geo_cells import cell_location, cell_of, resolve_location
+    from src.http_client import http_client
+    from src.meteor_almanac import get_meteor_almanac
+    from src.observability import observability_filter
+    from src.pass_table import PassTable
+    from src.source_cache import source_cache
+    from src.global_locations import GLOBAL_LOCATIONS
+    from src.timezone_index import timezone_index
+    from src.visibility_engine import VisibilityEngine
+except ImportError:
+    from aurora_grid import AuroraGrid
+    from circuit_breaker import circuit_breakers
+    from ephemeris import ephemeris_provider
+    from geo_cells import cell_location, cell_of, resolve_location
+    from http_client import http_client
+    from meteor_almanac import get_meteor_almanac
+    from observability import observability_filter
+    from pass_table import PassTable
+    from source_cache import source_cache
+    from global_locations import GLOBAL_LOCATIONS
+    from timezone_index import timezone_index
+    from visibility_engine import VisibilityEngine
+
 # Import config with fallback
 try:
     from config import *
@@ -23,7 +51,8 @@ except ImportError:
     ISS_POSITION_URL = "https://api.wheretheiss.at/v1/satellites/25544"
     METEOR_SHOWER_DATA = "https://data.imo.net/files/imo_calendar.json"
     AURORA_FORECAST_URL = "https://services.swpc.noaa.gov/products/ovation_aurora_latest.json"
-    ROCKET_LAUNCH_API = "https://fdo.rocketlaunch.live/json/launches/next/5"
+    ROCKET_LAUNCH_API = "https://lldev.thespacedevs.com/2.2.0/launch/upcoming/"
+    ISS_PASS_API = "http://api.open-notify.org/iss-pass.json"
 
     DEFAULT_LOCATIONS = {
         'bangalore': {'lat': 12.9716, 'lon': 77.5946, 'name': 'Bangalore, India'},
@@ -32,54 +61,152 @@ except ImportError:
         'chennai': {'lat': 13.0827, 'lon': 80.2707, 'name': 'Chennai, India'}
     }
 
+    ISS_TLE_URL = "https://celestrak.org/NORAD/elements/gp.php?CATNR=25544&FORMAT=tle"
+
     MIN_ISS_ALTITUDE = 20
     AURORA_KP_THRESHOLD = 6
     METEOR_SHOWER_ZHR = 10
     CHECK_INTERVAL = 300
     ALERT_WINDOW = 60
+    CONCURRENT_SOURCES = True
+    PASS_TABLE_DAYS = 3
+    MAX_SATELLITE_EVENTS = 10
+    GEOCELL_FINE_CORRECTION = True
+    SOURCE_DEADLINE = 12
+
+# Columns of the batched multi-location result
+EVENT_COLUMNS = ['location_id', 'kind', 'event', 'epoch', 'local_time', 'max_altitude', 'zhr',
+                 'probability', 'kp_index', 'observable', 'source_age', 'stale', 'details']
+
+# Shared worker pool for source fan-out. Fetches that miss a scan deadline keep
+# running here and land in the source cache for the next scan.
+source_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='stellarwatch-source')
+
+# Circuit breakers guarding the upstreams behind each source
+SOURCE_BREAKERS = {
+    'satellites': ('tle', 'iss_pass_api'),
+    'aurora': ('aurora',),
+    'launches': ('launches',),
+}
+
+# Source cache snapshot behind each source
+SOURCE_SNAPSHOTS = {
+    'satellites': 'tle',
+    'meteors': 'meteors',
+    'aurora': 'aurora',
+    'launches': 'launches',
+}
 
 class AstronomicalEventDetector:
     def __init__(self):
+        # Timescale and ephemeris are shared process-wide and loaded on first use
         if SKYFIELD_AVAILABLE:
-            self.ts = load.timescale()
-            self.eph = load('de421.bsp')
+            self.visibility_engine = VisibilityEngine()
+            self.pass_table = PassTable(self.visibility_engine)
+            # Known cities stay in the pass table; user locations join it when first asked for
+            self.pass_table.track({cell_of(loc): cell_location(cell_of(loc)) for loc in GLOBAL_LOCATIONS.values()})
         else:
-            self.ts = None
-            self.eph = None
+            self.visibility_engine = None
+            self.pass_table = None
+        self.last_source_status = {}
+        self.last_source_freshness = {}
+    
+    @property
+    def ts(self):
+        return ephemeris_provider.timescale if SKYFIELD_AVAILABLE else None
+    
+    @property
+    def eph(self):
+        return ephemeris_provider.ephemeris if SKYFIELD_AVAILABLE else None
+    
+    def predict_satellite_passes(self, locations=None, days=1, refine=GEOCELL_FINE_CORRECTION):
+        """Predict visible passes of every tracked satellite for many locations at once
+        
+        Passes are computed once per geohash cell, at the cell center, and
+        shared by every location in it. With ``refine`` each location's
+        passes are then corrected for its exact coordinates.
+        """
+        if locations is None:
+            locations = GLOBAL_LOCATIONS
+        now = time.time()
+        cells = {loc_id: cell_of(location) for loc_id, location in locations.items()}
+        cell_locations = {cell: cell_location(cell) for cell in set(cells.values())}
+        raw_passes = None
+        if days <= PASS_TABLE_DAYS:
+            # Occupied cells are served from the persisted pass table with a range query
+            try:
+                self.pass_table.track(cell_locations, now)
+                self.pass_table.refresh(now=now)
+                raw_passes = self.pass_table.passes(list(cell_locations), now, now + days * 86400)
+            except sqlite3.Error as e:
+                print(f"Error reading the pass table, predicting directly: {e}")
+        if raw_passes is None:
+            self.visibility_engine.ensure_elements()
+            computed = self.visibility_engine.compute(cell_locations, now, now + days * 86400)
+            raw_passes = {cell: sorted((dict(p, satellite=norad_id)
+                                        for norad_id in computed for p in computed[norad_id][cell]),
+                                       key=lambda p: p['rise'])
+                          for cell in cell_locations}
         
-    def get_real_iss_passes(self, location, days=1):
-        """Get real ISS pass predictions using public API"""
+        events = {}
+        for loc_id, location in locations.items():
+            passes = raw_passes[cells[loc_id]]
+            if refine:
+                passes = self.visibility_engine.refine(passes, location)
+            events[loc_id] = [self.visibility_engine.to_event(p['satellite'], p) for p in passes]
+        return events
+    
+    def get_satellite_passes(self, location, days=1):
+        """Get the brightest visible satellite passes for a location"""
+        if self.visibility_engine is not None:
+            try:
+                passes = self.predict_satellite_passes({'location': location}, days)['location']
+                brightest = sorted(passes, key=lambda p: p['magnitude'])
+                return sorted(brightest[:MAX_SATELLITE_EVENTS], key=lambda p: p['time'])
+            except Exception as e:
+                print(f"Error predicting satellite passes locally: {e}")
+        
+        return self.get_real_iss_passes(location)
+    
+    def get_real_iss_passes(self, location):
+        """Get ISS passes from the Open Notify API, used when local prediction is unavailable"""
         try:
-            lat, lon = location['lat'], location['lon']
-            # Using Open Notify API for ISS passes
-            url = f"http://api.open-notify.org/iss-pass.json?lat={lat}&lon={lon}&n=5"
-            
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                passes = []
-                
-                for iss_pass in data['response']:
-                    pass_time = datetime.fromtimestamp(iss_pass['risetime'])
-                    duration = iss_pass['duration']  # in seconds
-                    
-                    # Only include passes in the future
-                    if pass_time > datetime.now():
-                        passes.append({
-                            'event': 'International Space Station Transit',
-                            'time': pass_time,
-                            'duration': f"{duration//60} minutes",
-                            'max_altitude': 'Unknown',  # API doesn't provide this
-                            'brightness': 'Magnitude -3.9 (Very Bright)',
-                            'direction': 'West to East',
-                            'source': 'NASA Open API'
-                        })
-                
-                return passes
+            # Passes are per location, so a previous location's answer is no use here
+            return circuit_breakers.get('iss_pass_api').call(
+                lambda: self.fetch_iss_api_passes(location), serve_last_good=False)
         except Exception as e:
             print(f"Error getting real ISS data: {e}")
         
-        return self.get_iss_passes(location)  # Fallback to sample data
+        return self.get_iss_passes(location)  # Offline fallback
+    
+    def fetch_iss_api_passes(self, location):
+        """Download ISS passes for one location from the Open Notify API"""
+        lat, lon = location['lat'], location['lon']
+        # Using Open Notify API for ISS passes
+        params = {'lat': lat, 'lon': lon, 'n': 5}
+        
+        response = http_client.get(ISS_PASS_API, params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        passes = []
+        
+        for iss_pass in data['response']:
+            pass_time = datetime.fromtimestamp(iss_pass['risetime'])
+            duration = iss_pass['duration']  # in seconds
+            
+            # Only include passes in the future
+            if pass_time > datetime.now():
+                passes.append({
+                    'event': 'International Space Station Transit',
+                    'time': pass_time,
+                    'duration': f"{duration//60} minutes",
+                    'max_altitude': 'Unknown',  # API doesn't provide this
+                    'brightness': 'Magnitude -3.9 (Very Bright)',
+                    'direction': 'West to East',
+                    'source': 'NASA Open API'
+                })
+        
+        return passes
     
     def get_live_meteor_showers(self):
         """Get real meteor shower data from IMO"""
@@ -88,82 +215,52 @@ class AstronomicalEventDetector:
             url = "https://www.imo.net/members/imo_live/meteor_showers/"
             # For now, we'll use known data since IMO requires membership
             # Fall back to enhanced sample data
-            return self.get_enhanced_meteor_data()
+            return source_cache.get('meteors', self.get_enhanced_meteor_data)
         except Exception as e:
             print(f"Error getting meteor data: {e}")
             return self.get_meteor_showers()
     
     def get_enhanced_meteor_data(self):
-        """Enhanced meteor shower data with real names and dates"""
-        current_year = datetime.now().year
-        meteor_showers = [
-            {
-                'event': 'Quadrantid Meteor Shower',
-                'peak': datetime(current_year, 1, 3, 8, 0),
-                'zhr': 120,
-                'moon_phase': 'New Moon',
-                'visibility': 'Excellent',
-                'constellation': 'Boötes',
-                'velocity': '41 km/s',
-                'source': 'IMO Database'
-            },
-            {
-                'event': 'Lyrid Meteor Shower',
-                'peak': datetime(current_year, 4, 22, 14, 0),
-                'zhr': 18,
-                'moon_phase': 'Waxing Gibbous',
-                'visibility': 'Good',
-                'constellation': 'Lyra',
-                'velocity': '49 km/s',
-                'source': 'IMO Database'
-            },
-            {
-                'event': 'Perseid Meteor Shower',
-                'peak': datetime(current_year, 8, 12, 20, 0),
-                'zhr': 100,
-                'moon_phase': 'Waning Crescent',
-                'visibility': 'Excellent',
-                'constellation': 'Perseus',
-                'velocity': '59 km/s',
-                'source': 'IMO Database'
-            },
-            {
-                'event': 'Geminid Meteor Shower',
-                'peak': datetime(current_year, 12, 14, 7, 0),
-                'zhr': 150,
-                'moon_phase': 'First Quarter',
-                'visibility': 'Good',
-                'constellation': 'Gemini',
-                'velocity': '35 km/s',
-                'source': 'IMO Database'
-            }
-        ]
-        
-        # Filter only upcoming showers
-        upcoming_showers = [shower for shower in meteor_showers if shower['peak'] > datetime.now()]
-        return upcoming_showers[:2]  # Return next 2 showers
+        """Next meteor shower peaks from the precomputed IMO almanac"""
+        return get_meteor_almanac().next_showers(n=2, min_zhr=METEOR_SHOWER_ZHR)
+    
+    def fetch_aurora_data(self):
+        """Download the global OVATION aurora forecast and parse it into a grid"""
+        # Using NOAA Aurora Forecast API
+        response = http_client.get(AURORA_FORECAST_URL, timeout=10)
+        response.raise_for_status()
+        return AuroraGrid.from_ovation(response.json())
+    
+    def get_aurora_grid(self):
+        """Get the current OVATION grid, shared by every location"""
+        return source_cache.get('aurora', self.load_aurora_grid)
+    
+    def load_aurora_grid(self):
+        """Fetch the aurora grid through its circuit breaker"""
+        # The source cache keeps the last good grid, so only short-circuit
+        return circuit_breakers.get('aurora').call(self.fetch_aurora_data, serve_last_good=False)
+    
+    def format_aurora_event(self, location, probability, grid):
+        """Build the aurora event dict for one location"""
+        probability = round(float(probability))
+        event = {
+            'event': 'Aurora Australis Forecast' if location['lat'] < 0 else 'Aurora Borealis Forecast',
+            'probability': f"{probability}%",
+            'kp_index': round(probability / 15, 1),
+            'best_time': '22:00-02:00 Local',
+            'visibility': 'Good' if probability > 30 else 'Fair',
+            'source': 'NOAA Space Weather'
+        }
+        if grid.forecast_time is not None:
+            event['forecast_time'] = datetime.fromtimestamp(grid.forecast_time)
+        return event
     
     def get_real_aurora_forecast(self, location):
-        """Get real aurora forecast data"""
+        """Get real aurora forecast data from the OVATION grid"""
         try:
-            # Using NOAA Aurora Forecast API
-            url = "https://services.swpc.noaa.gov/products/ovation_aurora_latest.json"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                # Data structure: [timestamp, [coordinates...]]
-                # For simplicity, we'll calculate probability based on location
-                probability = self.calculate_aurora_probability(location)
-                
-                return {
-                    'event': 'Aurora Borealis Forecast',
-                    'probability': f"{probability}%",
-                    'kp_index': round(probability / 15, 1),
-                    'best_time': '22:00-02:00 Local',
-                    'visibility': 'Good' if probability > 30 else 'Fair',
-                    'source': 'NOAA Space Weather'
-                }
+            grid = self.get_aurora_grid()
+            probability = grid.visible_probability_at(location['lat'], location['lon'])
+            return self.format_aurora_event(location, probability, grid)
         except Exception as e:
             print(f"Error getting aurora data: {e}")
         
@@ -187,68 +284,288 @@ class AstronomicalEventDetector:
         
         return min(80, base_prob + seasonal_boost)
     
+    def fetch_rocket_launches(self):
+        """Download and parse the upcoming launch schedule"""
+        # Using The Space Devs API (free tier available)
+        response = http_client.get(ROCKET_LAUNCH_API, params={'limit': 5}, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        launches = []
+        
+        for launch in data['results']:
+            # Naive server-local like every other event time, so events sort together
+            launch_time = datetime.fromisoformat(launch['net'].replace('Z', '+00:00')).astimezone().replace(tzinfo=None)
+            launches.append({
+                'event': f"{launch['name']}",
+                'launch_id': launch.get('id'),
+                'time': launch_time,
+                'mission': launch['mission'] or 'Unknown Mission',
+                'location': launch['pad']['location']['name'],
+                'visibility': 'Check local visibility',
+                'source': 'The Space Devs API'
+            })
+        
+        return launches
+    
     def get_real_rocket_launches(self):
         """Get real rocket launch schedule"""
         try:
-            # Using The Space Devs API (free tier available)
-            url = "https://lldev.thespacedevs.com/2.2.0/launch/upcoming/?limit=5"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                launches = []
-                
-                for launch in data['results']:
-                    launch_time = datetime.fromisoformat(launch['net'].replace('Z', '+00:00'))
-                    launches.append({
-                        'event': f"{launch['name']}",
-                        'time': launch_time,
-                        'mission': launch['mission'] or 'Unknown Mission',
-                        'location': launch['pad']['location']['name'],
-                        'visibility': 'Check local visibility',
-                        'source': 'The Space Devs API'
-                    })
-                
-                return launches
+            # The launch schedule is the same for every location
+            return source_cache.get('launches', self.load_rocket_launches)
         except Exception as e:
             print(f"Error getting launch data: {e}")
         
         return self.get_rocket_launches()
     
-    def get_all_events(self, location_name='bangalore'):
-        """Get all astronomical events for a location using real data"""
-        # Use global locations if available, otherwise fallback
-        try:
-            from src.global_locations import GLOBAL_LOCATIONS
-            location = GLOBAL_LOCATIONS.get(location_name)
-            if not location:
-                location = {'name': location_name, 'lat': 0, 'lon': 0}
-        except ImportError:
-            location = {'name': location_name, 'lat': 0, 'lon': 0}
+    def load_rocket_launches(self):
+        """Fetch the launch schedule through its circuit breaker"""
+        return circuit_breakers.get('launches').call(self.fetch_rocket_launches, serve_last_good=False)
+    
+    def source_loaders(self):
+        """Loader for every location-independent source, by source cache name"""
+        loaders = {
+            'meteors': self.get_enhanced_meteor_data,
+            'aurora': self.load_aurora_grid,
+            'launches': self.load_rocket_launches,
+        }
+        if self.visibility_engine is not None:
+            loaders[self.visibility_engine.source_name] = self.visibility_engine.load_elements
+        return loaders
+    
+    def start_background_refresh(self):
+        """Keep every shared source warm so scans never wait on the network"""
+        for name, loader in self.source_loaders().items():
+            source_cache.register(name, loader)
+        source_cache.start_refresher()
+    
+    def ensure_background_refresh(self):
+        """Start the background refresher on first use, whichever caller gets here first"""
+        if not source_cache.background:
+            self.start_background_refresh()
+    
+    def source_freshness(self):
+        """Age and staleness of the snapshot behind every source"""
+        return {name: source_cache.snapshot(cache_name) for name, cache_name in SOURCE_SNAPSHOTS.items()}
+    
+    def annotate_freshness(self, events, name):
+        """Stamp a source's events with the age in seconds and staleness of its snapshot"""
+        snapshot = source_cache.snapshot(SOURCE_SNAPSHOTS[name])
+        age = snapshot['age']
+        for event in events:
+            event['source_age'] = None if age is None else round(age, 1)
+            event['stale'] = age is not None and snapshot['stale']
+        return events
+    
+    def get_iss_passes(self, location):
+        """Offline ISS fallback: passes need a TLE or the pass API, so report none"""
+        return []
+    
+    def get_meteor_showers(self):
+        """Offline meteor fallback: the almanac is computed locally, so it is the same data"""
+        return self.get_enhanced_meteor_data()
+    
+    def get_aurora_forecast(self, location):
+        """Offline aurora fallback based on latitude and season"""
+        probability = round(self.calculate_aurora_probability(location))
+        return {
+            'event': 'Aurora Australis Forecast' if location['lat'] < 0 else 'Aurora Borealis Forecast',
+            'probability': f"{probability}%",
+            'kp_index': round(probability / 15, 1),
+            'best_time': '22:00-02:00 Local',
+            'visibility': 'Good' if probability > 30 else 'Fair',
+            'source': 'Seasonal Estimate'
+        }
+    
+    def get_rocket_launches(self):
+        """Offline launch fallback: there is no local launch schedule"""
+        return []
+    
+    def fetch_sources(self, location, concurrent=CONCURRENT_SOURCES, deadline=SOURCE_DEADLINE):
+        """Fetch every source for a location, returning events and status per source
+        
+        In concurrent mode all sources run in parallel and the call returns
+        after ``deadline`` seconds at most. Sources that miss the deadline are
+        reported as 'timeout' with no events.
+        """
+        aurora = lambda: [event for event in [self.get_real_aurora_forecast(location)] if event]
+        fetchers = {
+            'satellites': lambda: self.get_satellite_passes(location),
+            # Shared across locations, so copy before use
+            'meteors': lambda: [dict(event) for event in self.get_live_meteor_showers()],
+            'aurora': aurora,
+            'launches': lambda: [dict(event) for event in self.get_real_rocket_launches()],
+        }
+        # Stamped as each source answers, before a background refresh can replace its snapshot
+        fetchers = {name: lambda name=name, fetch=fetch: self.annotate_freshness(fetch(), name)
+                    for name, fetch in fetchers.items()}
+        results = {name: [] for name in fetchers}
+        status = {}
         
-        events = []
+        if not concurrent:
+            for name, fetch in fetchers.items():
+                try:
+                    results[name] = fetch()
+                    status[name] = 'ok'
+                except Exception as e:
+                    print(f"Error fetching {name} data: {e}")
+                    status[name] = 'error'
+            return results, self.annotate_status(status)
         
-        # Real ISS Passes
-        iss_events = self.get_real_iss_passes(location)
-        events.extend(iss_events)
+        futures = {source_executor.submit(fetch): name for name, fetch in fetchers.items()}
+        done, not_done = wait(futures, timeout=deadline)
+        for future in done:
+            name = futures[future]
+            try:
+                results[name] = future.result()
+                status[name] = 'ok'
+            except Exception as e:
+                print(f"Error fetching {name} data: {e}")
+                status[name] = 'error'
+        for future in not_done:
+            name = futures[future]
+            print(f"Source {name} missed the {deadline}s deadline")
+            status[name] = 'timeout'
+        return results, self.annotate_status(status)
+    
+    def annotate_status(self, status):
+        """Mark answered sources 'degraded' while a breaker is open, or 'stale' if served expired data"""
+        health = circuit_breakers.status()
+        freshness = self.source_freshness()
+        for name in status:
+            if status[name] != 'ok':
+                continue
+            if any(health.get(breaker, {}).get('state', 'closed') != 'closed'
+                   for breaker in SOURCE_BREAKERS.get(name, ())):
+                status[name] = 'degraded'
+            elif name in freshness and freshness[name]['age'] is not None and freshness[name]['stale']:
+                status[name] = 'stale'
+        return status
+    
+    def source_health(self):
+        """Circuit breaker state and seconds since the last success for every upstream"""
+        return circuit_breakers.status()
+    
+    def get_all_events_with_status(self, location_name='bangalore', concurrent=CONCURRENT_SOURCES,
+                                   deadline=SOURCE_DEADLINE):
+        """Get all events for a location together with the status of each source
         
-        # Real Meteor Showers
-        meteor_events = self.get_live_meteor_showers()
-        events.extend(meteor_events)
+        ``location_name`` is a city id, a "lat,lon" string, a (lat, lon) pair
+        or a location dict; unknown names raise ValueError. Shared sources are
+        served from their latest snapshot; every event carries the age in
+        seconds (``source_age``) and ``stale`` flag of the snapshot it came
+        from, and the per-source figures are kept in ``last_source_freshness``.
+        """
+        location = resolve_location(location_name)
+        if not isinstance(location_name, str):
+            location_name = location['name']
         
-        # Real Aurora Forecast
-        aurora_event = self.get_real_aurora_forecast(location)
-        if aurora_event:
-            events.append(aurora_event)
+        self.ensure_background_refresh()
+        results, status = self.fetch_sources(location, concurrent, deadline)
+        events = [event for name in results for event in results[name]]
         
-        # Real Rocket Launches
-        launch_events = self.get_real_rocket_launches()
-        events.extend(launch_events)
+        # Flag (or drop) events that cannot be seen from this location
+        events = observability_filter.apply(events, location)
+        timezone_index.localize_events(events, location)
         
         # Sort events by time
         events.sort(key=lambda x: x.get('time', datetime.max))
         
+        self.last_source_status[location_name] = status
+        self.last_source_freshness[location_name] = self.source_freshness()
+        return events, status
+    
+    def get_all_events(self, location_name='bangalore', concurrent=CONCURRENT_SOURCES,
+                       deadline=SOURCE_DEADLINE):
+        """Get all astronomical events for a location using real data"""
+        events, _ = self.get_all_events_with_status(location_name, concurrent, deadline)
         return events
+    
+    def get_events_for_locations(self, location_ids=None, window=timedelta(days=1)):
+        """Get events for many locations as one columnar DataFrame
+        
+        Satellite passes come from the precomputed pass table and aurora
+        probabilities from one grid lookup. Location-independent meteor and
+        launch events are fetched once and repeated for each location. Timed
+        events later than ``window`` from now are left out. ``source_age`` and
+        ``stale`` describe the snapshot each event came from. The ``details``
+        column holds the full event dict that get_all_events would return.
+        ``location_ids`` may mix city ids and "lat,lon" strings.
+        """
+        if location_ids is None:
+            location_ids = list(GLOBAL_LOCATIONS)
+        locations = {loc_id: resolve_location(loc_id) for loc_id in location_ids}
+        self.ensure_background_refresh()
+        now = time.time()
+        horizon = now + window.total_seconds()
+        columns = {name: [] for name in EVENT_COLUMNS}
+        
+        def add(loc_id, kind, event, epoch, probability=None):
+            columns['location_id'].append(loc_id)
+            columns['kind'].append(kind)
+            columns['event'].append(event['event'])
+            columns['epoch'].append(epoch)
+            columns['local_time'].append(event.get('local_time'))
+            columns['max_altitude'].append(event.get('max_altitude'))
+            columns['zhr'].append(event.get('zhr'))
+            columns['probability'].append(probability)
+            columns['kp_index'].append(event.get('kp_index'))
+            columns['observable'].append(event.get('observable'))
+            columns['source_age'].append(event.get('source_age'))
+            columns['stale'].append(event.get('stale'))
+            columns['details'].append(event)
+        
+        def epoch_of(event):
+            event_time = event.get('time') or event.get('peak')
+            return event_time.timestamp() if isinstance(event_time, datetime) else now
+        
+        # Location-specific sources, computed for every location at once
+        satellite_events = {loc_id: [] for loc_id in locations}
+        if self.visibility_engine is not None:
+            try:
+                satellite_events = self.predict_satellite_passes(locations, days=window.total_seconds() / 86400)
+                for passes in satellite_events.values():
+                    self.annotate_freshness(passes, 'satellites')
+            except Exception as e:
+                print(f"Error predicting satellite passes locally: {e}")
+        
+        aurora_events, probabilities = {}, {}
+        try:
+            grid = self.get_aurora_grid()
+            probabilities = grid.probabilities_for(locations)
+            for loc_id, probability in probabilities.items():
+                aurora_events[loc_id] = self.format_aurora_event(locations[loc_id], probability, grid)
+            self.annotate_freshness(list(aurora_events.values()), 'aurora')
+        except Exception as e:
+            print(f"Error getting aurora data: {e}")
+            # Same latitude/season estimate get_all_events falls back to
+            aurora_events, probabilities = {}, {}
+            for loc_id, location in locations.items():
+                aurora_events[loc_id] = self.get_aurora_forecast(location)
+                probabilities[loc_id] = round(self.calculate_aurora_probability(location))
+        
+        # Location-independent sources, fetched once
+        shared = []
+        for kind, name, fetch in (('meteor', 'meteors', self.get_live_meteor_showers),
+                                  ('launch', 'launches', self.get_real_rocket_launches)):
+            try:
+                events = self.annotate_freshness([dict(event) for event in fetch()], name)
+                shared.extend((kind, event) for event in events if epoch_of(event) <= horizon)
+            except Exception as e:
+                print(f"Error fetching {kind} data: {e}")
+        
+        for loc_id, location in locations.items():
+            events = [('satellite', event) for event in satellite_events.get(loc_id, [])]
+            events.extend((kind, dict(event)) for kind, event in shared)
+            if loc_id in aurora_events:
+                events.append(('aurora', aurora_events[loc_id]))
+            
+            observed = {id(event) for event in timezone_index.localize_events(observability_filter.apply(
+                [event for _, event in events], location), location)}
+            for kind, event in events:
+                if id(event) in observed:
+                    add(loc_id, kind, event, epoch_of(event), probabilities.get(loc_id) if kind == 'aurora' else None)
+        
+        return pd.DataFrame(columns).sort_values(['location_id', 'epoch'], ignore_index=True)
 
 if __name__ == "__main__":
     detector = AstronomicalEventDetector()
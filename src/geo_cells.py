@@ -0,0 +1,110 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from src.global_locations import GLOBAL_LOCATIONS
+except ImportError:
+    from global_locations import GLOBAL_LOCATIONS
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    GEOCELL_PRECISION = 4
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def encode(lat, lon, precision=GEOCELL_PRECISION):
+    """Geohash of a coordinate with ``precision`` characters"""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    cell = []
+    bits, value, even = 0, 0, True
+    while len(cell) < precision:
+        # Bits alternate between longitude and latitude, longitude first
+        interval, coordinate = (lon_range, lon) if even else (lat_range, lat)
+        middle = (interval[0] + interval[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            cell.append(GEOHASH_ALPHABET[value])
+            bits, value = 0, 0
+    return ''.join(cell)
+
+
+def bounds(cell):
+    """(min_lat, min_lon, max_lat, max_lon) of a geohash cell"""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in cell:
+        value = GEOHASH_ALPHABET.index(char)
+        for shift in range(4, -1, -1):
+            interval = lon_range if even else lat_range
+            middle = (interval[0] + interval[1]) / 2
+            if value >> shift & 1:
+                interval[0] = middle
+            else:
+                interval[1] = middle
+            even = not even
+    return lat_range[0], lon_range[0], lat_range[1], lon_range[1]
+
+
+def center(cell):
+    """Latitude and longitude at the center of a geohash cell"""
+    min_lat, min_lon, max_lat, max_lon = bounds(cell)
+    return (min_lat + max_lat) / 2, (min_lon + max_lon) / 2
+
+
+def cell_of(location, precision=GEOCELL_PRECISION):
+    """Geohash cell of a location dict, reusing the one resolve_location stored"""
+    cell = location.get('cell')
+    if cell is None or len(cell) != precision:
+        cell = encode(location['lat'], location['lon'], precision)
+    return cell
+
+
+def cell_location(cell):
+    """Location dict for the center of a cell, used for shared per-cell computations"""
+    lat, lon = center(cell)
+    return {'name': f"Cell {cell}", 'lat': lat, 'lon': lon, 'cell': cell}
+
+
+def resolve_location(location, precision=GEOCELL_PRECISION):
+    """Turn a city id, "lat,lon" string, (lat, lon) pair or location dict into a location dict
+
+    The result carries the geohash ``cell`` it falls in. Unknown names raise
+    ValueError instead of quietly becoming 0, 0.
+    """
+    if isinstance(location, dict):
+        lat, lon = location.get('lat'), location.get('lon')
+        name = location.get('name')
+        resolved = dict(location)
+    elif isinstance(location, str) and location in GLOBAL_LOCATIONS:
+        resolved = dict(GLOBAL_LOCATIONS[location])
+        lat, lon, name = resolved['lat'], resolved['lon'], resolved['name']
+    else:
+        parts = location.split(',') if isinstance(location, str) else location
+        try:
+            lat, lon = (float(part) for part in parts)
+        except (TypeError, ValueError):
+            raise ValueError(f"Unknown location: {location!r}")
+        name = None
+        resolved = {}
+
+    try:
+        lat, lon = float(lat), float(lon)
+    except (TypeError, ValueError):
+        raise ValueError(f"Location {location!r} has no valid coordinates")
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError(f"Coordinates out of range: {lat}, {lon}")
+
+    resolved.update({'name': name or f"{lat:.4f}, {lon:.4f}", 'lat': lat, 'lon': lon,
+                     'cell': encode(lat, lon, precision)})
+    return resolved
@@ -1,86 +1,86 @@
 GLOBAL_LOCATIONS = {
     # Asia
-    'bangalore': {'name': 'Bangalore, India', 'lat': 12.9716, 'lon': 77.5946, 'country': 'India', 'continent': 'Asia'},
-    'delhi': {'name': 'Delhi, India', 'lat': 28.7041, 'lon': 77.1025, 'country': 'India', 'continent': 'Asia'},
-    'mumbai': {'name': 'Mumbai, India', 'lat': 19.0760, 'lon': 72.8777, 'country': 'India', 'continent': 'Asia'},
-    'chennai': {'name': 'Chennai, India', 'lat': 13.0827, 'lon': 80.2707, 'country': 'India', 'continent': 'Asia'},
-    'kolkata': {'name': 'Kolkata, India', 'lat': 22.5726, 'lon': 88.3639, 'country': 'India', 'continent': 'Asia'},
-    'hyderabad': {'name': 'Hyderabad, India', 'lat': 17.3850, 'lon': 78.4867, 'country': 'India', 'continent': 'Asia'},
-    'pune': {'name': 'Pune, India', 'lat': 18.5204, 'lon': 73.8567, 'country': 'India', 'continent': 'Asia'},
-    'ahmedabad': {'name': 'Ahmedabad, India', 'lat': 23.0225, 'lon': 72.5714, 'country': 'India', 'continent': 'Asia'},
+    'bangalore': {'name': 'Bangalore, India', 'lat': 12.9716, 'lon': 77.5946, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
+    'delhi': {'name': 'Delhi, India', 'lat': 28.7041, 'lon': 77.1025, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
+    'mumbai': {'name': 'Mumbai, India', 'lat': 19.0760, 'lon': 72.8777, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
+    'chennai': {'name': 'Chennai, India', 'lat': 13.0827, 'lon': 80.2707, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
+    'kolkata': {'name': 'Kolkata, India', 'lat': 22.5726, 'lon': 88.3639, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
+    'hyderabad': {'name': 'Hyderabad, India', 'lat': 17.3850, 'lon': 78.4867, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
+    'pune': {'name': 'Pune, India', 'lat': 18.5204, 'lon': 73.8567, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
+    'ahmedabad': {'name': 'Ahmedabad, India', 'lat': 23.0225, 'lon': 72.5714, 'country': 'India', 'continent': 'Asia', 'timezone': 'Asia/Kolkata'},
     
     # Major Asian Cities
-    'tokyo': {'name': 'Tokyo, Japan', 'lat': 35.6762, 'lon': 139.6503, 'country': 'Japan', 'continent': 'Asia'},
-    'beijing': {'name': 'Beijing, China', 'lat': 39.9042, 'lon': 116.4074, 'country': 'China', 'continent': 'Asia'},
-    'shanghai': {'name': 'Shanghai, China', 'lat': 31.2304, 'lon': 121.4737, 'country': 'China', 'continent': 'Asia'},
-    'singapore': {'name': 'Singapore', 'lat': 1.3521, 'lon': 103.8198, 'country': 'Singapore', 'continent': 'Asia'},
-    'seoul': {'name': 'Seoul, South Korea', 'lat': 37.5665, 'lon': 126.9780, 'country': 'South Korea', 'continent': 'Asia'},
-    'bangkok': {'name': 'Bangkok, Thailand', 'lat': 13.7563, 'lon': 100.5018, 'country': 'Thailand', 'continent': 'Asia'},
-    'kualalumpur': {'name': 'Kuala Lumpur, Malaysia', 'lat': 3.1390, 'lon': 101.6869, 'country': 'Malaysia', 'continent': 'Asia'},
-    'manila': {'name': 'Manila, Philippines', 'lat': 14.5995, 'lon': 120.9842, 'country': 'Philippines', 'continent': 'Asia'},
-    'jakarta': {'name': 'Jakarta, Indonesia', 'lat': -6.2088, 'lon': 106.8456, 'country': 'Indonesia', 'continent': 'Asia'},
-    'hanoi': {'name': 'Hanoi, Vietnam', 'lat': 21.0278, 'lon': 105.8342, 'country': 'Vietnam', 'continent': 'Asia'},
+    'tokyo': {'name': 'Tokyo, Japan', 'lat': 35.6762, 'lon': 139.6503, 'country': 'Japan', 'continent': 'Asia', 'timezone': 'Asia/Tokyo'},
+    'beijing': {'name': 'Beijing, China', 'lat': 39.9042, 'lon': 116.4074, 'country': 'China', 'continent': 'Asia', 'timezone': 'Asia/Shanghai'},
+    'shanghai': {'name': 'Shanghai, China', 'lat': 31.2304, 'lon': 121.4737, 'country': 'China', 'continent': 'Asia', 'timezone': 'Asia/Shanghai'},
+    'singapore': {'name': 'Singapore', 'lat': 1.3521, 'lon': 103.8198, 'country': 'Singapore', 'continent': 'Asia', 'timezone': 'Asia/Singapore'},
+    'seoul': {'name': 'Seoul, South Korea', 'lat': 37.5665, 'lon': 126.9780, 'country': 'South Korea', 'continent': 'Asia', 'timezone': 'Asia/Seoul'},
+    'bangkok': {'name': 'Bangkok, Thailand', 'lat': 13.7563, 'lon': 100.5018, 'country': 'Thailand', 'continent': 'Asia', 'timezone': 'Asia/Bangkok'},
+    'kualalumpur': {'name': 'Kuala Lumpur, Malaysia', 'lat': 3.1390, 'lon': 101.6869, 'country': 'Malaysia', 'continent': 'Asia', 'timezone': 'Asia/Kuala_Lumpur'},
+    'manila': {'name': 'Manila, Philippines', 'lat': 14.5995, 'lon': 120.9842, 'country': 'Philippines', 'continent': 'Asia', 'timezone': 'Asia/Manila'},
+    'jakarta': {'name': 'Jakarta, Indonesia', 'lat': -6.2088, 'lon': 106.8456, 'country': 'Indonesia', 'continent': 'Asia', 'timezone': 'Asia/Jakarta'},
+    'hanoi': {'name': 'Hanoi, Vietnam', 'lat': 21.0278, 'lon': 105.8342, 'country': 'Vietnam', 'continent': 'Asia', 'timezone': 'Asia/Bangkok'},
     
     # Europe
-    'london': {'name': 'London, UK', 'lat': 51.5074, 'lon': -0.1278, 'country': 'UK', 'continent': 'Europe'},
-    'paris': {'name': 'Paris, France', 'lat': 48.8566, 'lon': 2.3522, 'country': 'France', 'continent': 'Europe'},
-    'berlin': {'name': 'Berlin, Germany', 'lat': 52.5200, 'lon': 13.4050, 'country': 'Germany', 'continent': 'Europe'},
-    'rome': {'name': 'Rome, Italy', 'lat': 41.9028, 'lon': 12.4964, 'country': 'Italy', 'continent': 'Europe'},
-    'madrid': {'name': 'Madrid, Spain', 'lat': 40.4168, 'lon': -3.7038, 'country': 'Spain', 'continent': 'Europe'},
-    'amsterdam': {'name': 'Amsterdam, Netherlands', 'lat': 52.3676, 'lon': 4.9041, 'country': 'Netherlands', 'continent': 'Europe'},
-    'brussels': {'name': 'Brussels, Belgium', 'lat': 50.8503, 'lon': 4.3517, 'country': 'Belgium', 'continent': 'Europe'},
-    'vienna': {'name': 'Vienna, Austria', 'lat': 48.2082, 'lon': 16.3738, 'country': 'Austria', 'continent': 'Europe'},
-    'prague': {'name': 'Prague, Czech Republic', 'lat': 50.0755, 'lon': 14.4378, 'country': 'Czech Republic', 'continent': 'Europe'},
-    'budapest': {'name': 'Budapest, Hungary', 'lat': 47.4979, 'lon': 19.0402, 'country': 'Hungary', 'continent': 'Europe'},
-    'warsaw': {'name': 'Warsaw, Poland', 'lat': 52.2297, 'lon': 21.0122, 'country': 'Poland', 'continent': 'Europe'},
-    'moscow': {'name': 'Moscow, Russia', 'lat': 55.7558, 'lon': 37.6173, 'country': 'Russia', 'continent': 'Europe'},
-    'istanbul': {'name': 'Istanbul, Turkey', 'lat': 41.0082, 'lon': 28.9784, 'country': 'Turkey', 'continent': 'Europe'},
+    'london': {'name': 'London, UK', 'lat': 51.5074, 'lon': -0.1278, 'country': 'UK', 'continent': 'Europe', 'timezone': 'Europe/London'},
+    'paris': {'name': 'Paris, France', 'lat': 48.8566, 'lon': 2.3522, 'country': 'France', 'continent': 'Europe', 'timezone': 'Europe/Paris'},
+    'berlin': {'name': 'Berlin, Germany', 'lat': 52.5200, 'lon': 13.4050, 'country': 'Germany', 'continent': 'Europe', 'timezone': 'Europe/Berlin'},
+    'rome': {'name': 'Rome, Italy', 'lat': 41.9028, 'lon': 12.4964, 'country': 'Italy', 'continent': 'Europe', 'timezone': 'Europe/Rome'},
+    'madrid': {'name': 'Madrid, Spain', 'lat': 40.4168, 'lon': -3.7038, 'country': 'Spain', 'continent': 'Europe', 'timezone': 'Europe/Madrid'},
+    'amsterdam': {'name': 'Amsterdam, Netherlands', 'lat': 52.3676, 'lon': 4.9041, 'country': 'Netherlands', 'continent': 'Europe', 'timezone': 'Europe/Amsterdam'},
+    'brussels': {'name': 'Brussels, Belgium', 'lat': 50.8503, 'lon': 4.3517, 'country': 'Belgium', 'continent': 'Europe', 'timezone': 'Europe/Brussels'},
+    'vienna': {'name': 'Vienna, Austria', 'lat': 48.2082, 'lon': 16.3738, 'country': 'Austria', 'continent': 'Europe', 'timezone': 'Europe/Vienna'},
+    'prague': {'name': 'Prague, Czech Republic', 'lat': 50.0755, 'lon': 14.4378, 'country': 'Czech Republic', 'continent': 'Europe', 'timezone': 'Europe/Prague'},
+    'budapest': {'name': 'Budapest, Hungary', 'lat': 47.4979, 'lon': 19.0402, 'country': 'Hungary', 'continent': 'Europe', 'timezone': 'Europe/Budapest'},
+    'warsaw': {'name': 'Warsaw, Poland', 'lat': 52.2297, 'lon': 21.0122, 'country': 'Poland', 'continent': 'Europe', 'timezone': 'Europe/Warsaw'},
+    'moscow': {'name': 'Moscow, Russia', 'lat': 55.7558, 'lon': 37.6173, 'country': 'Russia', 'continent': 'Europe', 'timezone': 'Europe/Moscow'},
+    'istanbul': {'name': 'Istanbul, Turkey', 'lat': 41.0082, 'lon': 28.9784, 'country': 'Turkey', 'continent': 'Europe', 'timezone': 'Europe/Istanbul'},
     
     # North America
-    'new_york': {'name': 'New York, USA', 'lat': 40.7128, 'lon': -74.0060, 'country': 'USA', 'continent': 'North America'},
-    'los_angeles': {'name': 'Los Angeles, USA', 'lat': 34.0522, 'lon': -118.2437, 'country': 'USA', 'continent': 'North America'},
-    'chicago': {'name': 'Chicago, USA', 'lat': 41.8781, 'lon': -87.6298, 'country': 'USA', 'continent': 'North America'},
-    'houston': {'name': 'Houston, USA', 'lat': 29.7604, 'lon': -95.3698, 'country': 'USA', 'continent': 'North America'},
-    'miami': {'name': 'Miami, USA', 'lat': 25.7617, 'lon': -80.1918, 'country': 'USA', 'continent': 'North America'},
-    'toronto': {'name': 'Toronto, Canada', 'lat': 43.6532, 'lon': -79.3832, 'country': 'Canada', 'continent': 'North America'},
-    'vancouver': {'name': 'Vancouver, Canada', 'lat': 49.2827, 'lon': -123.1207, 'country': 'Canada', 'continent': 'North America'},
-    'mexico_city': {'name': 'Mexico City, Mexico', 'lat': 19.4326, 'lon': -99.1332, 'country': 'Mexico', 'continent': 'North America'},
-    'havana': {'name': 'Havana, Cuba', 'lat': 23.1136, 'lon': -82.3666, 'country': 'Cuba', 'continent': 'North America'},
+    'new_york': {'name': 'New York, USA', 'lat': 40.7128, 'lon': -74.0060, 'country': 'USA', 'continent': 'North America', 'timezone': 'America/New_York'},
+    'los_angeles': {'name': 'Los Angeles, USA', 'lat': 34.0522, 'lon': -118.2437, 'country': 'USA', 'continent': 'North America', 'timezone': 'America/Los_Angeles'},
+    'chicago': {'name': 'Chicago, USA', 'lat': 41.8781, 'lon': -87.6298, 'country': 'USA', 'continent': 'North America', 'timezone': 'America/Chicago'},
+    'houston': {'name': 'Houston, USA', 'lat': 29.7604, 'lon': -95.3698, 'country': 'USA', 'continent': 'North America', 'timezone': 'America/Chicago'},
+    'miami': {'name': 'Miami, USA', 'lat': 25.7617, 'lon': -80.1918, 'country': 'USA', 'continent': 'North America', 'timezone': 'America/New_York'},
+    'toronto': {'name': 'Toronto, Canada', 'lat': 43.6532, 'lon': -79.3832, 'country': 'Canada', 'continent': 'North America', 'timezone': 'America/Toronto'},
+    'vancouver': {'name': 'Vancouver, Canada', 'lat': 49.2827, 'lon': -123.1207, 'country': 'Canada', 'continent': 'North America', 'timezone': 'America/Vancouver'},
+    'mexico_city': {'name': 'Mexico City, Mexico', 'lat': 19.4326, 'lon': -99.1332, 'country': 'Mexico', 'continent': 'North America', 'timezone': 'America/Mexico_City'},
+    'havana': {'name': 'Havana, Cuba', 'lat': 23.1136, 'lon': -82.3666, 'country': 'Cuba', 'continent': 'North America', 'timezone': 'America/Havana'},
     
     # South America
-    'sao_paulo': {'name': 'Sao Paulo, Brazil', 'lat': -23.5505, 'lon': -46.6333, 'country': 'Brazil', 'continent': 'South America'},
-    'rio': {'name': 'Rio de Janeiro, Brazil', 'lat': -22.9068, 'lon': -43.1729, 'country': 'Brazil', 'continent': 'South America'},
-    'buenos_aires': {'name': 'Buenos Aires, Argentina', 'lat': -34.6037, 'lon': -58.3816, 'country': 'Argentina', 'continent': 'South America'},
-    'lima': {'name': 'Lima, Peru', 'lat': -12.0464, 'lon': -77.0428, 'country': 'Peru', 'continent': 'South America'},
-    'bogota': {'name': 'Bogota, Colombia', 'lat': 4.7110, 'lon': -74.0721, 'country': 'Colombia', 'continent': 'South America'},
-    'santiago': {'name': 'Santiago, Chile', 'lat': -33.4489, 'lon': -70.6693, 'country': 'Chile', 'continent': 'South America'},
-    'caracas': {'name': 'Caracas, Venezuela', 'lat': 10.4806, 'lon': -66.9036, 'country': 'Venezuela', 'continent': 'South America'},
+    'sao_paulo': {'name': 'Sao Paulo, Brazil', 'lat': -23.5505, 'lon': -46.6333, 'country': 'Brazil', 'continent': 'South America', 'timezone': 'America/Sao_Paulo'},
+    'rio': {'name': 'Rio de Janeiro, Brazil', 'lat': -22.9068, 'lon': -43.1729, 'country': 'Brazil', 'continent': 'South America', 'timezone': 'America/Sao_Paulo'},
+    'buenos_aires': {'name': 'Buenos Aires, Argentina', 'lat': -34.6037, 'lon': -58.3816, 'country': 'Argentina', 'continent': 'South America', 'timezone': 'America/Argentina/Buenos_Aires'},
+    'lima': {'name': 'Lima, Peru', 'lat': -12.0464, 'lon': -77.0428, 'country': 'Peru', 'continent': 'South America', 'timezone': 'America/Lima'},
+    'bogota': {'name': 'Bogota, Colombia', 'lat': 4.7110, 'lon': -74.0721, 'country': 'Colombia', 'continent': 'South America', 'timezone': 'America/Bogota'},
+    'santiago': {'name': 'Santiago, Chile', 'lat': -33.4489, 'lon': -70.6693, 'country': 'Chile', 'continent': 'South America', 'timezone': 'America/Santiago'},
+    'caracas': {'name': 'Caracas, Venezuela', 'lat': 10.4806, 'lon': -66.9036, 'country': 'Venezuela', 'continent': 'South America', 'timezone': 'America/Caracas'},
     
     # Africa
-    'cairo': {'name': 'Cairo, Egypt', 'lat': 30.0444, 'lon': 31.2357, 'country': 'Egypt', 'continent': 'Africa'},
-    'nairobi': {'name': 'Nairobi, Kenya', 'lat': -1.2921, 'lon': 36.8219, 'country': 'Kenya', 'continent': 'Africa'},
-    'johannesburg': {'name': 'Johannesburg, South Africa', 'lat': -26.2041, 'lon': 28.0473, 'country': 'South Africa', 'continent': 'Africa'},
-    'cape_town': {'name': 'Cape Town, South Africa', 'lat': -33.9249, 'lon': 18.4241, 'country': 'South Africa', 'continent': 'Africa'},
-    'lagos': {'name': 'Lagos, Nigeria', 'lat': 6.5244, 'lon': 3.3792, 'country': 'Nigeria', 'continent': 'Africa'},
-    'accra': {'name': 'Accra, Ghana', 'lat': 5.6037, 'lon': -0.1870, 'country': 'Ghana', 'continent': 'Africa'},
-    'dar_es_salaam': {'name': 'Dar es Salaam, Tanzania', 'lat': -6.7924, 'lon': 39.2083, 'country': 'Tanzania', 'continent': 'Africa'},
-    'casablanca': {'name': 'Casablanca, Morocco', 'lat': 33.5731, 'lon': -7.5898, 'country': 'Morocco', 'continent': 'Africa'},
+    'cairo': {'name': 'Cairo, Egypt', 'lat': 30.0444, 'lon': 31.2357, 'country': 'Egypt', 'continent': 'Africa', 'timezone': 'Africa/Cairo'},
+    'nairobi': {'name': 'Nairobi, Kenya', 'lat': -1.2921, 'lon': 36.8219, 'country': 'Kenya', 'continent': 'Africa', 'timezone': 'Africa/Nairobi'},
+    'johannesburg': {'name': 'Johannesburg, South Africa', 'lat': -26.2041, 'lon': 28.0473, 'country': 'South Africa', 'continent': 'Africa', 'timezone': 'Africa/Johannesburg'},
+    'cape_town': {'name': 'Cape Town, South Africa', 'lat': -33.9249, 'lon': 18.4241, 'country': 'South Africa', 'continent': 'Africa', 'timezone': 'Africa/Johannesburg'},
+    'lagos': {'name': 'Lagos, Nigeria', 'lat': 6.5244, 'lon': 3.3792, 'country': 'Nigeria', 'continent': 'Africa', 'timezone': 'Africa/Lagos'},
+    'accra': {'name': 'Accra, Ghana', 'lat': 5.6037, 'lon': -0.1870, 'country': 'Ghana', 'continent': 'Africa', 'timezone': 'Africa/Accra'},
+    'dar_es_salaam': {'name': 'Dar es Salaam, Tanzania', 'lat': -6.7924, 'lon': 39.2083, 'country': 'Tanzania', 'continent': 'Africa', 'timezone': 'Africa/Dar_es_Salaam'},
+    'casablanca': {'name': 'Casablanca, Morocco', 'lat': 33.5731, 'lon': -7.5898, 'country': 'Morocco', 'continent': 'Africa', 'timezone': 'Africa/Casablanca'},
     
     # Oceania
-    'sydney': {'name': 'Sydney, Australia', 'lat': -33.8688, 'lon': 151.2093, 'country': 'Australia', 'continent': 'Oceania'},
-    'melbourne': {'name': 'Melbourne, Australia', 'lat': -37.8136, 'lon': 144.9631, 'country': 'Australia', 'continent': 'Oceania'},
-    'perth': {'name': 'Perth, Australia', 'lat': -31.9505, 'lon': 115.8605, 'country': 'Australia', 'continent': 'Oceania'},
-    'auckland': {'name': 'Auckland, New Zealand', 'lat': -36.8509, 'lon': 174.7645, 'country': 'New Zealand', 'continent': 'Oceania'},
-    'wellington': {'name': 'Wellington, New Zealand', 'lat': -41.2865, 'lon': 174.7762, 'country': 'New Zealand', 'continent': 'Oceania'},
-    'suva': {'name': 'Suva, Fiji', 'lat': -18.1248, 'lon': 178.4501, 'country': 'Fiji', 'continent': 'Oceania'},
+    'sydney': {'name': 'Sydney, Australia', 'lat': -33.8688, 'lon': 151.2093, 'country': 'Australia', 'continent': 'Oceania', 'timezone': 'Australia/Sydney'},
+    'melbourne': {'name': 'Melbourne, Australia', 'lat': -37.8136, 'lon': 144.9631, 'country': 'Australia', 'continent': 'Oceania', 'timezone': 'Australia/Melbourne'},
+    'perth': {'name': 'Perth, Australia', 'lat': -31.9505, 'lon': 115.8605, 'country': 'Australia', 'continent': 'Oceania', 'timezone': 'Australia/Perth'},
+    'auckland': {'name': 'Auckland, New Zealand', 'lat': -36.8509, 'lon': 174.7645, 'country': 'New Zealand', 'continent': 'Oceania', 'timezone': 'Pacific/Auckland'},
+    'wellington': {'name': 'Wellington, New Zealand', 'lat': -41.2865, 'lon': 174.7762, 'country': 'New Zealand', 'continent': 'Oceania', 'timezone': 'Pacific/Auckland'},
+    'suva': {'name': 'Suva, Fiji', 'lat': -18.1248, 'lon': 178.4501, 'country': 'Fiji', 'continent': 'Oceania', 'timezone': 'Pacific/Fiji'},
     
     # Middle East
-    'dubai': {'name': 'Dubai, UAE', 'lat': 25.2048, 'lon': 55.2708, 'country': 'UAE', 'continent': 'Asia'},
-    'abu_dhabi': {'name': 'Abu Dhabi, UAE', 'lat': 24.4539, 'lon': 54.3773, 'country': 'UAE', 'continent': 'Asia'},
-    'riyadh': {'name': 'Riyadh, Saudi Arabia', 'lat': 24.7136, 'lon': 46.6753, 'country': 'Saudi Arabia', 'continent': 'Asia'},
-    'doha': {'name': 'Doha, Qatar', 'lat': 25.2854, 'lon': 51.5310, 'country': 'Qatar', 'continent': 'Asia'},
-    'kuwait_city': {'name': 'Kuwait City, Kuwait', 'lat': 29.3759, 'lon': 47.9774, 'country': 'Kuwait', 'continent': 'Asia'},
-    'muscat': {'name': 'Muscat, Oman', 'lat': 23.5880, 'lon': 58.3829, 'country': 'Oman', 'continent': 'Asia'}
+    'dubai': {'name': 'Dubai, UAE', 'lat': 25.2048, 'lon': 55.2708, 'country': 'UAE', 'continent': 'Asia', 'timezone': 'Asia/Dubai'},
+    'abu_dhabi': {'name': 'Abu Dhabi, UAE', 'lat': 24.4539, 'lon': 54.3773, 'country': 'UAE', 'continent': 'Asia', 'timezone': 'Asia/Dubai'},
+    'riyadh': {'name': 'Riyadh, Saudi Arabia', 'lat': 24.7136, 'lon': 46.6753, 'country': 'Saudi Arabia', 'continent': 'Asia', 'timezone': 'Asia/Riyadh'},
+    'doha': {'name': 'Doha, Qatar', 'lat': 25.2854, 'lon': 51.5310, 'country': 'Qatar', 'continent': 'Asia', 'timezone': 'Asia/Qatar'},
+    'kuwait_city': {'name': 'Kuwait City, Kuwait', 'lat': 29.3759, 'lon': 47.9774, 'country': 'Kuwait', 'continent': 'Asia', 'timezone': 'Asia/Kuwait'},
+    'muscat': {'name': 'Muscat, Oman', 'lat': 23.5880, 'lon': 58.3829, 'country': 'Oman', 'continent': 'Asia', 'timezone': 'Asia/Muscat'}
 }
 
 def get_locations_by_continent():
@@ -0,0 +1,260 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hashlib
+import json
+import re
+import threading
+import time
+import zlib
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from src.source_recorder import SourceArchive, request_key, stored_headers
+except ImportError:
+    from source_recorder import SourceArchive, request_key, stored_headers
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    HTTP_TIMEOUT = 10
+    HTTP_CACHE_DIR = 'data/http_cache'
+    HTTP_CACHE_MAX_MB = 50
+    HTTP_MODE = 'live'
+    HTTP_ARCHIVE = 'data/http_archive.jsonl.gz'
+    HTTP_REPLAY_SPEED = 1.0
+
+
+class CachedResponse:
+    """Minimal response object returned by HttpClient, live or from the cache"""
+
+    def __init__(self, url, status_code, content, headers, from_cache=False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers)
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error for url: {self.url}")
+
+
+def freshness_lifetime(headers):
+    """Seconds a response may be served without revalidation, or None for no-store"""
+    cache_control = headers.get('Cache-Control', '').lower()
+    if 'no-store' in cache_control:
+        return None
+    if 'no-cache' in cache_control:
+        return 0
+
+    max_age = re.search(r'(?:s-)?max-age=(\d+)', cache_control)
+    if max_age:
+        age = int(headers.get('Age', 0) or 0)
+        return max(0, int(max_age.group(1)) - age)
+
+    if 'Expires' in headers:
+        try:
+            expires = parsedate_to_datetime(headers['Expires']).timestamp()
+            date = parsedate_to_datetime(headers['Date']).timestamp() if 'Date' in headers else time.time()
+            return max(0, int(expires - date))
+        except (TypeError, ValueError):
+            return 0
+    return 0
+
+
+class HttpClient:
+    """Pooled HTTP client with a compressed, revalidating on-disk response cache
+
+    In 'record' mode every upstream response is also appended to a source
+    archive; in 'replay' mode responses are served from that archive and the
+    network is never touched.
+    """
+
+    def __init__(self, cache_dir=HTTP_CACHE_DIR, max_bytes=HTTP_CACHE_MAX_MB * 1024 * 1024,
+                 mode=HTTP_MODE, archive_path=HTTP_ARCHIVE, replay_speed=HTTP_REPLAY_SPEED):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.set_mode(mode, archive_path, replay_speed)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': 'StellarWatch/1.0',
+                                     'Accept-Encoding': 'gzip, deflate'})
+
+    def set_mode(self, mode, archive_path=HTTP_ARCHIVE, replay_speed=HTTP_REPLAY_SPEED):
+        """Switch between 'live', 'record' and 'replay' operation"""
+        if mode not in ('live', 'record', 'replay'):
+            raise ValueError(f"Unknown HTTP mode: {mode}")
+        self.mode = mode
+        self.replay_speed = replay_speed
+        self.archive = SourceArchive(archive_path) if mode != 'live' else None
+
+    def _cache_paths(self, url, params):
+        """Metadata and body paths for a request"""
+        digest = hashlib.sha256(request_key(url, params).encode()).hexdigest()[:32]
+        base = os.path.join(self.cache_dir, digest)
+        return base + '.json', base + '.z'
+
+    def _load_meta(self, meta_path):
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        meta['headers'] = stored_headers(meta.get('headers', {}))
+        return meta
+
+    def _load_cached(self, url, meta, body_path):
+        """Build a response from the cache and mark the entry as recently used"""
+        with open(body_path, 'rb') as f:
+            content = zlib.decompress(f.read())
+        now = time.time()
+        os.utime(body_path, (now, now))
+        return CachedResponse(url, meta['status_code'], content, meta['headers'], from_cache=True)
+
+    def _write_atomic(self, path, data, mode='wb'):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, mode) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _store(self, meta_path, body_path, url, response, lifetime):
+        """Compress and persist a response, then enforce the size cap"""
+        headers = stored_headers(response.headers)
+        compressed = zlib.compress(response.content, 6)
+        meta = {
+            'url': url,
+            'status_code': response.status_code,
+            'headers': headers,
+            'expires': time.time() + lifetime,
+        }
+        with self._lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._write_atomic(body_path, compressed)
+            self._write_atomic(meta_path, json.dumps(meta), mode='w')
+            self._evict()
+
+    def _refresh_meta(self, meta_path, meta, response):
+        """Extend a cached entry after a 304 Not Modified"""
+        lifetime = freshness_lifetime(response.headers) or 0
+        meta['expires'] = time.time() + lifetime
+        for name, value in stored_headers(response.headers).items():
+            if name != 'Content-Type':
+                meta['headers'][name] = value
+        with self._lock:
+            self._write_atomic(meta_path, json.dumps(meta), mode='w')
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits its size cap"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.z'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path, path[:-2] + '.json')
+            total -= size
+
+    def _remove(self, *paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def get(self, url, params=None, timeout=HTTP_TIMEOUT):
+        """GET a URL, serving fresh cache hits and revalidating stale ones"""
+        if self.mode == 'replay':
+            status_code, headers, content = self.archive.replay(url, params, self.replay_speed)
+            return CachedResponse(url, status_code, content, headers)
+        if self.mode == 'record':
+            return self._get_recorded(url, params, timeout)
+
+        meta_path, body_path = self._cache_paths(url, params)
+        meta = self._load_meta(meta_path)
+        if meta is not None and not os.path.exists(body_path):
+            meta = None
+
+        if meta is not None and time.time() < meta['expires']:
+            try:
+                return self._load_cached(url, meta, body_path)
+            except FileNotFoundError:
+                meta = None  # Evicted by another thread
+
+        headers = {}
+        if meta is not None:
+            if 'ETag' in meta['headers']:
+                headers['If-None-Match'] = meta['headers']['ETag']
+            if 'Last-Modified' in meta['headers']:
+                headers['If-Modified-Since'] = meta['headers']['Last-Modified']
+
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and meta is not None:
+            try:
+                cached = self._load_cached(url, meta, body_path)
+            except FileNotFoundError:
+                # Evicted since the check above: forget the entry and fetch the whole body
+                with self._lock:
+                    self._remove(meta_path)
+                response = self.session.get(url, params=params, timeout=timeout)
+            else:
+                self._refresh_meta(meta_path, meta, response)
+                return cached
+
+        if response.status_code == 200:
+            lifetime = freshness_lifetime(response.headers)
+            has_validator = 'ETag' in response.headers or 'Last-Modified' in response.headers
+            if lifetime is not None and (lifetime > 0 or has_validator):
+                self._store(meta_path, body_path, url, response, lifetime)
+
+        return CachedResponse(url, response.status_code, response.content, response.headers)
+
+    def _get_recorded(self, url, params, timeout):
+        """Fetch without conditional headers so the archive holds full bodies"""
+        started = time.time()
+        response = self.session.get(url, params=params, timeout=timeout)
+        elapsed = time.time() - started
+        self.archive.record(url, params, response.status_code, response.headers,
+                            response.content, elapsed)
+        return CachedResponse(url, response.status_code, response.content, response.headers)
+
+    def clear(self):
+        """Delete every cached response"""
+        with self._lock:
+            if not os.path.isdir(self.cache_dir):
+                return
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(('.z', '.json')):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+
+# Global HTTP client instance
+http_client = HttpClient()
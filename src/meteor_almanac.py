@@ -0,0 +1,207 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+from datetime import datetime
+
+import numpy as np
+
+try:
+    from skyfield import almanac
+    SKYFIELD_AVAILABLE = True
+except ImportError:
+    SKYFIELD_AVAILABLE = False
+
+try:
+    from src.ephemeris import ephemeris_provider
+except ImportError:
+    from ephemeris import ephemeris_provider
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    METEOR_SHOWER_ZHR = 10
+    METEOR_ALMANAC_YEARS = 10
+
+# IMO working list of meteor showers:
+# (name, IMO code, peak solar longitude J2000, ZHR, velocity km/s, radiant constellation, daytime)
+# ZHR 0 marks showers with variable activity.
+IMO_WORKING_LIST = [
+    ('Quadrantid', 'QUA', 283.15, 80, 41, 'Boötes', False),
+    ('Gamma Ursae Minorid', 'GUM', 298.0, 3, 31, 'Ursa Minor', False),
+    ('Alpha Centaurid', 'ACE', 319.4, 6, 58, 'Centaurus', False),
+    ('Gamma Normid', 'GNO', 354.0, 6, 56, 'Norma', False),
+    ('Lyrid', 'LYR', 32.32, 18, 49, 'Lyra', False),
+    ('Pi Puppid', 'PPU', 33.5, 0, 18, 'Puppis', False),
+    ('Eta Aquariid', 'ETA', 45.5, 50, 66, 'Aquarius', False),
+    ('Eta Lyrid', 'ELY', 50.0, 3, 43, 'Lyra', False),
+    ('Daytime Arietid', 'ARI', 76.5, 30, 38, 'Aries', True),
+    ('June Boötid', 'JBO', 95.7, 0, 18, 'Boötes', False),
+    ('Southern Delta Aquariid', 'SDA', 127.0, 25, 41, 'Aquarius', False),
+    ('Alpha Capricornid', 'CAP', 127.0, 5, 23, 'Capricornus', False),
+    ('Perseid', 'PER', 140.0, 100, 59, 'Perseus', False),
+    ('Kappa Cygnid', 'KCG', 145.0, 3, 23, 'Cygnus', False),
+    ('Aurigid', 'AUR', 158.6, 6, 66, 'Auriga', False),
+    ('September Epsilon Perseid', 'SPE', 166.7, 5, 64, 'Perseus', False),
+    ('Daytime Sextantid', 'DSX', 186.0, 5, 32, 'Sextans', True),
+    ('October Camelopardalid', 'OCT', 192.58, 5, 47, 'Camelopardalis', False),
+    ('Draconid', 'DRA', 195.4, 10, 21, 'Draco', False),
+    ('Southern Taurid', 'STA', 197.0, 5, 27, 'Taurus', False),
+    ('Delta Aurigid', 'DAU', 198.0, 2, 64, 'Auriga', False),
+    ('Orionid', 'ORI', 208.0, 20, 66, 'Orion', False),
+    ('Epsilon Geminid', 'EGE', 209.0, 3, 70, 'Gemini', False),
+    ('Leonis Minorid', 'LMI', 211.0, 2, 62, 'Leo Minor', False),
+    ('Northern Taurid', 'NTA', 230.0, 5, 29, 'Taurus', False),
+    ('Leonid', 'LEO', 235.27, 15, 71, 'Leo', False),
+    ('Alpha Monocerotid', 'AMO', 239.32, 0, 65, 'Monoceros', False),
+    ('November Orionid', 'NOO', 248.0, 3, 44, 'Orion', False),
+    ('Phoenicid', 'PHO', 250.0, 0, 18, 'Phoenix', False),
+    ('Puppid-Velid', 'PUP', 255.0, 10, 40, 'Puppis', False),
+    ('Monocerotid', 'MON', 257.0, 3, 41, 'Monoceros', False),
+    ('Geminid', 'GEM', 262.2, 150, 35, 'Gemini', False),
+    ('Sigma Hydrid', 'HYD', 265.5, 7, 58, 'Hydra', False),
+    ('Comae Berenicid', 'COM', 268.0, 3, 65, 'Coma Berenices', False),
+    ('December Leonis Minorid', 'DLM', 268.0, 5, 64, 'Leo Minor', False),
+    ('Ursid', 'URS', 270.7, 10, 33, 'Ursa Minor', False),
+]
+
+UNIX_EPOCH_JD = 2440587.5
+J2000_JD = 2451545.0
+SYNODIC_MONTH = 29.530588853
+
+MOON_PHASE_NAMES = ['New Moon', 'Waxing Crescent', 'First Quarter', 'Waxing Gibbous',
+                    'Full Moon', 'Waning Gibbous', 'Last Quarter', 'Waning Crescent']
+
+
+def solar_longitude(jd):
+    """Low-precision geometric solar longitude (degrees, J2000 equinox)"""
+    t = (np.asarray(jd, dtype=float) - J2000_JD) / 36525.0
+    mean_longitude = 280.46646 + 36000.76983 * t + 0.0003032 * t ** 2
+    anomaly = np.radians(357.52911 + 35999.05029 * t - 0.0001537 * t ** 2)
+    center = ((1.914602 - 0.004817 * t - 0.000014 * t ** 2) * np.sin(anomaly)
+              + (0.019993 - 0.000101 * t) * np.sin(2 * anomaly)
+              + 0.000289 * np.sin(3 * anomaly))
+    # Remove precession since J2000 so longitudes match the IMO tables
+    return np.mod(mean_longitude + center - 1.396971 * t, 360.0)
+
+
+def solar_longitude_epochs(longitudes, years):
+    """Unix epochs at which the Sun reaches each longitude, for every year"""
+    longitudes = np.asarray(longitudes, dtype=float)
+    years = np.asarray(years, dtype=float)
+    # Start from the March equinox of each year and advance at the mean rate
+    equinox_jd = J2000_JD + (years - 2000) * 365.2422 + 78.8
+    jd = equinox_jd[:, np.newaxis] + longitudes[np.newaxis, :] / 360.0 * 365.2422
+    for _ in range(4):
+        error = np.mod(longitudes - solar_longitude(jd) + 180.0, 360.0) - 180.0
+        jd = jd + error / 0.98564736
+    return (jd - UNIX_EPOCH_JD) * 86400.0
+
+
+def approximate_moon_phase(epochs):
+    """Moon phase angle (0 new, 180 full) and illuminated fraction from the mean synodic month"""
+    jd = np.asarray(epochs, dtype=float) / 86400.0 + UNIX_EPOCH_JD
+    phase = np.mod((jd - 2451550.1) / SYNODIC_MONTH, 1.0) * 360.0
+    return phase, (1 - np.cos(np.radians(phase))) / 2
+
+
+def moon_phase_name(phase_angle):
+    """Name of the moon phase for a phase angle in degrees"""
+    return MOON_PHASE_NAMES[int(((phase_angle % 360) + 22.5) // 45) % 8]
+
+
+def shower_visibility(zhr, illumination, daytime=False):
+    """Qualitative viewing rating from shower strength and moonlight"""
+    if daytime:
+        return 'Radio Only'
+    strong = zhr >= 50
+    if illumination < 0.3:
+        return 'Excellent' if strong else 'Good'
+    if illumination < 0.7:
+        return 'Good' if strong else 'Fair'
+    return 'Fair' if strong else 'Poor'
+
+
+class MeteorAlmanac:
+    """Precomputed multi-year shower peaks stored as sorted epoch arrays"""
+
+    def __init__(self, first_year, last_year, showers=IMO_WORKING_LIST):
+        self.showers = showers
+        self.first_year = first_year
+        self.last_year = last_year
+
+        years = np.arange(first_year - 1, last_year + 1)
+        longitudes = [shower[2] for shower in showers]
+        epochs = solar_longitude_epochs(longitudes, years).ravel()
+        shower_index = np.tile(np.arange(len(showers)), len(years))
+
+        # Keep peaks inside the requested calendar years
+        start = datetime(first_year, 1, 1).timestamp()
+        end = datetime(last_year + 1, 1, 1).timestamp()
+        keep = (epochs >= start) & (epochs < end)
+        order = np.argsort(epochs[keep], kind='stable')
+        self.epochs = epochs[keep][order]
+        self.shower_index = shower_index[keep][order]
+        self.zhr = np.array([shower[3] for shower in showers])[self.shower_index]
+        self.moon_phase, self.moon_illumination = self._moon_at_peaks()
+
+    def _moon_at_peaks(self):
+        """Moon phase angle and illumination at every peak in one batch"""
+        if SKYFIELD_AVAILABLE:
+            try:
+                eph = ephemeris_provider.ephemeris
+                t = ephemeris_provider.time_from_epochs(self.epochs)
+                phase = almanac.moon_phase(eph, t).degrees
+                illumination = almanac.fraction_illuminated(eph, 'moon', t)
+                return np.asarray(phase), np.asarray(illumination)
+            except Exception as e:
+                ephemeris_provider.warn_unavailable('moon phases, using mean lunation', e)
+        return approximate_moon_phase(self.epochs)
+
+    def next_indices(self, after=None, n=2, min_zhr=0, include_daytime=False):
+        """Indices of the next ``n`` peaks after an epoch, found by binary search"""
+        if after is None:
+            after = datetime.now().timestamp()
+        start = int(np.searchsorted(self.epochs, after, side='right'))
+        mask = self.zhr[start:] >= min_zhr
+        if not include_daytime:
+            daytime = np.array([shower[6] for shower in self.showers])
+            mask &= ~daytime[self.shower_index[start:]]
+        return start + np.flatnonzero(mask)[:n]
+
+    def to_event(self, index):
+        """Format one almanac entry as a detector event dict"""
+        name, code, _, zhr, velocity, constellation, daytime = self.showers[self.shower_index[index]]
+        illumination = float(self.moon_illumination[index])
+        return {
+            'event': f"{name} Meteor Shower",
+            'peak': datetime.fromtimestamp(float(self.epochs[index])),
+            'zhr': zhr if zhr else 'Variable',
+            'moon_phase': moon_phase_name(float(self.moon_phase[index])),
+            'moon_illumination': f"{illumination * 100:.0f}%",
+            'visibility': shower_visibility(zhr, illumination, daytime),
+            'constellation': constellation,
+            'velocity': f"{velocity} km/s",
+            'code': code,
+            'source': 'IMO Working List'
+        }
+
+    def next_showers(self, after=None, n=2, min_zhr=METEOR_SHOWER_ZHR):
+        """Event dicts for the next ``n`` showers reaching ``min_zhr``"""
+        return [self.to_event(i) for i in self.next_indices(after, n, min_zhr)]
+
+
+_almanac = None
+_almanac_lock = threading.Lock()
+
+
+def get_meteor_almanac():
+    """Process-wide almanac covering the current year and the years after it"""
+    global _almanac
+    current_year = datetime.now().year
+    with _almanac_lock:
+        if _almanac is None or _almanac.first_year != current_year:
+            _almanac = MeteorAlmanac(current_year, current_year + METEOR_ALMANAC_YEARS)
+        return _almanac
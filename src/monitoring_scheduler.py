@@ -3,7 +3,7 @@ import time
 import threading
 from datetime import datetime
 from notification_engine import NotificationEngine
-from config import CHECK_INTERVAL
+from config import CHECK_INTERVAL, DB_MAINTENANCE_HOURS
 import streamlit as st
 
 class MonitoringScheduler:
@@ -11,6 +11,7 @@ class MonitoringScheduler:
         self.notifier = NotificationEngine()
         self.is_running = False
         self.scheduler_thread = None
+        self.maintenance_thread = None
         
     def start_monitoring(self, locations=None):
         """Start the background monitoring scheduler"""
@@ -19,9 +20,16 @@ class MonitoringScheduler:
         
         self.is_running = True
         
+        # Keep the shared sources warm so checks never wait on the network
+        self.notifier.detector.start_background_refresh()
+        
         # Schedule regular checks
         schedule.every(CHECK_INTERVAL).seconds.do(self.check_all_locations, locations)
         
+        # Retention and vacuuming run on their own thread so checks are never delayed
+        schedule.every(DB_MAINTENANCE_HOURS).hours.do(self.start_maintenance)
+        self.start_maintenance()
+        
         # Start scheduler in background thread
         self.scheduler_thread = threading.Thread(target=self.run_scheduler)
         self.scheduler_thread.daemon = True
@@ -45,20 +53,42 @@ class MonitoringScheduler:
         """Check all specified locations for events"""
         print(f" Scheduled check at {datetime.now()}")
         
-        for location in locations:
-            try:
-                alerts_sent = self.notifier.check_and_alert(location)
-                if alerts_sent > 0:
-                    print(f" Sent {alerts_sent} alerts for {location}")
-            except Exception as e:
-                print(f" Error checking {location}: {e}")
+        try:
+            # One batched scan covers every location
+            alerts_sent = self.notifier.check_and_alert_locations(locations)
+        except Exception as e:
+            print(f" Error checking {locations}: {e}")
+            return
+        
+        for location, count in alerts_sent.items():
+            if count > 0:
+                print(f" Sent {count} alerts for {location}")
+    
+    def start_maintenance(self):
+        """Run database maintenance in the background unless a run is still going"""
+        if self.maintenance_thread is not None and self.maintenance_thread.is_alive():
+            return
+        self.maintenance_thread = threading.Thread(target=self.run_maintenance)
+        self.maintenance_thread.daemon = True
+        self.maintenance_thread.start()
+    
+    def run_maintenance(self):
+        """Apply retention and size limits to the event database"""
+        try:
+            summary = self.notifier.db.maintain()
+        except Exception as e:
+            print(f" Error maintaining database: {e}")
+            return
+        print(f" Database maintenance: {summary}")
     
     def get_scheduler_status(self):
         """Get current scheduler status"""
         return {
             'is_running': self.is_running,
             'next_run': schedule.next_run() if schedule.jobs else None,
-            'job_count': len(schedule.jobs)
+            'job_count': len(schedule.jobs),
+            'sources': self.notifier.detector.source_health(),
+            'freshness': self.notifier.detector.source_freshness()
         }
 
 # Global scheduler instance
@@ -26,6 +26,9 @@ except ImportError:
         class AstronomicalEventDetector:
             def get_all_events(self, location):
                 return []
+            
+            def get_events_for_locations(self, locations, window=None):
+                return {'location_id': [], 'details': []}
         
         class EmailNotifier:
             def send_alert(self, recipient, subject, message):
@@ -33,9 +36,15 @@ except ImportError:
         
         email_notifier = EmailNotifier()
 
+try:
+    from src.database import db_manager
+except ImportError:
+    from database import db_manager
+
 class NotificationEngine:
     def __init__(self):
         self.detector = AstronomicalEventDetector()
+        self.db = db_manager
         self.sent_alerts = set()  # Track alerts we've already sent
         
     def should_send_alert(self, event):
@@ -47,6 +56,10 @@ class NotificationEngine:
         # Don't send duplicate alerts
         if event_id in self.sent_alerts:
             return False
+        
+        # Nobody can see it from here (daylight, no darkness near the peak)
+        if event.get('observable') is False:
+            return False
             
         # Check if event is within alert window (for time-based events)
         if isinstance(event_time, datetime):
@@ -56,16 +69,22 @@ class NotificationEngine:
         # For events without specific times, always alert
         return True
     
+    def format_event_time(self, event, key, fmt):
+        """Format an event time in the observer's time zone when the detector localized it"""
+        event_time = event.get(key, datetime.now())
+        local_time = event.get('local_time')
+        if isinstance(event_time, datetime) and isinstance(local_time, datetime):
+            return local_time.strftime(f"{fmt} %Z")
+        if isinstance(event_time, datetime):
+            return event_time.strftime(fmt)
+        return str(event_time)
+    
     def format_alert_message(self, event):
         """Create a user-friendly alert message"""
         event_type = event['event']
         
-        if 'ISS' in event_type:
-            event_time = event.get('time', datetime.now())
-            if isinstance(event_time, datetime):
-                time_str = event_time.strftime('%H:%M')
-            else:
-                time_str = str(event_time)
+        if 'ISS' in event_type or 'International Space Station' in event_type:
+            time_str = self.format_event_time(event, 'time', '%H:%M')
                 
             return f"""
 🚀 INTERNATIONAL SPACE STATION PASSING OVERHEAD!
@@ -75,14 +94,23 @@ Maximum altitude: {event.get('max_altitude', 0)}°.
 Brightness: {event.get('brightness', 'Very bright')}
 
 Perfect viewing conditions tonight! The ISS will be clearly visible moving across the sky.
+"""
+        
+        elif 'norad_id' in event:
+            time_str = self.format_event_time(event, 'time', '%H:%M')
+                
+            return f"""
+🛰️ SATELLITE PASSING OVERHEAD!
+
+{event['event']}: look {event.get('direction', 'up')} at {time_str} for {event.get('duration', 'a few minutes')}.
+Maximum altitude: {event.get('max_altitude', 0)}°.
+Brightness: {event.get('brightness', 'Visible to the naked eye')}
+
+The satellite is sunlit against a dark sky, so look for a steady moving star.
 """
         
         elif 'Meteor' in event_type:
-            peak_time = event.get('peak', datetime.now())
-            if isinstance(peak_time, datetime):
-                peak_str = peak_time.strftime('%B %d at %H:%M')
-            else:
-                peak_str = str(peak_time)
+            peak_str = self.format_event_time(event, 'peak', '%B %d at %H:%M')
                 
             return f"""
 🌠 METEOR SHOWER ALERT!
@@ -108,11 +136,7 @@ Look toward the northern horizon from dark locations.
 """
         
         elif 'Launch' in event_type:
-            launch_time = event.get('time', datetime.now())
-            if isinstance(launch_time, datetime):
-                time_str = launch_time.strftime('%B %d at %H:%M UTC')
-            else:
-                time_str = str(launch_time)
+            time_str = self.format_event_time(event, 'time', '%B %d at %H:%M')
                 
             return f"""
 🚀 ROCKET LAUNCH ALERT!
@@ -161,8 +185,12 @@ Check your astronomy apps for detailed viewing information.
         
         alerts_sent = 0
         for event in events:
+            event_time = event.get('time') or event.get('peak')
+            # Buffered, so the check never waits on the disk; the writer thread batches the rows
+            self.db.log_event(event['event'], event, location_name, event_time, buffered=True)
             if self.should_send_alert(event):
                 self.send_alerts(event)
+                self.db.log_alert(event['event'], event, location_name, event_time, buffered=True)
                 alerts_sent += 1
         
         if alerts_sent == 0:
@@ -171,6 +199,27 @@ Check your astronomy apps for detailed viewing information.
             print(f"✅ Sent {alerts_sent} alert(s)!")
         
         return alerts_sent
+    
+    def check_and_alert_locations(self, location_names):
+        """Check many locations in one batched scan and send alerts"""
+        print(f"🔍 Checking for events in {len(location_names)} locations...")
+        events = self.detector.get_events_for_locations(
+            location_names, window=timedelta(minutes=ALERT_WINDOW))
+        
+        # The scan is handed to the writer thread, which logs it in batched transactions
+        self.db.log_events(((event['event'], event, location, event.get('time') or event.get('peak'))
+                            for location, event in zip(events['location_id'], events['details'])),
+                           buffered=True)
+        
+        alerts_sent = {location: 0 for location in location_names}
+        for location, event in zip(events['location_id'], events['details']):
+            if self.should_send_alert(event):
+                self.send_alerts(event)
+                self.db.log_alert(event['event'], event, location, event.get('time') or event.get('peak'),
+                                  buffered=True)
+                alerts_sent[location] += 1
+        
+        return alerts_sent
 
 def main():
     """Run the notification engine"""
@@ -0,0 +1,219 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import numpy as np
+
+try:
+    from skyfield.framelib import itrs
+    SKYFIELD_AVAILABLE = True
+except ImportError:
+    SKYFIELD_AVAILABLE = False
+
+try:
+    from src.ephemeris import ephemeris_provider
+    from src.geo_cells import cell_location, cell_of
+    from src.global_locations import GLOBAL_LOCATIONS
+    from src.meteor_almanac import solar_longitude, J2000_JD, UNIX_EPOCH_JD
+    from src.pass_predictor import observer_frames
+except ImportError:
+    from ephemeris import ephemeris_provider
+    from geo_cells import cell_location, cell_of
+    from global_locations import GLOBAL_LOCATIONS
+    from meteor_almanac import solar_longitude, J2000_JD, UNIX_EPOCH_JD
+    from pass_predictor import observer_frames
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    OBSERVABILITY_DAYS = 3
+    OBSERVABILITY_MODE = 'annotate'
+    OBSERVABILITY_CACHE_SIZE = 2048
+
+# Sun altitude limits (degrees)
+NIGHT_SUN_ALTITUDE = -6    # nautical twilight: bright satellites visible
+DARK_SUN_ALTITUDE = -18    # astronomical darkness: faint meteors and aurora
+
+SUN_GRID_STEP = 300  # seconds
+
+
+def approximate_sun_direction(epochs):
+    """Low-precision unit vector towards the Sun in the Earth-fixed frame, shape (3, T)"""
+    jd = np.asarray(epochs, dtype=float) / 86400.0 + UNIX_EPOCH_JD
+    longitude = np.radians(solar_longitude(jd))
+    obliquity = np.radians(23.439)
+    ra = np.arctan2(np.cos(obliquity) * np.sin(longitude), np.cos(longitude))
+    dec = np.arcsin(np.sin(obliquity) * np.sin(longitude))
+    gmst = np.radians(np.mod(280.46061837 + 360.98564736629 * (jd - J2000_JD), 360.0))
+    hour_angle = ra - gmst
+    return np.stack([np.cos(dec) * np.cos(hour_angle),
+                     np.cos(dec) * np.sin(hour_angle),
+                     np.sin(dec)])
+
+
+def sun_direction(epochs):
+    """Unit vector towards the Sun in ITRS, from the ephemeris when available"""
+    if SKYFIELD_AVAILABLE:
+        try:
+            eph = ephemeris_provider.ephemeris
+            t = ephemeris_provider.time_from_epochs(epochs)
+            xyz = eph['earth'].at(t).observe(eph['sun']).apparent().frame_xyz(itrs).au
+            return xyz / np.linalg.norm(xyz, axis=0)
+        except Exception as e:
+            ephemeris_provider.warn_unavailable('sun positions, using approximation', e)
+    return approximate_sun_direction(epochs)
+
+
+def below_intervals(epochs, below):
+    """Contiguous (start, end) epoch intervals where a boolean track is True"""
+    if not below.any():
+        return []
+    edges = np.diff(np.concatenate([[0], below.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return [(float(epochs[s]), float(epochs[e])) for s, e in zip(starts, ends)]
+
+
+def utc_date(epoch):
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).date()
+
+
+class ObservabilityFilter:
+    """Darkness windows per location cell, computed in batch and cached per (cell, date)
+
+    Past dates are dropped on every computation, and beyond ``max_entries``
+    the least recently used windows go first, so ad-hoc coordinates and far
+    future peaks cannot grow the cache without bound.
+    """
+
+    def __init__(self, days=OBSERVABILITY_DAYS, mode=OBSERVABILITY_MODE, max_entries=OBSERVABILITY_CACHE_SIZE):
+        self.days = days
+        self.mode = mode
+        self.max_entries = max_entries
+        self._windows = OrderedDict()  # (cell, date) -> {'night': [...], 'dark': [...]}, oldest use first
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(location):
+        return (cell_of(location),)
+
+    def sun_altitudes(self, locations, start, days):
+        """Sun altitude (degrees) on a time grid for every location, shape (L, T)"""
+        epochs = start + np.arange(0, days * 86400 + SUN_GRID_STEP, SUN_GRID_STEP, dtype=float)
+        _, _, _, up = observer_frames([loc['lat'] for loc in locations],
+                                      [loc['lon'] for loc in locations])
+        altitudes = np.degrees(np.arcsin(np.clip(up @ sun_direction(epochs), -1, 1)))
+        return epochs, altitudes
+
+    def compute(self, locations, start=None):
+        """Compute and cache darkness windows for many locations over the next days, returning them"""
+        if start is None:
+            start = time.time()
+        day_start = float(int(start // 86400) * 86400)
+        # Twilight moves by seconds within a cell, so every location shares its cell's windows
+        locations = [cell_location(cell) for cell in {cell_of(location) for location in locations}]
+        epochs, altitudes = self.sun_altitudes(locations, day_start, self.days)
+
+        windows = {}
+        for location, altitude in zip(locations, altitudes):
+            night = below_intervals(epochs, altitude < NIGHT_SUN_ALTITUDE)
+            dark = below_intervals(epochs, altitude < DARK_SUN_ALTITUDE)
+            for day in range(self.days):
+                date = utc_date(day_start + day * 86400)
+                day_end = day_start + (day + 1) * 86400
+                windows[self._key(location) + (date,)] = {
+                    'night': [(s, e) for s, e in night if s < day_end and e >= day_end - 86400],
+                    'dark': [(s, e) for s, e in dark if s < day_end and e >= day_end - 86400],
+                }
+        with self._lock:
+            # Drop dates that have already passed, then the least recently used
+            today = utc_date(time.time())
+            for key in [key for key in self._windows if key[1] < today]:
+                del self._windows[key]
+            for key, window in windows.items():
+                self._windows[key] = window
+                self._windows.move_to_end(key)
+            while len(self._windows) > self.max_entries:
+                self._windows.popitem(last=False)
+        return windows
+
+    def windows(self, location, date):
+        """Darkness windows for a location on a UTC date"""
+        key = self._key(location) + (date,)
+        with self._lock:
+            window = self._windows.get(key)
+            if window is not None:
+                self._windows.move_to_end(key)
+        if window is None:
+            # One miss refreshes every known location at once
+            locations = list(GLOBAL_LOCATIONS.values())
+            if self._key(location) not in {self._key(loc) for loc in locations}:
+                locations.append(location)
+            start = datetime(date.year, date.month, date.day, tzinfo=timezone.utc).timestamp()
+            window = self.compute(locations, start)[key]
+        return window
+
+    def _window_at(self, location, epoch, level):
+        """The window of a given level containing an epoch, if any"""
+        for start, end in self.windows(location, utc_date(epoch))[level]:
+            if start <= epoch <= end:
+                return start, end
+        return None
+
+    def _next_window(self, location, epoch, level, horizon):
+        """The first window of a given level overlapping [epoch, epoch + horizon]"""
+        for offset in (0, 86400):
+            for start, end in self.windows(location, utc_date(epoch + offset))[level]:
+                if end >= epoch and start <= epoch + horizon:
+                    return max(start, epoch), end
+        return None
+
+    def assess(self, event, location):
+        """Observing window for an event, or None if it cannot be seen"""
+        name = event['event']
+        if 'Launch' in name or 'mission' in event:
+            # Launches are followed on live streams, not from the observer's sky
+            return 'stream'
+
+        event_time = event.get('culmination') or event.get('time') or event.get('peak')
+        epoch = event_time.timestamp() if isinstance(event_time, datetime) else time.time()
+
+        if 'Meteor' in name:
+            # The night around the peak matters, not the peak instant itself
+            return self._next_window(location, epoch - 43200, 'dark', 86400)
+        if 'Aurora' in name:
+            return self._next_window(location, epoch, 'dark', 86400)
+        return self._window_at(location, epoch, 'night')
+
+    def apply(self, events, location, mode=None):
+        """Annotate events with observability, dropping unobservable ones in 'drop' mode"""
+        mode = mode or self.mode
+        kept = []
+        for event in events:
+            try:
+                window = self.assess(event, location)
+            except Exception as e:
+                print(f"Error assessing observability for {event.get('event')}: {e}")
+                kept.append(event)
+                continue
+
+            if window == 'stream':
+                kept.append(event)
+                continue
+            event['observable'] = window is not None
+            if window is not None:
+                event['observing_window'] = (datetime.fromtimestamp(window[0]),
+                                             datetime.fromtimestamp(window[1]))
+            if window is not None or mode != 'drop':
+                kept.append(event)
+        return kept
+
+
+# Global observability filter instance
+observability_filter = ObservabilityFilter()
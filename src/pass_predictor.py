@@ -0,0 +1,125 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    MIN_ISS_ALTITUDE = 20
+    PASS_HORIZON = 10
+
+# WGS84 ellipsoid
+EARTH_RADIUS_KM = 6378.137
+EARTH_FLATTENING = 1 / 298.257223563
+
+COMPASS_POINTS = ['North', 'North-East', 'East', 'South-East',
+                  'South', 'South-West', 'West', 'North-West']
+
+
+def compass_direction(azimuth):
+    """Convert an azimuth in degrees to a compass point name"""
+    return COMPASS_POINTS[int(((azimuth % 360) + 22.5) // 45) % 8]
+
+
+def observer_frames(lats, lons):
+    """Return ECEF positions (km) and east/north/up unit vectors for observers"""
+    lat = np.radians(np.asarray(lats, dtype=float))
+    lon = np.radians(np.asarray(lons, dtype=float))
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_lon, cos_lon = np.sin(lon), np.cos(lon)
+
+    e2 = EARTH_FLATTENING * (2 - EARTH_FLATTENING)
+    n = EARTH_RADIUS_KM / np.sqrt(1 - e2 * sin_lat ** 2)
+    position = np.stack([n * cos_lat * cos_lon,
+                         n * cos_lat * sin_lon,
+                         n * (1 - e2) * sin_lat], axis=-1)
+
+    east = np.stack([-sin_lon, cos_lon, np.zeros_like(lon)], axis=-1)
+    north = np.stack([-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat], axis=-1)
+    up = np.stack([cos_lat * cos_lon, cos_lat * sin_lon, sin_lat], axis=-1)
+    return position, east, north, up
+
+
+def topocentric_alt_az(sat_xyz, position, east, north, up):
+    """Altitude, azimuth (degrees) and range (km) of ECEF positions for every observer
+
+    ``sat_xyz`` has shape (3, T) and the observer arrays (L, 3); results are (L, T).
+    """
+    offset = sat_xyz[np.newaxis, :, :] - position[:, :, np.newaxis]
+    rng = np.sqrt(np.einsum('lkt,lkt->lt', offset, offset))
+    e = np.einsum('lkt,lk->lt', offset, east)
+    n = np.einsum('lkt,lk->lt', offset, north)
+    u = np.einsum('lkt,lk->lt', offset, up)
+    alt = np.degrees(np.arcsin(np.clip(u / rng, -1, 1)))
+    az = np.degrees(np.arctan2(e, n)) % 360
+    return alt, az, rng
+
+
+def find_passes(epochs, alt, az, rng, horizon=PASS_HORIZON, min_altitude=MIN_ISS_ALTITUDE):
+    """Extract complete passes from (L, T) altitude tracks
+
+    Returns one list per observer row. Each pass is a dict of epoch seconds
+    for rise/culmination/set plus the peak altitude, range and azimuths.
+    """
+    n_obs, n_times = alt.shape
+    passes = [[] for _ in range(n_obs)]
+    if n_times < 2:
+        return passes
+
+    above = alt >= horizon
+    edges = np.diff(above.astype(np.int8), axis=1)
+    rise_obs, rise_idx = np.nonzero(edges == 1)
+    set_obs, set_idx = np.nonzero(edges == -1)
+    if len(rise_idx) == 0 or len(set_idx) == 0:
+        return passes
+
+    # Pair every rise with the first set that follows it on the same row
+    rise_keys = rise_obs * n_times + rise_idx
+    set_keys = set_obs * n_times + set_idx
+    match = np.searchsorted(set_keys, rise_keys)
+    valid = match < len(set_keys)
+    match = np.minimum(match, len(set_keys) - 1)
+    valid &= set_obs[match] == rise_obs
+    rise_obs, rise_idx, set_idx = rise_obs[valid], rise_idx[valid], set_idx[match[valid]]
+
+    # Linear interpolation of the horizon crossings between grid points
+    step = epochs[1] - epochs[0]
+
+    def crossing(obs, idx):
+        a0, a1 = alt[obs, idx], alt[obs, idx + 1]
+        frac = np.clip((horizon - a0) / (a1 - a0), 0, 1)
+        return epochs[idx] + frac * step
+
+    rise_times = crossing(rise_obs, rise_idx)
+    set_times = crossing(rise_obs, set_idx)
+
+    for k in range(len(rise_obs)):
+        obs, start, end = rise_obs[k], rise_idx[k] + 1, set_idx[k] + 1
+        peak = start + int(np.argmax(alt[obs, start:end]))
+        # Parabolic refinement of the culmination between grid points
+        a, b, c = alt[obs, peak - 1], alt[obs, peak], alt[obs, min(peak + 1, n_times - 1)]
+        curvature = a - 2 * b + c
+        # Masked tracks drop to -90 outside a segment, so only refine inside one
+        offset = 0.5 * (a - c) / curvature if curvature < 0 and min(a, c) > -90 else 0.0
+        max_altitude = min(90.0, b - 0.25 * (a - c) * offset)
+        if max_altitude < min_altitude:
+            continue
+        passes[obs].append({
+            'rise': float(rise_times[k]),
+            'culmination': float(epochs[peak] + offset * step),
+            'set': float(set_times[k]),
+            'max_altitude': float(max_altitude),
+            'min_range': float(rng[obs, peak]),
+            'rise_azimuth': float(az[obs, start]),
+            'set_azimuth': float(az[obs, end - 1]),
+        })
+    return passes
+
+
+def estimate_magnitude(range_km, standard_magnitude=-1.3):
+    """Rough visual magnitude scaled from the standard magnitude at 1000 km"""
+    return standard_magnitude + 5 * np.log10(range_km / 1000.0)
+
@@ -0,0 +1,109 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import time
+
+try:
+    from src.database import db_manager
+except ImportError:
+    from database import db_manager
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    PASS_TABLE_DAYS = 3
+
+
+class PassTable:
+    """Rolling table of precomputed visible passes, persisted in SQLite
+
+    The table always covers whole days up to ``days`` ahead for every
+    satellite the visibility engine tracks and every occupied location cell.
+    A new element set recomputes the remaining horizon of that satellite
+    only, otherwise each refresh just appends the days that have come into
+    range. Cells nobody asked about for ``days`` are no longer extended.
+    """
+
+    def __init__(self, engine, db=db_manager, days=PASS_TABLE_DAYS):
+        self.engine = engine
+        self.db = db
+        self.days = days
+        self._tracked = {}  # location id -> (lat/lon dict, last used)
+        self._checked = None  # (tle epochs, horizon_end, locations) of the last complete refresh
+        self._lock = threading.Lock()
+
+    def track(self, locations, now=None):
+        """Keep a mapping of location id -> lat/lon in the table"""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            for loc_id, location in locations.items():
+                self._tracked[loc_id] = (location, now)
+
+    def tracked(self, now=None):
+        """Locations used within the table horizon, as location id -> lat/lon"""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            self._tracked = {loc_id: entry for loc_id, entry in self._tracked.items()
+                             if now - entry[1] < self.days * 86400}
+            return {loc_id: entry[0] for loc_id, entry in self._tracked.items()}
+
+    def horizon_end(self, now):
+        """End of the last whole UTC day the table has to cover"""
+        return (int(now // 86400) + self.days + 1) * 86400.0
+
+    def refresh(self, locations=None, now=None):
+        """Bring the table up to date for a mapping of location id -> lat/lon, by default every tracked one"""
+        if now is None:
+            now = time.time()
+        if locations is None:
+            locations = self.tracked(now)
+        self.engine.ensure_elements()
+        tle_epochs = self.engine.epochs()
+        horizon_end = self.horizon_end(now)
+        checked = (tuple(sorted(tle_epochs.items())), horizon_end, frozenset(locations))
+        if checked == self._checked:
+            return
+
+        # Group the stale (satellite, location) pairs by start time and satellite set,
+        # so each group is one matrix evaluation covering exactly the pairs it needs
+        coverage = self.db.get_pass_coverage()
+        groups = {}
+        for loc_id in locations:
+            starts = {}
+            for satellite, tle_epoch in tle_epochs.items():
+                covered = coverage.get((satellite, loc_id))
+                if covered is None or covered[0] != tle_epoch or covered[1] < now:
+                    # New satellite, location or element set: recompute everything still ahead
+                    start = now
+                elif covered[1] < horizon_end:
+                    start = covered[1]
+                else:
+                    continue
+                starts.setdefault(start, set()).add(satellite)
+            for start, satellites in starts.items():
+                groups.setdefault((start, frozenset(satellites)), []).append(loc_id)
+
+        # Propagation runs without the lock, so track() and other scans never wait on it
+        results = [(start, self.engine.compute({loc_id: locations[loc_id] for loc_id in location_ids},
+                                               start, horizon_end, sorted(satellites)))
+                   for (start, satellites), location_ids in groups.items()]
+
+        with self._lock:
+            for start, passes in results:
+                self.db.save_passes(passes, tle_epochs, start, horizon_end)
+            if results:
+                self.db.prune_passes(now - 86400)
+            self._checked = checked
+
+    def passes(self, location_ids, start, end):
+        """Raw passes rising in (start, end] grouped by location id"""
+        rows = self.db.get_passes(start, end, location_ids)
+        passes = {loc_id: [] for loc_id in location_ids}
+        for row in rows:
+            passes[row['location']].append(row)
+        return passes
@@ -0,0 +1,163 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    CHECK_INTERVAL = 300
+    SOURCE_TTLS = {'aurora': 300, 'launches': 900, 'meteors': 3600, 'tle': 43200}
+    REFRESH_AHEAD = 0.8
+    REFRESH_RETRY = 30
+
+
+class SourceCache:
+    """Process-wide stale-while-revalidate cache for location-independent sources
+
+    Expired entries are returned immediately while a background fetch
+    revalidates them. With the refresher running, registered sources are
+    fetched ahead of expiry on their own cadence, so only a source that has
+    never loaded makes the caller wait on network I/O.
+    """
+
+    def __init__(self, ttls=None):
+        self.ttls = dict(SOURCE_TTLS if ttls is None else ttls)
+        self._entries = {}  # name -> (value, fetched_at)
+        self._source_locks = {}
+        self._refreshing = set()
+        self._retry_at = {}
+        self._registered = {}  # name -> (loader, ttl)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='stellarwatch-refresh')
+        self._refresher = None
+        self._stop = threading.Event()
+
+    def _source_lock(self, name):
+        with self._lock:
+            return self._source_locks.setdefault(name, threading.Lock())
+
+    def _ttl(self, name, ttl=None):
+        return self.ttls.get(name, CHECK_INTERVAL) if ttl is None else ttl
+
+    @property
+    def background(self):
+        """Whether the background refresher is running"""
+        return self._refresher is not None and self._refresher.is_alive()
+
+    def get(self, name, loader, ttl=None):
+        """Return the latest value for a source
+
+        Fresh entries are returned as they are. Expired entries are returned
+        too, with a background revalidation scheduled. Only a source that has
+        never loaded is fetched inline, and concurrent callers, the refresher
+        included, wait on that single fetch. Exceptions from ``loader`` are not
+        cached and propagate to the caller.
+        """
+        ttl = self._ttl(name, ttl)
+
+        entry = self._entries.get(name)
+        if entry is not None:
+            if time.time() - entry[1] >= ttl:
+                self.revalidate(name, loader)
+            return entry[0]
+
+        with self._source_lock(name):
+            # Another thread may have loaded the source while we waited
+            entry = self._entries.get(name)
+            if entry is not None:
+                return entry[0]
+
+            value = loader()
+            self._entries[name] = (value, time.time())
+            return value
+
+    def revalidate(self, name, loader):
+        """Refresh a source in the background unless a refresh is already running"""
+        with self._lock:
+            if name in self._refreshing or time.time() < self._retry_at.get(name, 0):
+                return
+            self._refreshing.add(name)
+        self._executor.submit(self._refresh, name, loader, time.time())
+
+    def _refresh(self, name, loader, requested_at):
+        try:
+            with self._source_lock(name):
+                # An inline load may have finished while this refresh was queued
+                entry = self._entries.get(name)
+                if entry is not None and entry[1] >= requested_at:
+                    return
+                value = loader()
+                self._entries[name] = (value, time.time())
+            self._retry_at.pop(name, None)
+        except Exception as e:
+            print(f"Error refreshing {name} data, keeping last snapshot: {e}")
+            # Back off so a failing upstream is not retried on every read
+            self._retry_at[name] = time.time() + min(self._ttl(name), REFRESH_RETRY)
+        finally:
+            with self._lock:
+                self._refreshing.discard(name)
+
+    def register(self, name, loader, ttl=None):
+        """Keep a source warm from the background refresher"""
+        with self._lock:
+            self._registered[name] = (loader, ttl)
+
+    def start_refresher(self, interval=1.0):
+        """Start the background thread that refreshes registered sources ahead of expiry"""
+        if self.background:
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(target=self._run_refresher, args=(interval,),
+                                           name='stellarwatch-refresher', daemon=True)
+        self._refresher.start()
+
+    def stop_refresher(self):
+        self._stop.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout=5)
+        self._refresher = None
+
+    def _run_refresher(self, interval):
+        while not self._stop.is_set():
+            with self._lock:
+                registered = dict(self._registered)
+            for name, (loader, ttl) in registered.items():
+                age = self.age(name)
+                if age is None or age >= self._ttl(name, ttl) * REFRESH_AHEAD:
+                    self.revalidate(name, loader)
+            self._stop.wait(interval)
+
+    def put(self, name, value, fetched_at=None):
+        """Seed a snapshot, e.g. from data persisted by a previous run"""
+        self._entries[name] = (value, time.time() if fetched_at is None else fetched_at)
+
+    def age(self, name):
+        """Seconds since the source was last fetched, or None if never"""
+        entry = self._entries.get(name)
+        return None if entry is None else time.time() - entry[1]
+
+    def snapshot(self, name, ttl=None):
+        """Age and staleness of the current snapshot of a source"""
+        age = self.age(name)
+        return {
+            'age': age,
+            'stale': age is None or age >= self._ttl(name, ttl),
+            'refreshing': name in self._refreshing,
+        }
+
+    def invalidate(self, name=None):
+        """Drop one source, or every source when no name is given"""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+
+# Global source cache instance
+source_cache = SourceCache()
@@ -0,0 +1,93 @@
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+
+
+def request_key(url, params=None):
+    """Stable key for a request URL and its query parameters"""
+    return url if not params else f"{url}?{json.dumps(params, sort_keys=True)}"
+
+
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control')
+
+
+def stored_headers(headers):
+    """The headers worth keeping, under their canonical names whatever case the server used"""
+    canonical = {name.lower(): name for name in STORED_HEADERS}
+    return {canonical[k.lower()]: v for k, v in headers.items() if k.lower() in canonical}
+
+
+class SourceArchive:
+    """Compact gzip JSON-lines archive of raw upstream responses
+
+    Each line holds the request key, the wall-clock time it was made, how
+    long the upstream took, and the status, headers and base64 body.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = None
+        self._positions = {}
+
+    def record(self, url, params, status_code, headers, content, elapsed):
+        """Append one upstream response to the archive"""
+        entry = {
+            'key': request_key(url, params),
+            'recorded_at': time.time(),
+            'elapsed': elapsed,
+            'status_code': status_code,
+            'headers': stored_headers(headers),
+            'body': base64.b64encode(content).decode('ascii'),
+        }
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with gzip.open(self.path, 'at', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+
+    def load(self):
+        """Read the archive into per-request lists ordered by recording time"""
+        entries = {}
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries.setdefault(entry['key'], []).append(entry)
+        for recorded in entries.values():
+            recorded.sort(key=lambda entry: entry['recorded_at'])
+        with self._lock:
+            self._entries = entries
+            self._positions = {}
+        return entries
+
+    def replay(self, url, params=None, speed=1.0):
+        """Next recorded response for a request, as (status, headers, body)
+
+        Responses for the same request are served in recording order, and the
+        last one repeats once the recording runs out. The upstream latency is
+        reproduced divided by ``speed``; a speed of 0 serves immediately.
+        """
+        if self._entries is None:
+            self.load()
+        key = request_key(url, params)
+        with self._lock:
+            recorded = self._entries.get(key)
+            if not recorded:
+                raise KeyError(f"No recorded response for {key}")
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            entry = recorded[min(position, len(recorded) - 1)]
+
+        if speed > 0:
+            time.sleep(entry['elapsed'] / speed)
+        return entry['status_code'], stored_headers(entry['headers']), base64.b64decode(entry['body'])
+
+    def summary(self):
+        """Number of recorded responses per request key"""
+        entries = self._entries if self._entries is not None else self.load()
+        return {key: len(recorded) for key, recorded in entries.items()}
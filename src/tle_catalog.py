@@ -0,0 +1,201 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import csv
+import io
+import json
+import threading
+import time
+
+import numpy as np
+
+try:
+    from sgp4.api import Satrec, WGS72
+    from sgp4 import omm
+    SGP4_AVAILABLE = True
+except ImportError:
+    SGP4_AVAILABLE = False
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    TLE_CATALOG_PATH = 'data/tle_catalog.npy'
+    TLE_CATALOG_FILE = 'data/catalog.tle'
+
+# Days from the SGP4 epoch origin (1949 December 31 00:00 UT) to the Julian date origin
+SGP4_EPOCH_JD = 2433281.5
+
+# One fixed-size record per satellite, holding exactly what sgp4init needs
+CATALOG_DTYPE = np.dtype([
+    ('norad_id', '<i4'),
+    ('name', '<U24'),
+    ('epoch_jd', '<f8'),
+    ('epoch_fraction', '<f8'),
+    ('bstar', '<f8'),
+    ('ndot', '<f8'),
+    ('nddot', '<f8'),
+    ('ecco', '<f8'),
+    ('argpo', '<f8'),
+    ('inclo', '<f8'),
+    ('mo', '<f8'),
+    ('no_kozai', '<f8'),
+    ('nodeo', '<f8'),
+])
+
+
+def record_from_satrec(satrec, name):
+    """Catalog record for a parsed sgp4 Satrec"""
+    return (satrec.satnum, (name or str(satrec.satnum))[:24], satrec.jdsatepoch, satrec.jdsatepochF,
+            satrec.bstar, satrec.ndot, satrec.nddot, satrec.ecco, satrec.argpo, satrec.inclo,
+            satrec.mo, satrec.no_kozai, satrec.nodeo)
+
+
+def parse_tle(text):
+    """Records for every element set in two- or three-line TLE text"""
+    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+    records = []
+    name = None
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if line.startswith('1 ') and i + 1 < len(lines) and lines[i + 1].startswith('2 '):
+            records.append(record_from_satrec(Satrec.twoline2rv(line, lines[i + 1]), name))
+            name = None
+            i += 2
+        else:
+            name = line.strip()
+            i += 1
+    return records
+
+
+def parse_omm(text):
+    """Records for every element set in CelesTrak OMM JSON or CSV"""
+    text = text.strip()
+    if text.startswith('['):
+        fields = json.loads(text)
+    else:
+        fields = list(csv.DictReader(io.StringIO(text)))
+    records = []
+    for entry in fields:
+        satrec = Satrec()
+        omm.initialize(satrec, {key: str(value) for key, value in entry.items()})
+        records.append(record_from_satrec(satrec, entry.get('OBJECT_NAME')))
+    return records
+
+
+def parse_elements(text):
+    """Parse TLE or OMM text into a catalog array sorted by NORAD ID"""
+    stripped = text.lstrip()
+    if stripped.startswith('[') or stripped.startswith('CCSDS_OMM_VERS') or stripped.startswith('OBJECT_NAME'):
+        records = parse_omm(text)
+    else:
+        records = parse_tle(text)
+    if not records:
+        raise ValueError("No element sets found")
+    elements = np.array(records, dtype=CATALOG_DTYPE)
+    # Keep only the newest element set per satellite
+    order = np.lexsort((-(elements['epoch_jd'] + elements['epoch_fraction']), elements['norad_id']))
+    elements = elements[order]
+    first = np.concatenate([[True], np.diff(elements['norad_id']) != 0])
+    return elements[first]
+
+
+class TLECatalog:
+    """Orbital element catalog stored as one sorted numpy array on disk
+
+    Element sets are parsed once on ingest and saved as fixed-size records
+    keyed by NORAD ID, so a cold start memory-maps the array instead of
+    fetching and parsing text. Satellite objects are built on demand and
+    kept until their element epoch changes.
+    """
+
+    def __init__(self, path=TLE_CATALOG_PATH, seed_file=TLE_CATALOG_FILE):
+        self.path = path
+        self.seed_file = seed_file
+        self.elements = np.zeros(0, dtype=CATALOG_DTYPE)
+        self.ingested_at = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Load the on-disk catalog if it changed, seeding it from the local file on first use"""
+        with self._lock:
+            if not os.path.exists(self.path) and self.seed_file and os.path.exists(self.seed_file):
+                with open(self.seed_file, 'r') as f:
+                    self._merge(parse_elements(f.read()))
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                return len(self.elements) > 0
+            if mtime != self._mtime:
+                self.elements = np.load(self.path, mmap_mode='r')
+                self._mtime = mtime
+                self.ingested_at = mtime
+            return len(self.elements) > 0
+
+    def ingest(self, text):
+        """Parse element sets and merge them in, rewriting the file only if an epoch changed"""
+        elements = parse_elements(text)
+        with self._lock:
+            return self._merge(elements)
+
+    def _merge(self, elements):
+        current = np.asarray(self.elements)
+        known = np.isin(elements['norad_id'], current['norad_id'])
+        index = np.searchsorted(current['norad_id'], elements['norad_id'][known])
+        epochs = elements['epoch_jd'] + elements['epoch_fraction']
+        current_epochs = current['epoch_jd'][index] + current['epoch_fraction'][index]
+        newer = epochs[known] > current_epochs
+
+        if not newer.any() and known.all():
+            self.ingested_at = time.time()
+            return False
+
+        merged = current.copy()
+        merged[index[newer]] = elements[known][newer]
+        merged = np.concatenate([merged, elements[~known]])
+        merged = merged[np.argsort(merged['norad_id'], kind='stable')]
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.{threading.get_ident()}.tmp.npy"
+        np.save(tmp_path, merged)
+        os.replace(tmp_path, self.path)
+        self.elements = merged
+        self._mtime = os.path.getmtime(self.path)
+        self.ingested_at = time.time()
+        return True
+
+    def _find(self, norad_id):
+        index = int(np.searchsorted(self.elements['norad_id'], norad_id))
+        if index >= len(self.elements) or self.elements['norad_id'][index] != norad_id:
+            return None
+        return self.elements[index]
+
+    def name(self, norad_id):
+        """Object name of a satellite, or None if it is not in the catalog"""
+        record = self._find(norad_id)
+        return None if record is None else str(record['name'])
+
+    def epoch(self, norad_id):
+        """Julian date of a satellite's element set, or None if it is not in the catalog"""
+        record = self._find(norad_id)
+        return None if record is None else float(record['epoch_jd'] + record['epoch_fraction'])
+
+    def satrec(self, norad_id):
+        """Initialized sgp4 Satrec for a satellite"""
+        record = self._find(norad_id)
+        if record is None:
+            raise KeyError(f"NORAD {norad_id} is not in the TLE catalog")
+        satrec = Satrec()
+        satrec.sgp4init(WGS72, 'i', int(norad_id),
+                        float(record['epoch_jd'] - SGP4_EPOCH_JD + record['epoch_fraction']),
+                        float(record['bstar']), float(record['ndot']), float(record['nddot']),
+                        float(record['ecco']), float(record['argpo']), float(record['inclo']),
+                        float(record['mo']), float(record['no_kozai']), float(record['nodeo']))
+        return satrec
+
+
+# Global TLE catalog instance
+tle_catalog = TLECatalog()
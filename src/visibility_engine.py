@@ -0,0 +1,288 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+from datetime import datetime
+
+import numpy as np
+
+try:
+    from sgp4.api import SatrecArray
+    SGP4_AVAILABLE = True
+except ImportError:
+    SGP4_AVAILABLE = False
+
+try:
+    from src.circuit_breaker import circuit_breakers
+    from src.ephemeris import ephemeris_provider
+    from src.http_client import http_client
+    from src.meteor_almanac import J2000_JD, UNIX_EPOCH_JD
+    from src.observability import NIGHT_SUN_ALTITUDE, sun_direction
+    from src.pass_predictor import (EARTH_RADIUS_KM, compass_direction, estimate_magnitude,
+                                    find_passes, observer_frames, topocentric_alt_az)
+    from src.source_cache import source_cache
+    from src.tle_catalog import tle_catalog
+except ImportError:
+    from circuit_breaker import circuit_breakers
+    from ephemeris import ephemeris_provider
+    from http_client import http_client
+    from meteor_almanac import J2000_JD, UNIX_EPOCH_JD
+    from observability import NIGHT_SUN_ALTITUDE, sun_direction
+    from pass_predictor import (EARTH_RADIUS_KM, compass_direction, estimate_magnitude,
+                                find_passes, observer_frames, topocentric_alt_az)
+    from source_cache import source_cache
+    from tle_catalog import tle_catalog
+
+# Import config with fallback
+try:
+    from config import *
+except ImportError:
+    SATELLITE_TLE_URLS = ["https://celestrak.org/NORAD/elements/gp.php?CATNR=25544&FORMAT=tle",
+                          "https://celestrak.org/NORAD/elements/gp.php?GROUP=visual&FORMAT=tle"]
+    SATELLITE_NAMES = {25544: 'International Space Station'}
+    SATELLITE_MAGNITUDES = {25544: -1.3}
+    SATELLITE_DEFAULT_MAGNITUDE = 4.0
+    MAX_SATELLITE_MAGNITUDE = 4.5
+    MIN_ISS_ALTITUDE = 20
+    PASS_HORIZON = 10
+    PASS_GRID_STEP = 20
+
+# Upper bound on satellite x location x time points evaluated per chunk
+CHUNK_POINTS = 2_000_000
+
+# Fine grid used to refine a cell's passes for an exact location (seconds)
+REFINE_MARGIN = 120
+REFINE_STEP = 5
+
+
+def gmst_radians(epochs):
+    """Greenwich mean sidereal angle for Unix epochs"""
+    jd = UNIX_EPOCH_JD + np.asarray(epochs, dtype=float) / 86400.0
+    return np.radians(np.mod(280.46061837 + 360.98564736629 * (jd - J2000_JD), 360.0))
+
+
+def teme_to_ecef(xyz, epochs):
+    """Rotate (S, T, 3) TEME positions into the Earth-fixed frame"""
+    theta = gmst_radians(epochs)
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    x, y = xyz[..., 0], xyz[..., 1]
+    return np.stack([cos_t * x + sin_t * y, -sin_t * x + cos_t * y, xyz[..., 2]], axis=-1)
+
+
+def sunlit(xyz, sun):
+    """Whether (S, T, 3) positions are outside the Earth's cylindrical shadow"""
+    along = np.einsum('stk,kt->st', xyz, sun)
+    across = xyz - along[..., np.newaxis] * sun.T[np.newaxis]
+    return (along > 0) | (np.sqrt(np.einsum('stk,stk->st', across, across)) > EARTH_RADIUS_KM)
+
+
+def point_alt_az(offset, east, north, up):
+    """Altitude, azimuth (degrees) and range (km) of (N, 3) offsets, each in its own observer frame"""
+    rng = np.sqrt(np.einsum('nk,nk->n', offset, offset))
+    e = np.einsum('nk,nk->n', offset, east)
+    n = np.einsum('nk,nk->n', offset, north)
+    u = np.einsum('nk,nk->n', offset, up)
+    alt = np.degrees(np.arcsin(np.clip(u / rng, -1, 1)))
+    az = np.degrees(np.arctan2(e, n)) % 360
+    return alt, az, rng
+
+
+class VisibilityEngine:
+    """Naked-eye satellite passes for a satellites x locations x time matrix
+
+    Every tracked satellite is propagated at once with an sgp4 SatrecArray.
+    A pass only counts while the satellite is above the horizon, lit by the
+    Sun, and the observer's sky is dark, so the result lists the passes that
+    can actually be seen.
+    """
+
+    def __init__(self, ts=None, catalog=tle_catalog, urls=SATELLITE_TLE_URLS, norad_ids=None,
+                 source_name='tle', step=PASS_GRID_STEP, max_magnitude=MAX_SATELLITE_MAGNITUDE):
+        self._ts = ts
+        self.catalog = catalog
+        self.urls = list(urls)
+        self.norad_ids = norad_ids
+        self.source_name = source_name
+        self.step = step
+        self.max_magnitude = max_magnitude
+        self._satrecs = {}  # norad_id -> (epoch, Satrec)
+        self._lock = threading.Lock()
+
+    @property
+    def ts(self):
+        return self._ts if self._ts is not None else ephemeris_provider.timescale
+
+    def fetch_elements(self):
+        """Download every configured element set as TLE or OMM text"""
+        texts = []
+        for url in self.urls:
+            response = http_client.get(url, timeout=10)
+            response.raise_for_status()
+            texts.append(response.text)
+        return texts
+
+    def load_elements(self):
+        """Fetch and ingest element sets through the source's circuit breaker"""
+        def load():
+            for text in self.fetch_elements():
+                self.catalog.ingest(text)
+            return self.epochs()
+
+        # The catalog keeps the last good element sets, so only short-circuit
+        return circuit_breakers.get(self.source_name).call(load, serve_last_good=False)
+
+    def ensure_elements(self):
+        """Make sure the catalog is loaded, revalidating it through the source cache"""
+        if source_cache.age(self.source_name) is None and self.catalog.load():
+            # Cold start from the on-disk catalog instead of the network
+            source_cache.put(self.source_name, self.epochs(), self.catalog.ingested_at)
+        source_cache.get(self.source_name, self.load_elements)
+
+    def satellites(self):
+        """NORAD IDs of the tracked satellites present in the catalog"""
+        ids = self.catalog.elements['norad_id']
+        if self.norad_ids is None:
+            return [int(norad_id) for norad_id in ids]
+        return [norad_id for norad_id in self.norad_ids if norad_id in ids]
+
+    def epochs(self):
+        """Element epoch (Julian date) of every tracked satellite"""
+        return {norad_id: self.catalog.epoch(norad_id) for norad_id in self.satellites()}
+
+    def _satrec(self, norad_id):
+        epoch = self.catalog.epoch(norad_id)
+        cached = self._satrecs.get(norad_id)
+        if cached is None or cached[0] != epoch:
+            cached = (epoch, self.catalog.satrec(norad_id))
+            self._satrecs[norad_id] = cached
+        return cached[1]
+
+    def propagate(self, norad_ids, epochs):
+        """Earth-fixed positions (km) of many satellites over a time grid, shape (S, T, 3)"""
+        jd = UNIX_EPOCH_JD + epochs / 86400.0
+        whole = np.floor(jd - 0.5) + 0.5
+        satrecs = SatrecArray([self._satrec(norad_id) for norad_id in norad_ids])
+        errors, teme, _ = satrecs.sgp4(whole, jd - whole)
+        teme[errors != 0] = np.nan
+        return teme_to_ecef(teme, epochs)
+
+    def compute(self, locations, start, end, norad_ids=None):
+        """Visible passes rising in (start, end] as {norad_id: {location_id: [raw pass]}}"""
+        if not SGP4_AVAILABLE:
+            raise RuntimeError("sgp4 is required for satellite visibility")
+        if norad_ids is None:
+            norad_ids = self.satellites()
+        ids = list(locations)
+        result = {norad_id: {loc_id: [] for loc_id in ids} for norad_id in norad_ids}
+        if not ids or not norad_ids:
+            return result
+
+        # Start on the grid step and run past the end so passes in progress complete
+        grid_start = float(int(start // self.step) * self.step)
+        epochs = np.arange(grid_start, end + 1800 + self.step, self.step, dtype=float)
+        position, east, north, up = observer_frames([locations[i]['lat'] for i in ids],
+                                                    [locations[i]['lon'] for i in ids])
+        sun = sun_direction(epochs)
+        dark = np.degrees(np.arcsin(np.clip(up @ sun, -1, 1))) < NIGHT_SUN_ALTITUDE
+
+        chunk = max(1, CHUNK_POINTS // (len(ids) * len(epochs)))
+        for first in range(0, len(norad_ids), chunk):
+            group = norad_ids[first:first + chunk]
+            xyz = self.propagate(group, epochs)
+            lit = sunlit(xyz, sun)
+
+            # Stack the satellites along the time axis and screen with one matrix product:
+            # only points above an observer's horizon plane get the full topocentric transform
+            stacked = np.nan_to_num(xyz, nan=0.0).transpose(2, 0, 1).reshape(3, -1)
+            above = up @ stacked > np.einsum('lk,lk->l', up, position)[:, np.newaxis]
+            visible = (lit & ~np.isnan(xyz[..., 0])).reshape(1, -1) & np.tile(dark, (1, len(group)))
+            obs, col = np.nonzero(above & visible)
+
+            alt = np.full(above.shape, -90.0)
+            az = np.zeros(above.shape)
+            rng = np.full(above.shape, np.inf)
+            alt[obs, col], az[obs, col], rng[obs, col] = point_alt_az(
+                stacked[:, col].T - position[obs], east[obs], north[obs], up[obs])
+            shape = (len(ids), len(group), len(epochs))
+            alt, az, rng = (a.reshape(shape).transpose(1, 0, 2).reshape(-1, len(epochs)) for a in (alt, az, rng))
+            passes = find_passes(epochs, alt, az, rng, PASS_HORIZON, MIN_ISS_ALTITUDE)
+
+            for row, row_passes in enumerate(passes):
+                norad_id, loc_id = group[row // len(ids)], ids[row % len(ids)]
+                standard = SATELLITE_MAGNITUDES.get(norad_id, SATELLITE_DEFAULT_MAGNITUDE)
+                result[norad_id][loc_id] = [
+                    p for p in row_passes
+                    if start < p['rise'] <= end
+                    and estimate_magnitude(p['min_range'], standard) <= self.max_magnitude]
+        return result
+
+    def refine(self, passes, location):
+        """Re-evaluate passes predicted for a cell center at a location's exact coordinates
+
+        Every pass gets one row of a fine time grid around its predicted
+        window, so all of them go through a single visibility evaluation.
+        Passes that are not visible from the location are dropped.
+        """
+        if not passes:
+            return []
+        offsets = np.arange(0, max(p['set'] - p['rise'] for p in passes) + 2 * REFINE_MARGIN + REFINE_STEP,
+                            REFINE_STEP, dtype=float)
+        starts = np.array([p['rise'] - REFINE_MARGIN for p in passes])
+        epochs = starts[:, np.newaxis] + offsets
+
+        teme = np.empty(epochs.shape + (3,))
+        for row, raw_pass in enumerate(passes):
+            jd = UNIX_EPOCH_JD + epochs[row] / 86400.0
+            whole = np.floor(jd - 0.5) + 0.5
+            errors, teme[row], _ = self._satrec(raw_pass['satellite']).sgp4_array(whole, jd - whole)
+            teme[row][errors != 0] = np.nan
+        xyz = teme_to_ecef(teme, epochs)
+
+        position, east, north, up = observer_frames([location['lat']], [location['lon']])
+        sun = sun_direction(epochs.ravel())
+        dark = np.degrees(np.arcsin(np.clip(up @ sun, -1, 1)))[0] < NIGHT_SUN_ALTITUDE
+        lit = sunlit(xyz.reshape(1, -1, 3), sun)[0]
+        alt, az, rng = (a.reshape(epochs.shape) for a in topocentric_alt_az(
+            np.nan_to_num(xyz, nan=0.0).reshape(-1, 3).T, position, east, north, up))
+        visible = (lit & dark).reshape(epochs.shape) & ~np.isnan(xyz[..., 0])
+        found = find_passes(offsets, np.where(visible, alt, -90.0), az, rng, PASS_HORIZON, MIN_ISS_ALTITUDE)
+
+        refined = []
+        for raw_pass, start, row_passes in zip(passes, starts, found):
+            norad_id = raw_pass['satellite']
+            standard = SATELLITE_MAGNITUDES.get(norad_id, SATELLITE_DEFAULT_MAGNITUDE)
+            candidates = [p for p in row_passes
+                          if estimate_magnitude(p['min_range'], standard) <= self.max_magnitude]
+            if not candidates:
+                continue
+            best = min(candidates, key=lambda p: abs(start + p['culmination'] - raw_pass['culmination']))
+            refined.append(dict(best, satellite=norad_id, rise=start + best['rise'],
+                                culmination=start + best['culmination'], set=start + best['set']))
+        return refined
+
+    def name(self, norad_id):
+        """Display name of a satellite"""
+        if norad_id in SATELLITE_NAMES:
+            return SATELLITE_NAMES[norad_id]
+        return self.catalog.name(norad_id) or f"NORAD {norad_id}"
+
+    def to_event(self, norad_id, raw_pass):
+        """Format a raw pass as a detector event dict"""
+        duration = int(raw_pass['set'] - raw_pass['rise'])
+        magnitude = estimate_magnitude(raw_pass['min_range'],
+                                       SATELLITE_MAGNITUDES.get(norad_id, SATELLITE_DEFAULT_MAGNITUDE))
+        return {
+            'event': f"{self.name(norad_id)} Transit",
+            'norad_id': norad_id,
+            'time': datetime.fromtimestamp(raw_pass['rise']),
+            'culmination': datetime.fromtimestamp(raw_pass['culmination']),
+            'set_time': datetime.fromtimestamp(raw_pass['set']),
+            'duration': f"{duration // 60} minutes",
+            'max_altitude': round(raw_pass['max_altitude']),
+            'magnitude': round(float(magnitude), 1),
+            'brightness': f"Magnitude {magnitude:.1f}",
+            'direction': f"{compass_direction(raw_pass['rise_azimuth'])} to "
+                         f"{compass_direction(raw_pass['set_azimuth'])}",
+            'source': 'Local SGP4 Prediction'
+        }
@@ -0,0 +1,20 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+
+import pytest
+
+# Keep the global DatabaseManager created on import out of data/
+os.environ['DATABASE_PATH'] = os.path.join(tempfile.mkdtemp(prefix='stellarwatch-tests-'), 'astronomy.db')
+
+from src.database import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    """DatabaseManager on a fresh database file"""
+    manager = DatabaseManager(str(tmp_path / 'astronomy.db'), batch_size=4)
+    yield manager
+    manager.close()
@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+
+import numpy as np
+from jplephem.spk import SPK
+from skyfield import almanac
+from skyfield.api import Loader
+from skyfield.jpllib import SpiceKernel
+
+from src.benchmark import stub_body_positions, stub_tle, tle_checksum, write_stub_kernel
+
+
+def test_stub_kernel_reproduces_its_orbits(tmp_path):
+    path = str(tmp_path / 'stub.bsp')
+    write_stub_kernel(path, start=datetime(2026, 1, 1), years=2)
+    kernel = SPK.open(path)
+    jd = np.linspace(2461042.0, 2461700.0, 101)
+    for segment in kernel.segments:
+        assert np.abs(segment.compute(jd) - stub_body_positions(segment.target, jd)).max() < 1.0  # km
+    kernel.close()
+
+
+def test_stub_kernel_serves_skyfield_sun_and_moon(tmp_path):
+    path = str(tmp_path / 'stub.bsp')
+    write_stub_kernel(path, start=datetime(2026, 1, 1), years=2)
+    eph = SpiceKernel(path)
+    t = Loader(str(tmp_path), verbose=False).timescale().utc(2026, 10, 18)
+    ra, dec, _ = eph['earth'].at(t).observe(eph['sun']).apparent().radec()
+    # The real Sun is at about 13h 30m, -9.6 degrees
+    assert abs(ra.hours - 13.5) < 0.2
+    assert abs(dec.degrees + 9.6) < 1.0
+    assert 0.0 <= almanac.fraction_illuminated(eph, 'moon', t) <= 1.0
+    eph.close()
+
+
+def test_stub_tle_is_dated_today_with_valid_checksums():
+    tle = stub_tle(datetime(2026, 10, 18, 12, tzinfo=timezone.utc))
+    name, line1, line2 = tle.splitlines()
+    assert line1[18:32] == '26291.00000000'
+    for line in (line1, line2):
+        assert len(line) == 69
+        assert int(line[-1]) == tle_checksum(line[:-1])
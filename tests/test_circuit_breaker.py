@@ -0,0 +1,69 @@
+import pytest
+
+from src import circuit_breaker
+from src.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker.time, 'time', clock.time)
+    return clock
+
+
+def failing():
+    raise ConnectionError('upstream down')
+
+
+def test_opens_after_threshold_and_serves_last_good(clock):
+    breaker = CircuitBreaker('test', failure_threshold=2, backoff=30)
+    assert breaker.call(lambda: 'fresh') == 'fresh'
+    assert breaker.call(failing) == 'fresh'
+    assert breaker.state == CLOSED
+    assert breaker.call(failing) == 'fresh'
+    assert breaker.state == OPEN
+
+    # Short-circuited calls never reach the upstream
+    assert breaker.call(lambda: pytest.fail('upstream called while open')) == 'fresh'
+    assert breaker.status()['retry_in'] == 30
+
+
+def test_failing_probe_doubles_the_backoff(clock):
+    breaker = CircuitBreaker('test', failure_threshold=1, backoff=30, max_backoff=50)
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+    clock.now += 30
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()  # one probe at a time
+    breaker.record_failure(ConnectionError('still down'))
+    assert breaker.state == OPEN
+    assert breaker.backoff == 50
+
+
+def test_successful_probe_closes_the_breaker(clock):
+    breaker = CircuitBreaker('test', failure_threshold=1, backoff=30)
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+    clock.now += 30
+    assert breaker.call(lambda: 'recovered') == 'recovered'
+    assert breaker.state == CLOSED
+    assert breaker.failures == 0
+
+
+def test_open_without_last_good_raises(clock):
+    breaker = CircuitBreaker('test', failure_threshold=1, backoff=30)
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: 'fresh')
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: 'fresh', serve_last_good=False)
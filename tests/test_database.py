@@ -0,0 +1,296 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src import database
+from src.database import ConnectionPool, DatabaseManager, DatabaseWriter, event_key
+from src.event_codec import decode as decode_payload, encode as encode_payload
+
+
+def count(db, table='events'):
+    with db.pool.connection() as conn:
+        return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+
+
+def test_pool_opens_tuned_wal_connections_and_reuses_them(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'pool.db'), size=2, timeout=0.25)
+    with pool.connection() as conn:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+        assert conn.execute('PRAGMA busy_timeout').fetchone()[0] == 250
+        first = conn
+    with pool.connection() as conn:
+        assert conn is first
+    pool.close()
+
+
+def test_readers_see_the_last_commit_while_a_write_is_open(db):
+    db.log_event('Eclipse', {'n': 1}, 'london')
+    with db.pool.connection(write=True) as writer:
+        writer.execute("INSERT INTO events (event_type, event_data, location) VALUES ('Eclipse', x'00', 'paris')")
+        # A second pooled connection reads without waiting for the open write
+        assert count(db) == 1
+    assert count(db) == 2
+
+
+def test_writes_wait_for_busy_timeout_then_fail(tmp_path):
+    path = str(tmp_path / 'pool.db')
+    pool = ConnectionPool(path, size=1, timeout=0.2)
+    with pool.connection(write=True) as conn:
+        conn.execute('CREATE TABLE t (a)')
+
+    blocker = sqlite3.connect(path)
+    blocker.execute('BEGIN IMMEDIATE')
+    started = time.monotonic()
+    with pytest.raises(sqlite3.OperationalError):
+        with pool.connection(write=True) as conn:
+            conn.execute('INSERT INTO t VALUES (1)')
+    assert time.monotonic() - started >= 0.15
+    blocker.rollback()
+
+    # The connection went back to the pool and works once the lock is gone
+    with pool.connection(write=True) as conn:
+        conn.execute('INSERT INTO t VALUES (1)')
+    blocker.close()
+    pool.close()
+
+
+def test_exhausted_pool_raises_after_its_timeout(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'pool.db'), size=1, timeout=0.1)
+    with pool.connection():
+        with pytest.raises(sqlite3.OperationalError):
+            with pool.connection():
+                pass
+    pool.close()
+
+
+def test_log_events_writes_a_batch_in_one_transaction(db):
+    statements = []
+    with db.pool.connection() as conn:
+        conn.set_trace_callback(statements.append)
+    # The pool hands the most recently returned connection out first
+    when = datetime(2026, 8, 12, 22, 0)
+    assert db.log_events(('Eclipse', {'n': n}, 'london', when + timedelta(hours=n)) for n in range(50)) == 50
+    with db.pool.connection() as conn:
+        conn.set_trace_callback(None)
+
+    assert count(db) == 50
+    assert [s for s in statements if s.strip() in ('BEGIN', 'COMMIT')] == ['BEGIN ', 'COMMIT']
+
+
+def test_buffered_events_are_written_on_flush(db):
+    when = datetime(2026, 8, 12, 22, 0)
+    for hour in range(10):
+        db.log_event('Eclipse', {'n': hour}, 'london', when + timedelta(hours=hour), buffered=True)
+    db.log_events([('Eclipse', {'n': 10}, 'paris', when)], buffered=True)
+    db.flush()
+
+    assert db.writer.pending() == 0
+    assert count(db) == 11
+
+
+def test_close_writes_buffered_events(tmp_path):
+    path = str(tmp_path / 'astronomy.db')
+    manager = DatabaseManager(path)
+    manager.log_events([('Eclipse', {'n': n}, 'london', datetime(2026, 8, 12, n)) for n in range(5)], buffered=True)
+    manager.close()
+
+    reopened = DatabaseManager(path)
+    assert count(reopened) == 5
+    reopened.close()
+
+
+def test_query_events_pages_through_every_event_once(db):
+    start = datetime(2026, 8, 1)
+    # Pairs of events share a time, so pages have to break ties by id
+    db.log_events(('Eclipse', {'n': n}, f'loc{n}', start + timedelta(hours=n // 2)) for n in range(25))
+
+    seen, after, pages = [], None, 0
+    while True:
+        events, after = db.query_events(limit=10, after=after)
+        seen.extend(events)
+        pages += 1
+        if after is None:
+            break
+    assert pages == 3
+    assert len({event['id'] for event in seen}) == 25
+    keys = [(event['time'], event['id']) for event in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_query_events_filters_by_time_location_and_type(db):
+    start = datetime(2026, 8, 1)
+    db.log_events(('Eclipse' if n % 2 else 'Transit', {'n': n}, 'london' if n < 6 else 'paris',
+                   start + timedelta(hours=n)) for n in range(10))
+
+    events, _ = db.query_events(start=start + timedelta(hours=2), end=start + timedelta(hours=8),
+                                location=['london', 'paris'], event_type='Eclipse')
+    assert [event['data']['n'] for event in events] == [7, 5, 3]
+    events, _ = db.query_events(location='paris', event_type=['Eclipse', 'Transit'])
+    assert [event['data']['n'] for event in events] == [9, 8, 7, 6]
+
+
+def test_relogging_a_scan_updates_rows_instead_of_duplicating(db):
+    when = datetime(2026, 8, 12, 22, 0)
+    events = [
+        ('Satellite Pass', {'norad_id': 25544, 'max_altitude': 40}, 'london', when),
+        ('Meteor Shower: Perseids', {'zhr': 100}, 'london', when),
+        ('Aurora Forecast', {'kp_index': 5, 'probability': '30%'}, 'oslo', when),
+    ]
+    assert db.log_events(events) == 3
+    db.log_events(events)
+    assert count(db) == 3
+
+    # A rescan with new data refreshes the same row
+    db.log_event('Meteor Shower: Perseids', {'zhr': 120}, 'london', when + timedelta(hours=1))
+    rows, _ = db.query_events(event_type='Meteor Shower: Perseids')
+    assert count(db) == 3
+    assert rows[0]['data'] == {'zhr': 120}
+
+
+def test_slipping_launch_keeps_its_row(db):
+    launch = {'launch_id': 'abc', 'mission': 'Demo'}
+    db.log_event('Rocket Launch', launch, 'global', datetime(2026, 9, 1, 12, 0))
+    db.log_event('Rocket Launch', launch, 'global', datetime(2026, 9, 3, 8, 30))
+    rows, _ = db.query_events(event_type='Rocket Launch')
+    assert len(rows) == 1
+    assert rows[0]['time'].startswith('2026-09-03 08:30')
+
+
+def test_event_key_floors_satellite_passes():
+    when = datetime.fromtimestamp(1800000000)  # on a bucket edge
+    data = {'norad_id': 25544, 'time': when}
+    assert event_key('Satellite Pass', data, 'london', None) == \
+        event_key('Satellite Pass', {'norad_id': 25544, 'time': when + timedelta(seconds=20)}, 'london', None)
+    assert event_key('Satellite Pass', data, 'london', when) != \
+        event_key('Satellite Pass', data, 'paris', when)
+    assert event_key('Satellite Pass', 'not a dict', 'london', when) is None
+
+
+def test_pass_moved_across_a_key_bucket_edge_keeps_its_row(db):
+    edge = datetime.fromtimestamp(1800000000)
+    before = {'norad_id': 25544, 'time': edge - timedelta(seconds=2), 'max_altitude': 40}
+    after = {'norad_id': 25544, 'time': edge + timedelta(seconds=3), 'max_altitude': 41}
+    assert event_key('Satellite Pass', before, 'london', None) != event_key('Satellite Pass', after, 'london', None)
+
+    db.log_event('Satellite Pass', before, 'london', before['time'])
+    db.log_event('Satellite Pass', after, 'london', after['time'], buffered=True)
+    db.log_alert('Satellite Pass', after, 'london', after['time'], buffered=True)
+    db.flush()
+    # The same pass moving back is found from the other side too
+    db.log_event('Satellite Pass', before, 'london', before['time'])
+
+    events, _ = db.query_events()
+    assert len(events) == 1
+    assert events[0]['data'] == before
+    with db.pool.connection() as conn:
+        assert conn.execute('SELECT event_id FROM alerts').fetchone()[0] == events[0]['id']
+
+    # The next pass, an orbit later, is a new row
+    later = dict(after, time=edge + timedelta(minutes=92))
+    db.log_event('Satellite Pass', later, 'london', later['time'])
+    assert count(db) == 2
+
+
+def test_query_events_filters_on_typed_columns(db):
+    when = datetime(2026, 8, 12, 22, 0)
+    db.log_events([
+        ('Meteor Shower: Perseids', {'zhr': 100}, 'london', when),
+        ('Meteor Shower: Kappa Cygnids', {'zhr': 3}, 'london', when),
+        ('Satellite Pass', {'norad_id': 25544, 'max_altitude': 60}, 'london', when),
+    ])
+    events, cursor = db.query_events(kind='meteor', at_least={'zhr': 10}, payload=False)
+    assert cursor is None
+    assert [event['type'] for event in events] == ['Meteor Shower: Perseids']
+    assert events[0]['data']['zhr'] == 100
+    with pytest.raises(ValueError):
+        db.query_events(at_least={'kind': 1})
+
+
+def test_event_payloads_keep_datetimes(db):
+    when = datetime(2026, 8, 12, 22, 0)
+    data = {'norad_id': 25544, 'rise': when, 'track': list(range(100)), 'brightness': 'Bright'}
+    db.log_event('Satellite Pass', data, 'london', when)
+    events, _ = db.query_events()
+    assert events[0]['data'] == data
+
+
+def test_buffered_alert_finds_the_event_queued_before_it(db):
+    when = datetime(2026, 8, 12, 22, 0)
+    db.log_event('Eclipse', {'n': 0}, 'london', when, buffered=True)
+    db.log_alert('Eclipse', {'n': 0}, 'london', when, user_id=1, buffered=True)
+    db.flush()
+
+    with db.pool.connection() as conn:
+        event_id = conn.execute('SELECT event_id FROM alerts').fetchone()[0]
+    assert event_id == db.query_events()[0][0]['id']
+
+
+def test_writer_retries_a_locked_batch(monkeypatch):
+    monkeypatch.setattr(database.time, 'sleep', lambda seconds: None)
+    written, calls = [], []
+
+    def write(records):
+        calls.append(list(records))
+        if len(calls) == 1:
+            raise sqlite3.OperationalError('database is locked')
+        written.extend(records)
+
+    writer = DatabaseWriter(write, batch_size=10)
+    for record in range(5):
+        writer.put(record)
+    writer.flush()
+    assert sorted(written) == list(range(5))
+
+
+def test_writer_drops_only_the_failing_record(capsys):
+    gate = threading.Event()
+    written = []
+
+    def write(records):
+        gate.wait()
+        if 'bad' in records:
+            raise ValueError('unsupported value')
+        written.extend(records)
+
+    writer = DatabaseWriter(write, batch_size=10)
+    for record in ('a', 'bad', 'b'):
+        writer.put(record)
+    gate.set()
+    writer.flush()
+
+    assert sorted(written) == ['a', 'b']
+    assert "queued record 'bad', dropping it" in capsys.readouterr().out
+
+
+def test_full_queue_blocks_producers_until_the_writer_catches_up():
+    gate = threading.Event()
+    written = []
+
+    def write(records):
+        gate.wait()
+        written.extend(records)
+
+    writer = DatabaseWriter(write, max_size=2, batch_size=1)
+    for record in range(3):
+        writer.put(record)  # the writer holds one, the queue the other two
+    producer = threading.Thread(target=writer.put, args=(3,))
+    producer.start()
+    producer.join(0.1)
+    assert producer.is_alive()
+
+    gate.set()
+    producer.join(1)
+    writer.flush()
+    assert written == [0, 1, 2, 3]
+
+
+def test_event_codecs_round_trip():
+    data = {'norad_id': 25544, 'time': datetime(2026, 8, 12, 22, 0), 'track': list(range(100)), 'name': 'ISS'}
+    for codec in ('msgpack', 'json'):
+        assert decode_payload(encode_payload(data, codec)) == data
+    assert encode_payload(data)[:1] == b'm'
+    assert decode_payload('{"zhr": 100}') == {'zhr': 100}  # JSON text of older versions
@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+from src.benchmark import stub_detector, stub_ephemeris, stub_launches
+from src.source_cache import source_cache
+
+
+@pytest.fixture
+def detector(tmp_path):
+    stub_ephemeris(str(tmp_path))
+    source_cache.invalidate()
+    detector = stub_detector(str(tmp_path))
+    # An expired launch schedule, whose revalidation is still running while the scan reads it
+    launches = stub_launches()
+    source_cache.put('launches', launches, fetched_at=time.time() - 2 * source_cache.ttls['launches'])
+    released = threading.Event()
+    detector.fetch_rocket_launches = lambda: released.wait(5) and launches
+    yield detector
+    released.set()
+    source_cache.stop_refresher()
+    while source_cache.snapshot('launches')['refreshing']:
+        time.sleep(0.05)
+    source_cache.invalidate()
+
+
+def test_events_carry_the_age_of_their_snapshot(detector):
+    events = detector.get_all_events('bangalore', concurrent=False)
+
+    launches = [event for event in events if event['source'] == 'The Space Devs API']
+    assert launches and all(event['stale'] and event['source_age'] > 1800 for event in launches)
+    showers = [event for event in events if 'zhr' in event]
+    assert showers and all(not event['stale'] and event['source_age'] < 60 for event in showers)
+
+
+def test_batched_events_carry_the_age_of_their_snapshot(detector):
+    events = detector.get_events_for_locations(['bangalore', 'london'])
+
+    launches = events[events['kind'] == 'launch']
+    assert len(launches) and launches['stale'].all() and (launches['source_age'] > 1800).all()
+    assert all(row['details']['stale'] for _, row in launches.iterrows())
+    aurora = events[events['kind'] == 'aurora']
+    assert len(aurora) == 2 and not aurora['stale'].any()
+
+
+def test_first_scan_starts_the_refresher_and_waits_for_cold_sources(detector):
+    assert not source_cache.background
+    events = detector.get_all_events('bangalore')
+
+    assert source_cache.background
+    # The aurora grid had never loaded, yet the scan served it rather than the seasonal estimate
+    assert [event['source'] for event in events if 'Aurora' in event['event']] == ['NOAA Space Weather']
+
+
+def test_cold_source_is_fetched_once_while_the_refresher_runs(detector):
+    calls = []
+
+    def loader():
+        calls.append(time.time())
+        time.sleep(0.2)
+        return ['grid']
+
+    source_cache.register('cold', loader)
+    source_cache.start_refresher(interval=0.05)
+    time.sleep(0.1)
+    assert source_cache.get('cold', loader) == ['grid']
+    time.sleep(0.3)
+    assert len(calls) == 1
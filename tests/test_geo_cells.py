@@ -0,0 +1,47 @@
+import pytest
+
+from src.geo_cells import bounds, cell_location, cell_of, center, encode, resolve_location
+
+
+def test_encode_matches_reference_geohashes():
+    assert encode(57.64911, 10.40744, 11) == 'u4pruydqqvj'
+    assert encode(42.6, -5.6, 5) == 'ezs42'
+    assert encode(-90, -180, 3) == '000'
+
+
+def test_cell_bounds_contain_the_point():
+    lat, lon = 51.5074, -0.1278
+    for precision in range(1, 8):
+        min_lat, min_lon, max_lat, max_lon = bounds(encode(lat, lon, precision))
+        assert min_lat <= lat < max_lat
+        assert min_lon <= lon < max_lon
+
+
+def test_center_encodes_back_to_its_cell():
+    cell = encode(35.6762, 139.6503)
+    assert encode(*center(cell), len(cell)) == cell
+    assert cell_location(cell)['cell'] == cell
+
+
+def test_cell_of_reuses_a_stored_cell_of_the_same_precision():
+    location = {'lat': 51.5074, 'lon': -0.1278, 'cell': 'zzzz'}
+    assert cell_of(location, 4) == 'zzzz'
+    assert cell_of(location, 5) == encode(51.5074, -0.1278, 5)
+
+
+@pytest.mark.parametrize('location', ['bangalore', '12.9716,77.5946', (12.9716, 77.5946),
+                                      {'name': 'Bangalore, India', 'lat': 12.9716, 'lon': 77.5946}])
+def test_resolve_location_accepts_every_form(location):
+    resolved = resolve_location(location)
+    assert (resolved['lat'], resolved['lon']) == (12.9716, 77.5946)
+    assert resolved['cell'] == encode(12.9716, 77.5946)
+
+
+def test_resolve_location_names_coordinates():
+    assert resolve_location('10,20')['name'] == '10.0000, 20.0000'
+
+
+@pytest.mark.parametrize('location', ['atlantis', '91,0', (0, 181), {'name': 'Nowhere'}, None])
+def test_resolve_location_rejects_unknown_or_invalid_locations(location):
+    with pytest.raises(ValueError):
+        resolve_location(location)
@@ -0,0 +1,112 @@
+import json
+import os
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.http_client import HttpClient
+from src.source_recorder import SourceArchive
+
+
+class FakeSession:
+    """Stands in for requests.Session, answering from a list of (status, headers, body)"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        status_code, response_headers, content = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(response_headers)
+        response._content = content
+        response.url = url
+        return response
+
+
+def client_with(tmp_path, responses):
+    client = HttpClient(cache_dir=str(tmp_path / 'cache'), mode='live')
+    client.session = FakeSession(responses)
+    return client
+
+
+def test_stale_entry_is_revalidated_with_its_etag(tmp_path):
+    client = client_with(tmp_path, [(200, {'ETag': '"v1"', 'Cache-Control': 'max-age=0'}, b'grid'),
+                                    (304, {'Cache-Control': 'max-age=300'}, b'')])
+    assert client.get('https://example.test/grid').content == b'grid'
+    response = client.get('https://example.test/grid')
+
+    assert response.content == b'grid' and response.from_cache
+    assert client.session.requests[1] == {'If-None-Match': '"v1"'}
+    # Fresh now, so the next call never reaches the session
+    assert client.get('https://example.test/grid').content == b'grid'
+
+
+def test_not_modified_for_an_evicted_body_refetches_it(tmp_path, monkeypatch):
+    client = client_with(tmp_path, [(200, {'ETag': '"v1"'}, b'old'), (304, {}, b''), (200, {'ETag': '"v2"'}, b'new')])
+    client.get('https://example.test/grid')
+    meta_path, body_path = client._cache_paths('https://example.test/grid', None)
+
+    # The body disappears between the existence check and the 304
+    original_get = client.session.get
+
+    def evicting_get(*args, **kwargs):
+        if os.path.exists(body_path):
+            os.remove(body_path)
+        return original_get(*args, **kwargs)
+
+    monkeypatch.setattr(client.session, 'get', evicting_get)
+    response = client.get('https://example.test/grid')
+
+    assert response.content == b'new'
+    assert client.session.requests[1] == {'If-None-Match': '"v1"'}
+    assert client.session.requests[2] == {}
+    assert client._load_meta(meta_path)['headers']['ETag'] == '"v2"'
+
+
+def test_validators_match_whatever_case_the_server_sends(tmp_path):
+    client = client_with(tmp_path, [(200, {'etag': '"v1"', 'cache-control': 'max-age=0',
+                                           'content-type': 'application/json'}, b'{}'),
+                                    (304, {'etag': '"v1"'}, b'')])
+    response = client.get('https://example.test/feed')
+    assert response.headers['ETag'] == '"v1"' and response.headers['content-type'] == 'application/json'
+
+    client.get('https://example.test/feed')
+    assert client.session.requests[1] == {'If-None-Match': '"v1"'}
+
+
+def test_meta_written_with_lowercase_names_still_revalidates(tmp_path):
+    client = client_with(tmp_path, [(200, {'ETag': '"v1"', 'Cache-Control': 'max-age=0'}, b'body'),
+                                    (304, {}, b'')])
+    client.get('https://example.test/feed')
+    meta_path, _ = client._cache_paths('https://example.test/feed', None)
+    with open(meta_path) as f:
+        meta = json.load(f)
+    meta['headers'] = {'etag': '"v1"', 'cache-control': 'max-age=0'}
+    with open(meta_path, 'w') as f:
+        json.dump(meta, f)
+
+    assert client.get('https://example.test/feed').from_cache
+    assert client.session.requests[1] == {'If-None-Match': '"v1"'}
+
+
+def test_recorded_headers_keep_canonical_names(tmp_path):
+    archive = SourceArchive(str(tmp_path / 'archive.jsonl.gz'))
+    archive.record('https://example.test/feed', None, 200,
+                   CaseInsensitiveDict({'etag': '"v1"', 'X-Other': '1'}), b'{}', 0.1)
+    archive.load()
+
+    _, headers, _ = archive.replay('https://example.test/feed', speed=0)
+    assert headers == {'ETag': '"v1"'}
+
+
+def test_cache_directory_is_created_on_first_store(tmp_path):
+    client = client_with(tmp_path, [(200, {'Cache-Control': 'max-age=60'}, b'body')])
+    cache_dir = tmp_path / 'cache'
+    assert not cache_dir.exists()
+    client.clear()
+
+    client.get('https://example.test/feed')
+    assert cache_dir.is_dir()
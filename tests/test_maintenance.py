@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+
+
+def rollups(db):
+    with db.pool.connection() as conn:
+        return conn.execute('''
+            SELECT day, location, kind, events, max_zhr FROM event_rollups ORDER BY day, location, kind
+        ''').fetchall()
+
+
+def test_maintain_rolls_up_events_past_retention(db):
+    now = datetime.now()
+    old = (now - timedelta(days=40)).replace(hour=12, minute=0, second=0, microsecond=0)
+    db.log_events([
+        ('Meteor Shower: Perseids', {'zhr': 50}, 'london', old),
+        ('Meteor Shower: Orionids', {'zhr': 80}, 'london', old + timedelta(hours=1)),
+        ('Meteor Shower: Perseids', {'zhr': 60}, 'london', old + timedelta(days=5)),
+        ('Meteor Shower: Perseids', {'zhr': 70}, 'london', now),
+    ])
+
+    summary = db.maintain(now=now, event_days=30, budget_mb=1024)
+
+    assert summary['rolled_up_days'] == 2
+    assert summary['events_removed'] == 3
+    assert rollups(db) == [
+        (f"{old:%Y-%m-%d}", 'london', 'meteor', 2, 80.0),
+        (f"{old + timedelta(days=5):%Y-%m-%d}", 'london', 'meteor', 1, 60.0),
+    ]
+    events, _ = db.query_events()
+    assert [event['data'] for event in events] == [{'zhr': 70}]
+
+
+def test_rolling_up_a_day_again_adds_to_its_rollup(db):
+    now = datetime.now()
+    old = (now - timedelta(days=40)).replace(hour=12, minute=0, second=0, microsecond=0)
+    db.log_event('Meteor Shower: Perseids', {'zhr': 50}, 'london', old)
+    db.maintain(now=now, event_days=30, budget_mb=1024)
+    # A late event for a day that was already rolled up
+    db.log_event('Meteor Shower: Orionids', {'zhr': 20}, 'london', old)
+    db.maintain(now=now, event_days=30, budget_mb=1024)
+
+    assert rollups(db) == [(f"{old:%Y-%m-%d}", 'london', 'meteor', 2, 50.0)]
+
+
+def test_over_budget_never_rolls_up_today(db):
+    now = datetime.now()
+    yesterday = now - timedelta(days=1)
+    db.log_events([
+        ('Eclipse', {'n': 1}, 'london', yesterday),
+        ('Eclipse', {'n': 2}, 'london', now),
+    ])
+
+    summary = db.maintain(now=now, event_days=30, budget_mb=0)
+
+    assert summary['rolled_up_days'] == 1
+    assert rollups(db) == [(f"{yesterday:%Y-%m-%d}", 'london', 'event', 1, None)]
+    events, _ = db.query_events()
+    assert [event['data'] for event in events] == [{'n': 2}]
+
+
+def test_alerts_of_rolled_up_events_are_unlinked(db):
+    now = datetime.now()
+    old = now - timedelta(days=40)
+    db.log_event('Eclipse', {'n': 1}, 'london', old)
+    db.log_alert('Eclipse', {'n': 1}, 'london', old, user_id=1)
+
+    db.maintain(now=now, event_days=30, alert_days=90, budget_mb=1024)
+
+    with db.pool.connection() as conn:
+        alerts = conn.execute('SELECT user_id, event_id FROM alerts').fetchall()
+    assert alerts == [(1, None)]
+
+
+def test_unreadable_event_times_do_not_stop_maintenance(db):
+    now = datetime.now()
+    old = now - timedelta(days=40)
+    db.log_event('Eclipse', {'n': 1}, 'london', old)
+    with db.pool.connection(write=True) as conn:
+        conn.execute('''
+            INSERT INTO events (event_type, event_data, location, event_time)
+            VALUES ('Eclipse', x'00', 'london', ?), ('Eclipse', x'00', 'london', 'someday')
+        ''', (old.timestamp(),))
+
+    summary = db.maintain(now=now, event_days=30, budget_mb=1024)
+
+    assert summary['events_removed'] == 1
+    assert rollups(db) == [(f"{old:%Y-%m-%d}", 'london', 'event', 1, None)]
+
+
+def test_query_rollups_filters_by_day_location_and_kind(db):
+    now = datetime.now()
+    start = (now - timedelta(days=60)).replace(hour=12, minute=0, second=0, microsecond=0)
+    db.log_events([
+        ('Meteor Shower: Perseids', {'zhr': 10 * n}, 'london' if n % 2 else 'paris', start + timedelta(days=n))
+        for n in range(1, 6)
+    ] + [('Aurora Forecast', {'kp_index': 6}, 'london', start + timedelta(days=1))])
+    db.maintain(now=now, event_days=30, budget_mb=1024)
+
+    day = lambda n: f"{start + timedelta(days=n):%Y-%m-%d}"
+    london = db.query_rollups(location='london', kind='meteor')
+    assert [(r['day'], r['events'], r['max_zhr']) for r in london] == [(day(1), 1, 10.0), (day(3), 1, 30.0),
+                                                                        (day(5), 1, 50.0)]
+    ranged = db.query_rollups(start=start + timedelta(days=2), end=day(4))
+    assert [(r['day'], r['location']) for r in ranged] == [(day(2), 'paris'), (day(3), 'london')]
+    aurora = db.query_rollups(kind=['aurora'])
+    assert [(r['day'], r['max_kp']) for r in aurora] == [(day(1), 6.0)]
@@ -0,0 +1,39 @@
+import time
+from datetime import timedelta
+
+import pytest
+
+from src.benchmark import stub_ephemeris
+from src.geo_cells import cell_of
+from src.global_locations import GLOBAL_LOCATIONS
+from src.observability import ObservabilityFilter, utc_date
+
+
+@pytest.fixture(autouse=True)
+def ephemeris(tmp_path):
+    stub_ephemeris(str(tmp_path))
+
+
+def test_cache_keeps_only_the_most_recently_used_windows():
+    observability = ObservabilityFilter(days=1, max_entries=len(GLOBAL_LOCATIONS) + 5)
+    today = utc_date(time.time())
+    places = [{'lat': 60.0 + i, 'lon': 10.0} for i in range(10)]
+
+    # Each ad-hoc place adds a cell next to the known cities, which every computation refreshes
+    for place in places:
+        observability.windows(place, today)
+        assert len(observability._windows) <= observability.max_entries
+
+    cached = {key[0] for key in observability._windows}
+    assert cell_of(places[-1]) in cached and cell_of(places[0]) not in cached
+    assert cell_of(GLOBAL_LOCATIONS['bangalore']) in cached
+
+
+def test_past_dates_are_dropped_when_windows_are_computed():
+    observability = ObservabilityFilter(days=1)
+    today = utc_date(time.time())
+    bangalore = GLOBAL_LOCATIONS['bangalore']
+
+    observability.windows(bangalore, today - timedelta(days=2))
+    observability.windows(bangalore, today + timedelta(days=1))
+    assert {key[1] for key in observability._windows} == {today + timedelta(days=1)}
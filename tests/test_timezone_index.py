@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.timezone_index import TimezoneIndex, offset_zone
+
+NEW_YORK = {'name': 'New York', 'lat': 40.7128, 'lon': -74.006, 'timezone': 'America/New_York'}
+
+
+def test_to_local_and_to_utc_round_trip(tmp_path):
+    index = TimezoneIndex(str(tmp_path / 'zones.json'))
+    epochs = np.array([1784000000.0, 1800000000.0])  # July 2026, January 2027
+    local = index.to_local(epochs, NEW_YORK)
+    assert [time.utcoffset().total_seconds() / 3600 for time in local] == [-4, -5]
+    assert np.array_equal(index.to_utc(local.tz_localize(None), NEW_YORK), epochs)
+
+
+def test_to_utc_resolves_dst_edges(tmp_path):
+    index = TimezoneIndex(str(tmp_path / 'zones.json'))
+    ambiguous, skipped = index.to_utc(['2026-11-01 01:30', '2026-03-08 02:30'], NEW_YORK)
+    # The first 1:30, still on EDT, and 2:30 moved to 3:00 EDT
+    assert datetime.fromtimestamp(ambiguous, timezone.utc) == datetime(2026, 11, 1, 5, 30, tzinfo=timezone.utc)
+    assert datetime.fromtimestamp(skipped, timezone.utc) == datetime(2026, 3, 8, 7, 0, tzinfo=timezone.utc)
+
+
+def test_localize_events_matches_to_local(tmp_path):
+    index = TimezoneIndex(str(tmp_path / 'zones.json'))
+    events = [{'time': datetime.fromtimestamp(1784000000 + hour * 3600)} for hour in range(5)] + [{'peak': None}]
+    index.localize_events(events, NEW_YORK)
+    assert [event['local_time'] for event in events[:5]] == list(index.to_local(
+        [1784000000 + hour * 3600 for hour in range(5)], NEW_YORK))
+    assert all(event['timezone'] == 'America/New_York' for event in events[:5])
+    assert 'local_time' not in events[5]
+
+
+def test_offset_zone_inverts_the_etc_sign():
+    assert offset_zone(77.6) == 'Etc/GMT-5'
+    assert offset_zone(-74.0) == 'Etc/GMT+5'
+    assert offset_zone(3.0) == 'UTC'